@@ -66,6 +66,14 @@ def include_object(object, name, type_, reflected, compare_to):
     if type_ == "table" and name.startswith("apscheduler_"):
         return False
 
+    # Riot API rate limit state is managed by the rate limit backend
+    if type_ == "table" and name.startswith("rate_limit_"):
+        return False
+
+    # Negative cache of Riot API 404s is managed by the Riot API client
+    if type_ == "table" and name == "riot_not_found":
+        return False
+
     # Exclude objects marked with skip_autogenerate
     if type_ == "table" and object.info.get("skip_autogenerate", False):
         return False
@@ -0,0 +1,103 @@
+"""Add rate limit tables for the shared Riot API rate limiter
+
+Revision ID: 575d10870bd5
+Revises: 2438ef1ce370
+Create Date: 2026-10-16 10:12:41.318204
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "575d10870bd5"
+down_revision: Union[str, Sequence[str], None] = "2438ef1ce370"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Create tables used by the postgres rate limit backend.
+
+    Both tables only hold short-lived state that is rebuilt from Riot
+    response headers, so they are UNLOGGED to skip WAL writes on every
+    request. Their contents are lost after a crash, which is harmless.
+    """
+    op.create_table(
+        "rate_limit_windows",
+        sa.Column(
+            "bucket_key",
+            sa.String(length=255),
+            nullable=False,
+            comment="API key namespace, routing value and rate limit scope",
+        ),
+        sa.Column(
+            "window_seconds",
+            sa.Integer(),
+            nullable=False,
+            comment="Length of the declared window in seconds",
+        ),
+        sa.Column(
+            "max_requests",
+            sa.Integer(),
+            nullable=False,
+            comment="Requests allowed inside the window",
+        ),
+        sa.PrimaryKeyConstraint("bucket_key", "window_seconds"),
+        schema="core",
+        prefixes=["UNLOGGED"],
+        comment="Rate limit windows declared by Riot API response headers",
+    )
+    op.create_table(
+        "rate_limit_permits",
+        sa.Column(
+            "id",
+            sa.BigInteger(),
+            autoincrement=True,
+            nullable=False,
+            comment="Auto-incrementing primary key",
+        ),
+        sa.Column(
+            "bucket_key",
+            sa.String(length=255),
+            nullable=False,
+            comment="Bucket the permit counts against",
+        ),
+        sa.Column(
+            "window_seconds",
+            sa.Integer(),
+            nullable=False,
+            comment="Window the permit counts against (0 for request spacing)",
+        ),
+        sa.Column(
+            "issued_at",
+            sa.Float(precision=53),
+            nullable=False,
+            comment="Epoch seconds the permit was issued at",
+        ),
+        sa.PrimaryKeyConstraint("id"),
+        schema="core",
+        prefixes=["UNLOGGED"],
+        comment="Permits issued by the shared Riot API rate limiter",
+    )
+    op.create_index(
+        "ix_rate_limit_permits_bucket_window_issued",
+        "rate_limit_permits",
+        ["bucket_key", "window_seconds", "issued_at"],
+        unique=False,
+        schema="core",
+    )
+
+
+def downgrade() -> None:
+    """Drop rate limit tables."""
+    op.drop_index(
+        "ix_rate_limit_permits_bucket_window_issued",
+        table_name="rate_limit_permits",
+        schema="core",
+    )
+    op.drop_table("rate_limit_permits", schema="core")
+    op.drop_table("rate_limit_windows", schema="core")
@@ -0,0 +1,54 @@
+"""Add rate limit snapshots table
+
+Revision ID: 9c1e4b7a2d63
+Revises: 575d10870bd5
+Create Date: 2026-10-16 11:03:27.904512
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = "9c1e4b7a2d63"
+down_revision: Union[str, Sequence[str], None] = "575d10870bd5"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Create table holding rate limiter state across restarts."""
+    op.create_table(
+        "rate_limit_snapshots",
+        sa.Column(
+            "namespace",
+            sa.String(length=64),
+            nullable=False,
+            comment="Identifier of the API key the state belongs to",
+        ),
+        sa.Column(
+            "state",
+            postgresql.JSONB(astext_type=sa.Text()),
+            nullable=False,
+            comment="Serialized rate limit windows per routing value",
+        ),
+        sa.Column(
+            "saved_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+            comment="When the snapshot was taken",
+        ),
+        sa.PrimaryKeyConstraint("namespace"),
+        schema="core",
+        comment="Rate limiter state restored after restarts",
+    )
+
+
+def downgrade() -> None:
+    """Drop rate limit snapshots table."""
+    op.drop_table("rate_limit_snapshots", schema="core")
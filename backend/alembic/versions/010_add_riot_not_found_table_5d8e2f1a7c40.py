@@ -0,0 +1,63 @@
+"""Add riot not found table
+
+Revision ID: 5d8e2f1a7c40
+Revises: 9c1e4b7a2d63
+Create Date: 2026-10-16 20:02:11.418305
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "5d8e2f1a7c40"
+down_revision: Union[str, Sequence[str], None] = "9c1e4b7a2d63"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Create table remembering Riot API 404s across restarts."""
+    op.create_table(
+        "riot_not_found",
+        sa.Column(
+            "url",
+            sa.String(length=512),
+            nullable=False,
+            comment="Riot API URL that returned 404",
+        ),
+        sa.Column(
+            "expires_at",
+            sa.DateTime(timezone=True),
+            nullable=False,
+            comment="When the URL may be requested again",
+        ),
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+            comment="When the 404 was first recorded",
+        ),
+        sa.PrimaryKeyConstraint("url"),
+        schema="core",
+        comment="Negative cache of Riot API accounts, summoners and matches",
+    )
+    op.create_index(
+        "idx_riot_not_found_expires_at",
+        "riot_not_found",
+        ["expires_at"],
+        unique=False,
+        schema="core",
+    )
+
+
+def downgrade() -> None:
+    """Drop riot not found table."""
+    op.drop_index(
+        "idx_riot_not_found_expires_at", table_name="riot_not_found", schema="core"
+    )
+    op.drop_table("riot_not_found", schema="core")
@@ -0,0 +1,66 @@
+"""Add player refresh timestamps
+
+Revision ID: 8b3f6d2e9a17
+Revises: 5d8e2f1a7c40
+Create Date: 2026-10-16 20:14:52.207631
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "8b3f6d2e9a17"
+down_revision: Union[str, Sequence[str], None] = "5d8e2f1a7c40"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Add per-source freshness timestamps to players."""
+    op.add_column(
+        "players",
+        sa.Column(
+            "riot_id_refreshed_at",
+            sa.DateTime(timezone=True),
+            nullable=True,
+            comment="When riot_id and tag_line were last fetched from account-v1",
+        ),
+        schema="core",
+    )
+    op.add_column(
+        "players",
+        sa.Column(
+            "profile_refreshed_at",
+            sa.DateTime(timezone=True),
+            nullable=True,
+            comment=(
+                "When account_level, profile_icon_id and summoner_id were last "
+                "fetched from summoner-v4"
+            ),
+        ),
+        schema="core",
+    )
+
+    # Existing rows were fetched when last updated; placeholders created for
+    # match participants have no Riot ID or profile yet and stay NULL
+    op.execute(
+        """
+        UPDATE core.players
+           SET riot_id_refreshed_at = CASE
+                   WHEN riot_id IS NOT NULL THEN updated_at
+               END,
+               profile_refreshed_at = CASE
+                   WHEN account_level IS NOT NULL THEN updated_at
+               END
+        """
+    )
+
+
+def downgrade() -> None:
+    """Drop player freshness timestamps."""
+    op.drop_column("players", "profile_refreshed_at", schema="core")
+    op.drop_column("players", "riot_id_refreshed_at", schema="core")
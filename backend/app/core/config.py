@@ -6,7 +6,7 @@ import os
 from pydantic import Field, field_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
 from dotenv import load_dotenv
-from typing import List, TYPE_CHECKING
+from typing import List, Literal, TYPE_CHECKING
 
 if TYPE_CHECKING:
     from sqlalchemy.ext.asyncio import AsyncSession
@@ -50,6 +50,169 @@ class Settings(BaseSettings):
         env = os.getenv("ENVIRONMENT", "").lower()
         return env if env in ["dev", "production"] else "dev"  # Safe default
 
+    # Riot API Rate Limit Coordination
+    riot_rate_limit_backend: Literal["memory", "shared_memory", "postgres"] = Field(
+        default="memory",
+        description=(
+            "Where Riot API rate limit state is kept: per process (memory), "
+            "shared by all processes on the host (shared_memory) or shared "
+            "through the database (postgres)"
+        ),
+    )
+    riot_rate_limit_shm_dir: str = Field(
+        default="/dev/shm",
+        description="Directory of the state files used by the shared_memory backend",
+    )
+    riot_rate_limit_snapshot_interval: float = Field(
+        default=30.0,
+        description=(
+            "Seconds between snapshots of Riot API rate limit state, restored "
+            "after restarts (0 saves on shutdown only)"
+        ),
+    )
+
+    riot_rate_limit_interactive_reserve: float = Field(
+        default=0.1,
+        ge=0.0,
+        lt=1.0,
+        description=(
+            "Fraction of every Riot API rate limit window kept free for "
+            "interactive calls (0 disables the reserve)"
+        ),
+    )
+
+    # Riot API HTTP Connection Pool
+    riot_http_max_connections: int = Field(
+        default=20, description="Maximum open connections to Riot API hosts"
+    )
+    riot_http_max_keepalive_connections: int = Field(
+        default=10, description="Maximum idle connections kept alive for reuse"
+    )
+    riot_http_keepalive_expiry: float = Field(
+        default=60.0, description="Seconds an idle connection is kept alive"
+    )
+    riot_http2: bool = Field(
+        default=False,
+        description="Multiplex requests over HTTP/2 (requires the h2 package)",
+    )
+    riot_api_base_url: str | None = Field(
+        default=None,
+        description=(
+            "Send Riot API requests to this server instead, e.g. "
+            "http://127.0.0.1:8081 for the fake Riot API (development only)"
+        ),
+    )
+    riot_cassette_mode: Literal["off", "record", "replay"] = Field(
+        default="off",
+        description=(
+            "Record Riot API responses to a cassette file, or replay them "
+            "instead of calling the API (for offline profiling)"
+        ),
+    )
+    riot_cassette_path: str = Field(
+        default="riot_api_cassette.jsonl.gz",
+        description="Cassette file recorded to or replayed from",
+    )
+    riot_cassette_timing_scale: float = Field(
+        default=1.0,
+        ge=0.0,
+        description=(
+            "Factor applied to recorded latencies on replay (0 replays as fast "
+            "as possible)"
+        ),
+    )
+    riot_bulk_fetch_concurrency: int | None = Field(
+        default=None,
+        ge=1,
+        description=(
+            "Requests RiotAPIClient.get_matches keeps in flight at once (the "
+            "rate limiter still paces them); sized from the API key's limits "
+            "and observed latency if unset"
+        ),
+    )
+    riot_not_found_ttl: float = Field(
+        default=6 * 3600,
+        ge=0.0,
+        description=(
+            "Seconds a 404 of an account, summoner or match is remembered and "
+            "answered without calling the Riot API (0 disables)"
+        ),
+    )
+    riot_not_found_riot_id_ttl: float = Field(
+        default=300.0,
+        ge=0.0,
+        description=(
+            "Seconds a 404 of an account looked up by Riot ID is remembered "
+            "(short: the account may be created or renamed soon; at most "
+            "RIOT_NOT_FOUND_TTL, 0 never remembers it)"
+        ),
+    )
+    riot_not_found_cache_size: int = Field(
+        default=50_000,
+        ge=1,
+        description="Remembered 404s kept in memory per process",
+    )
+    riot_circuit_failure_ratio: float = Field(
+        default=0.5,
+        gt=0.0,
+        le=1.0,
+        description=(
+            "Share of failed (5xx, timeout) recent requests to a Riot API route "
+            "that opens its circuit breaker"
+        ),
+    )
+    riot_circuit_min_requests: int = Field(
+        default=10,
+        ge=1,
+        description="Recent requests needed before a circuit breaker can open",
+    )
+    riot_circuit_window: int = Field(
+        default=20,
+        ge=1,
+        description="Number of recent requests a circuit breaker looks at",
+    )
+    riot_circuit_open_seconds: float = Field(
+        default=30.0,
+        ge=0.0,
+        description="Seconds an open circuit fails fast before sending a probe",
+    )
+
+    # Metrics endpoint
+    metrics_enabled: bool = Field(
+        default=False,
+        description="Serve Riot API client and cache metrics at GET /metrics",
+    )
+    metrics_token: str | None = Field(
+        default=None,
+        description=(
+            "Bearer token scrapers must send to GET /metrics (no token needed "
+            "if unset, e.g. when only reachable from the internal network)"
+        ),
+    )
+
+    # Player lookup cache
+    player_cache_size: int = Field(
+        default=4096,
+        ge=0,
+        description="Players kept in the in-process lookup cache (0 disables it)",
+    )
+    player_cache_ttl: float = Field(
+        default=60.0,
+        gt=0.0,
+        description=(
+            "Seconds a cached player is served before it is read from the "
+            "database again (bounds staleness across workers)"
+        ),
+    )
+    player_refresh_max_age: float = Field(
+        default=24 * 3600,
+        ge=0.0,
+        description=(
+            "Age in seconds after which a player's Riot ID and profile are "
+            "refreshed in the background when read (0 disables)"
+        ),
+    )
+
     # JWT Authentication Configuration
     jwt_secret_key: str = Field(
         default="dev_secret_key_please_change_in_production",
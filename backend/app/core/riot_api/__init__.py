@@ -5,9 +5,11 @@ This package provides a comprehensive HTTP client for interacting with the Riot
 including proper rate limiting, error handling, and authentication.
 """
 
-from .client import RiotAPIClient
+from .client import RiotAPIClient, request_priority, track_api_requests
+from .registry import RiotClientRegistry, riot_client_registry
 from .data_manager import RiotDataManager
-from .rate_limiter import RateLimiter
+from .rate_limiter import ApiKeyLimits, RateLimiter
+from .rate_planner import RatePlan
 from .errors import (
     RiotAPIError,
     RateLimitError,
@@ -16,7 +18,10 @@ from .errors import (
     NotFoundError,
     BadRequestError,
     ServiceUnavailableError,
+    CircuitOpenError,
 )
+from .circuit_breaker import CircuitBreaker, CircuitState
+from .metrics import RiotAPIMetrics, riot_api_metrics, render_prometheus
 from .models import (
     AccountDTO,
     SummonerDTO,
@@ -25,11 +30,18 @@ from .models import (
     LeagueEntryDTO,
 )
 from .endpoints import RiotAPIEndpoints
+from .constants import ApiKeyTier, RateLimitScope, RequestPriority
 
 __all__ = [
     "RiotAPIClient",
+    "request_priority",
+    "track_api_requests",
+    "RiotClientRegistry",
+    "riot_client_registry",
     "RiotDataManager",
     "RateLimiter",
+    "RatePlan",
+    "ApiKeyLimits",
     "RiotAPIError",
     "RateLimitError",
     "AuthenticationError",
@@ -37,10 +49,19 @@ __all__ = [
     "NotFoundError",
     "BadRequestError",
     "ServiceUnavailableError",
+    "CircuitOpenError",
+    "CircuitBreaker",
+    "CircuitState",
+    "RiotAPIMetrics",
+    "riot_api_metrics",
+    "render_prometheus",
     "AccountDTO",
     "SummonerDTO",
     "MatchListDTO",
     "MatchDTO",
     "LeagueEntryDTO",
     "RiotAPIEndpoints",
+    "RequestPriority",
+    "RateLimitScope",
+    "ApiKeyTier",
 ]
@@ -0,0 +1,160 @@
+"""Circuit breakers failing fast on degraded Riot API routes."""
+
+import time
+from collections import deque
+from enum import Enum
+from typing import Any, Deque, Dict, Optional
+
+import structlog
+
+from .errors import CircuitOpenError
+
+logger = structlog.get_logger(__name__)
+
+
+class CircuitState(str, Enum):
+    """State of a circuit breaker."""
+
+    CLOSED = "closed"  # requests flow, outcomes are tracked
+    OPEN = "open"  # requests fail fast until the probe time
+    HALF_OPEN = "half_open"  # a single probe decides whether to close again
+
+
+class CircuitBreaker:
+    """Circuit breaker of one route template.
+
+    Tracks the outcome of the last `window` requests. Once at least
+    `min_requests` are known and the share of failures reaches
+    `failure_ratio`, the circuit opens and requests fail without being sent.
+    After `open_seconds` one probe request is let through: success closes the
+    circuit, failure opens it for another `open_seconds`.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        failure_ratio: float = 0.5,
+        min_requests: int = 10,
+        window: int = 20,
+        open_seconds: float = 30.0,
+    ):
+        """
+        Initialize circuit breaker.
+
+        Args:
+            name: Route the breaker protects (used in logs and errors)
+            failure_ratio: Share of failures that opens the circuit
+            min_requests: Outcomes needed before the circuit can open
+            window: Number of recent outcomes considered
+            open_seconds: Seconds between opening and the next probe
+        """
+        self.name = name
+        self.failure_ratio = failure_ratio
+        self.min_requests = min(min_requests, window)
+        self.open_seconds = open_seconds
+        self.state = CircuitState.CLOSED
+        self.outcomes: Deque[bool] = deque(maxlen=window)
+        self.opened_at = 0.0
+        self.times_opened = 0
+        # Start of the probe in flight, 0.0 when there is none
+        self._probe_started = 0.0
+
+    def retry_in(self, now: Optional[float] = None) -> float:
+        """Return seconds until an open circuit lets a probe through."""
+        if self.state != CircuitState.OPEN:
+            return 0.0
+        now = time.monotonic() if now is None else now
+        return max(0.0, self.opened_at + self.open_seconds - now)
+
+    def is_open(self, now: Optional[float] = None) -> bool:
+        """Return whether a request would currently fail fast."""
+        now = time.monotonic() if now is None else now
+        if self.state == CircuitState.OPEN:
+            return self.retry_in(now) > 0
+        if self.state == CircuitState.HALF_OPEN:
+            return not self._probe_expired(now)
+        return False
+
+    def before_request(self) -> None:
+        """
+        Let a request through or fail fast.
+
+        Raises:
+            CircuitOpenError: While the circuit is open or a probe is running
+        """
+        now = time.monotonic()
+        if self.state == CircuitState.OPEN:
+            if self.retry_in(now) > 0:
+                raise self._error(now)
+            self.state = CircuitState.HALF_OPEN
+            self._probe_started = 0.0
+
+        if self.state == CircuitState.HALF_OPEN:
+            # A probe that never reported back (e.g. cancelled) is replaced
+            if not self._probe_expired(now):
+                raise self._error(now)
+            self._probe_started = now
+            logger.info("Circuit half-open, sending probe", route=self.name)
+
+    def record_success(self) -> None:
+        """Record a request the route handled (any non-failure response)."""
+        if self.state == CircuitState.HALF_OPEN:
+            self.state = CircuitState.CLOSED
+            self.outcomes.clear()
+            self._probe_started = 0.0
+            logger.info("Circuit closed, route recovered", route=self.name)
+            return
+        self.outcomes.append(True)
+
+    def record_failure(self) -> None:
+        """Record a request that failed because the route is degraded."""
+        if self.state == CircuitState.HALF_OPEN:
+            self._open()
+            return
+
+        self.outcomes.append(False)
+        if (
+            self.state == CircuitState.CLOSED
+            and len(self.outcomes) >= self.min_requests
+        ):
+            failures = self.outcomes.count(False)
+            if failures / len(self.outcomes) >= self.failure_ratio:
+                self._open()
+
+    def stats(self) -> Dict[str, Any]:
+        """Return state, recent failure share and time until the next probe."""
+        total = len(self.outcomes)
+        return {
+            "state": self.state.value,
+            "recent_requests": total,
+            "failure_ratio": self.outcomes.count(False) / total if total else 0.0,
+            "retry_in": self.retry_in(),
+            "times_opened": self.times_opened,
+        }
+
+    def _probe_expired(self, now: float) -> bool:
+        """Return whether no probe is running (or the last one was lost)."""
+        return not self._probe_started or now - self._probe_started >= max(
+            self.open_seconds, 1.0
+        )
+
+    def _open(self) -> None:
+        """Open the circuit until the next probe."""
+        self.state = CircuitState.OPEN
+        self.opened_at = time.monotonic()
+        self.times_opened += 1
+        self._probe_started = 0.0
+        logger.warning(
+            "Circuit opened, failing fast",
+            route=self.name,
+            open_seconds=self.open_seconds,
+            recent_failures=self.outcomes.count(False),
+            recent_requests=len(self.outcomes),
+        )
+
+    def _error(self, now: float) -> CircuitOpenError:
+        """Build the error raised while failing fast."""
+        return CircuitOpenError(
+            f"Circuit open for {self.name}",
+            retry_after=self.retry_in(now) or None,
+        )
@@ -1,11 +1,38 @@
 """Riot API HTTP client with proper rate limiting, error handling, and authentication."""
 
 import asyncio
-from typing import Optional, Dict, Any, List, Union, Callable
+import json
+import random
+import time
+from collections import deque
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import (
+    Optional,
+    Dict,
+    Any,
+    AsyncIterator,
+    Deque,
+    Iterable,
+    Iterator,
+    List,
+    Mapping,
+    Tuple,
+    Union,
+    Callable,
+)
 import httpx
 import structlog
+from pydantic import TypeAdapter, ValidationError
 
-from .rate_limiter import RateLimiter
+from .circuit_breaker import CircuitBreaker
+from .metrics import RiotAPIMetrics, riot_api_metrics, route_label
+from .not_found_cache import get_not_found_cache
+from .rate_limit_backends import create_rate_limiter
+from .rate_limiter import ApiKeyLimits, LaneTicket
+from . import rate_planner
+from .rate_planner import RatePlan
+from .transports import BaseURLTransport, RecordingTransport, ReplayTransport
 from .errors import (
     RiotAPIError,
     RateLimitError,
@@ -22,11 +49,90 @@ from .models import (
     MatchDTO,
     LeagueEntryDTO,
 )
-from .endpoints import RiotAPIEndpoints
-from .constants import Region, Platform, QueueType
+from .endpoints import REGIONAL_ROUTES, RiotAPIEndpoints, resolve_route
+from .constants import (
+    Region,
+    Platform,
+    QueueType,
+    RateLimitScope,
+    RequestPriority,
+    RiotRoute,
+)
+from ..config import get_global_settings
 
 logger = structlog.get_logger(__name__)
 
+_LEAGUE_ENTRIES_ADAPTER = TypeAdapter(List[LeagueEntryDTO])
+
+# Seconds a request is assumed to take before any latency was observed
+DEFAULT_LATENCY = 0.25
+
+# Request callback of the current task, so a shared client can still report
+# requests to whoever is using it (e.g. the metrics of a running job)
+_request_callback: ContextVar[Optional[Callable[[str, int], None]]] = ContextVar(
+    "riot_api_request_callback", default=None
+)
+
+
+# Priority lane of the current task. Calls default to interactive because
+# everything outside scheduled jobs is made while a user waits.
+_request_priority: ContextVar[RequestPriority] = ContextVar(
+    "riot_api_request_priority", default=RequestPriority.INTERACTIVE
+)
+
+
+@contextmanager
+def request_priority(priority: RequestPriority) -> Iterator[None]:
+    """
+    Run Riot API calls made by the current task in a priority lane.
+
+    Args:
+        priority: Lane the rate limiter serves the calls in
+    """
+    token = _request_priority.set(priority)
+    try:
+        yield
+    finally:
+        _request_priority.reset(token)
+
+
+class _Flight:
+    """GET request shared by every concurrent caller of the same URL."""
+
+    def __init__(self, priority: RequestPriority):
+        """
+        Initialize flight.
+
+        Args:
+            priority: Lane of the caller that started the request
+        """
+        # Raised to the highest lane of the callers waiting for the request
+        self.lane = LaneTicket(priority)
+        self.future: Optional["asyncio.Future[bytes]"] = None
+
+
+@contextmanager
+def track_api_requests(callback: Callable[[str, int], None]) -> Iterator[None]:
+    """
+    Report requests made by the current task to a callback.
+
+    Args:
+        callback: Called with (metric_name, count) for every successful request
+    """
+    token = _request_callback.set(callback)
+    try:
+        yield
+    finally:
+        _request_callback.reset(token)
+
+
+def _decode_league_entries(content: bytes) -> List[LeagueEntryDTO]:
+    """Decode a league entries response (the API returns a list)."""
+    try:
+        return _LEAGUE_ENTRIES_ADAPTER.validate_json(content)
+    except ValidationError as e:
+        raise RiotAPIError(f"Invalid league entries response: {e}") from e
+
 
 class RiotAPIClient:
     """Comprehensive Riot API client with rate limiting and error handling."""
@@ -38,6 +144,8 @@ class RiotAPIClient:
         platform: Optional[Platform] = None,
         enable_logging: bool = True,
         request_callback: Optional[Callable[[str, int], None]] = None,
+        metrics: Optional[RiotAPIMetrics] = None,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
     ):
         """
         Initialize Riot API client.
@@ -48,6 +156,9 @@ class RiotAPIClient:
             platform: Default platform for platform endpoints
             enable_logging: Enable request/response logging
             request_callback: Optional callback for tracking API requests (metric_name, count)
+            metrics: Latency and queueing metrics (process-wide metrics if None)
+            transport: httpx transport to send requests with, e.g. the one of
+                the fake Riot API (network, or RIOT_API_BASE_URL, if None)
         """
         if not api_key:
             raise ValueError(
@@ -60,15 +171,24 @@ class RiotAPIClient:
         self.platform = platform or Platform("eun1")
         self.enable_logging = enable_logging
         self.request_callback = request_callback
+        self.metrics = metrics or riot_api_metrics
+        self.transport = transport
 
         # Initialize components
-        self.rate_limiter = RateLimiter()
+        self.rate_limiter = create_rate_limiter(api_key)
+        self.not_found_cache = get_not_found_cache()
         self.endpoints = RiotAPIEndpoints(self.region, self.platform)
 
         # HTTP session
         self.session = None
         self._session_lock = asyncio.Lock()
 
+        # In-flight GET requests by (url, params)
+        self._inflight: Dict[Tuple[Any, ...], _Flight] = {}
+
+        # Circuit breakers by route template, created on first use
+        self.circuit_breakers: Dict[RiotRoute, CircuitBreaker] = {}
+
     async def __aenter__(self):
         """Async context manager entry."""
         await self.start_session()
@@ -94,15 +214,26 @@ class RiotAPIClient:
                         "User-Agent": "RiotAPI-SmurfDetector/1.0",
                     }
 
+                    settings = get_global_settings()
                     timeout = httpx.Timeout(
                         connect=5.0, read=25.0, write=10.0, pool=30.0
                     )
+                    # httpx pools connections per host, these bound the total
                     limits = httpx.Limits(
-                        max_keepalive_connections=20, max_connections=5
+                        max_connections=settings.riot_http_max_connections,
+                        max_keepalive_connections=settings.riot_http_max_keepalive_connections,
+                        keepalive_expiry=settings.riot_http_keepalive_expiry,
                     )
 
+                    http2 = self._http2_enabled(settings.riot_http2)
+                    transport = self._build_transport(settings, limits, http2)
+
                     self.session = httpx.AsyncClient(
-                        headers=headers, timeout=timeout, limits=limits
+                        headers=headers,
+                        timeout=timeout,
+                        limits=limits,
+                        http2=http2,
+                        transport=transport,
                     )
 
                     logger.info(
@@ -112,11 +243,63 @@ class RiotAPIClient:
                         api_key_prefix="[REDACTED]" if self.api_key else "None",
                     )
 
+                    # Pick up where the previous process left off
+                    await self.rate_limiter.restore_state()
+                    await self.not_found_cache.restore()
+
+    def _build_transport(
+        self, settings: Any, limits: httpx.Limits, http2: bool
+    ) -> Optional[httpx.AsyncBaseTransport]:
+        """
+        Return the transport of the session (None for the default network one).
+
+        Args:
+            settings: Application settings
+            limits: Connection pool limits
+            http2: Whether HTTP/2 is used
+
+        Returns:
+            Transport given to the client, a base URL override or a cassette
+            recorder/player around it
+        """
+        if settings.riot_cassette_mode == "replay":
+            logger.info("Replaying Riot API cassette", path=settings.riot_cassette_path)
+            return ReplayTransport(
+                settings.riot_cassette_path, settings.riot_cassette_timing_scale
+            )
+
+        transport = self.transport
+        if transport is None and settings.riot_api_base_url:
+            transport = BaseURLTransport(
+                settings.riot_api_base_url, limits=limits, http2=http2
+            )
+
+        if settings.riot_cassette_mode == "record":
+            if transport is None:
+                transport = httpx.AsyncHTTPTransport(limits=limits, http2=http2)
+            logger.info("Recording Riot API cassette", path=settings.riot_cassette_path)
+            return RecordingTransport(transport, settings.riot_cassette_path)
+        return transport
+
+    @staticmethod
+    def _http2_enabled(requested: bool) -> bool:
+        """Return whether HTTP/2 can be used (it needs the optional h2 package)."""
+        if not requested:
+            return False
+        try:
+            import h2  # noqa: F401
+        except ImportError:
+            logger.warning("HTTP/2 requested but h2 is not installed, using HTTP/1.1")
+            return False
+        return True
+
     async def close(self) -> None:
         """Close the httpx session."""
         if self.session and not self.session.is_closed:
             await self.session.aclose()
             logger.info("Riot API client session closed")
+        await self.rate_limiter.save_state()
+        await self.not_found_cache.flush()
 
     def _raise_client_error_if_needed(self, status: int) -> None:
         """Raise specific RiotAPIError subclass for client errors."""
@@ -129,35 +312,93 @@ class RiotAPIClient:
         elif status == 404:
             raise NotFoundError("Resource not found", status_code=status)
 
-    def _handle_rate_limit(
-        self, headers: dict, attempt: int, max_retries: int
-    ) -> tuple[bool, int]:
-        """Handle rate limit (429) with retry logic."""
-        retry_after = int(headers.get("Retry-After", 1))
+    @staticmethod
+    def _backoff_delay(attempt: int, base: float = 1.0, cap: float = 30.0) -> float:
+        """
+        Return a jittered exponential backoff delay.
+
+        Half of the delay is fixed and half is random, so callers failing
+        together do not all come back at the same moment.
+
+        Args:
+            attempt: Zero-based retry attempt
+            base: Delay of the first attempt
+            cap: Upper bound of the delay before jitter
+        """
+        delay = min(cap, base * 2**attempt)
+        return delay / 2 + random.uniform(0, delay / 2)
+
+    @staticmethod
+    def _rate_limit_scope(headers: Mapping[str, str]) -> RateLimitScope:
+        """Return the scope of a 429 (Riot omits the header for service limits)."""
+        try:
+            return RateLimitScope(headers.get("X-Rate-Limit-Type", "").lower())
+        except ValueError:
+            return RateLimitScope.SERVICE
+
+    async def _handle_rate_limit(
+        self,
+        url: str,
+        method: str,
+        headers: Mapping[str, str],
+        attempt: int,
+        max_retries: int,
+    ) -> tuple[bool, float]:
+        """
+        Handle rate limit (429) by putting its scope into a shared cooldown.
+
+        App and method 429s cool down for Retry-After. Service 429s are not
+        caused by our own usage, so they back off exponentially with jitter
+        (at least Retry-After, if Riot sent one). The cooldown holds back the
+        permits of every caller, including the retry of this one.
+        """
+        scope = self._rate_limit_scope(headers)
+        try:
+            retry_after = float(headers.get("Retry-After", 0))
+        except ValueError:
+            retry_after = 0.0
+
+        if scope == RateLimitScope.SERVICE:
+            cooldown = max(retry_after, self._backoff_delay(attempt))
+        else:
+            cooldown = retry_after or 1.0
+        await self.rate_limiter.cooldown(url, method, scope, cooldown)
+        self.metrics.count_rate_limited(route_label(url), scope.value)
+
         if attempt < max_retries:
-            return (True, retry_after)
+            self.metrics.count_retry(route_label(url), "rate_limit")
+            return (True, 0.0)
         raise RateLimitError(
-            "Rate limit exceeded",
+            f"Rate limit exceeded ({scope.value})",
             status_code=429,
-            retry_after=retry_after,
+            retry_after=cooldown,
             app_rate_limit=headers.get("X-App-Rate-Limit"),
             method_rate_limit=headers.get("X-Method-Rate-Limit"),
         )
 
     def _handle_server_error(
-        self, status: int, attempt: int, max_retries: int
-    ) -> tuple[bool, int]:
-        """Handle server errors (5xx) with exponential backoff."""
+        self, url: str, status: int, attempt: int, max_retries: int
+    ) -> tuple[bool, float]:
+        """Handle server errors (5xx) with jittered exponential backoff."""
         if attempt < max_retries:
-            return (True, 2**attempt)
+            delay = self._backoff_delay(attempt)
+            self.rate_limiter.record_backoff("server_error", delay)
+            self.metrics.count_retry(route_label(url), "server_error")
+            return (True, delay)
         if status == 503:
             raise ServiceUnavailableError("Service unavailable", status_code=status)
         else:
             raise RiotAPIError(f"Server error {status}", status_code=status)
 
     async def _handle_http_error_status(
-        self, status: int, headers: dict, attempt: int, max_retries: int
-    ) -> tuple[bool, int]:
+        self,
+        url: str,
+        method: str,
+        status: int,
+        headers: Mapping[str, str],
+        attempt: int,
+        max_retries: int,
+    ) -> tuple[bool, float]:
         """
         Handle HTTP error status codes.
 
@@ -170,15 +411,17 @@ class RiotAPIClient:
         # Non-retryable client errors
         self._raise_client_error_if_needed(status)
 
-        # Rate limit - retryable
+        # Rate limit - retryable once the shared cooldown is over
         if status == 429:
-            return self._handle_rate_limit(headers, attempt, max_retries)
+            return await self._handle_rate_limit(
+                url, method, headers, attempt, max_retries
+            )
 
         # Server errors - retryable with exponential backoff
         if status >= 500:
-            return self._handle_server_error(status, attempt, max_retries)
+            return self._handle_server_error(url, status, attempt, max_retries)
 
-        return (False, 0)
+        return (False, 0.0)
 
     async def _execute_single_request(
         self,
@@ -186,40 +429,87 @@ class RiotAPIClient:
         method: str,
         params: Optional[Dict[str, Any]],
         data: Optional[Dict[str, Any]],
-        endpoint_path: str,
         attempt: int,
         max_retries: int,
-    ) -> Any:
-        """Execute a single HTTP request with error handling."""
+    ) -> Optional[bytes]:
+        """Execute a single HTTP request, returning its body (None to retry)."""
         if self.session is None:
             raise RiotAPIError("Session not initialized")
 
-        response = await self.session.request(method, url, params=params, json=data)
+        route = route_label(url)
+        response = await self._timed_request(route, url, method, params, data)
 
         try:
-            self.rate_limiter.update_limits(
-                dict(response.headers), endpoint_path, method
-            )
+            # httpx.Headers is case-insensitive; a plain dict copy is not
+            await self.rate_limiter.update_limits(response.headers, url, method)
+            self._record_outcome(url, response.status_code, response.headers)
 
             # Handle error status codes
             if response.status_code != 200:
                 should_retry, sleep_seconds = await self._handle_http_error_status(
-                    response.status_code, dict(response.headers), attempt, max_retries
+                    url,
+                    method,
+                    response.status_code,
+                    response.headers,
+                    attempt,
+                    max_retries,
                 )
                 if should_retry:
-                    await asyncio.sleep(sleep_seconds)
+                    if sleep_seconds > 0:
+                        await asyncio.sleep(sleep_seconds)
                     return None  # Signal to retry
 
-            # Success - invoke callback to track request
-            if self.request_callback:
-                self.request_callback("requests_made", 1)
-
-            response_data = response.json()
-            await self.rate_limiter.record_success(endpoint_path, method)
-            return response_data
+            self._track_request()
+            await self.rate_limiter.record_success(url, method)
+            return response.content
         finally:
             await response.aclose()
 
+    async def _timed_request(
+        self,
+        route: str,
+        url: str,
+        method: str,
+        params: Optional[Dict[str, Any]],
+        data: Optional[Dict[str, Any]],
+    ) -> httpx.Response:
+        """Send one HTTP request and record its latency, status and size."""
+        started = time.perf_counter()
+        response = await self.session.request(method, url, params=params, json=data)
+        self.metrics.observe_response(
+            route,
+            response.status_code,
+            time.perf_counter() - started,
+            len(response.content),
+        )
+        return response
+
+    def _track_request(self) -> None:
+        """Invoke the client and task request callbacks for a successful call."""
+        if self.request_callback:
+            self.request_callback("requests_made", 1)
+        task_callback = _request_callback.get()
+        if task_callback:
+            task_callback("requests_made", 1)
+
+    def _timed_decode(
+        self,
+        url: str,
+        content: bytes,
+        decode: Optional[Callable[[bytes], Any]],
+    ) -> Any:
+        """Decode a successful response body and record how long it took."""
+        route = route_label(url)
+        # Validating raw bytes skips building dicts for the many fields
+        # the DTOs ignore
+        started = time.perf_counter()
+        if decode is not None:
+            response_data = decode(content)
+        else:
+            response_data = json.loads(content)
+        self.metrics.observe_decode(route, time.perf_counter() - started)
+        return response_data
+
     async def _make_request(
         self,
         url: str,
@@ -227,7 +517,73 @@ class RiotAPIClient:
         params: Optional[Dict[str, Any]] = None,
         data: Optional[Dict[str, Any]] = None,
         retry_on_failure: bool = True,
+        decode: Optional[Callable[[bytes], Any]] = None,
     ) -> Any:
+        """
+        Make HTTP request, sharing in-flight GETs between identical callers.
+
+        Concurrent GETs with the same URL and parameters wait for a single
+        HTTP call (and a single rate limit permit) and all receive its result
+        or error, whatever lane they are in and however they decode it. The
+        call is made in the highest lane of its callers, so a user joining a
+        backfill request is not held up by the backfill lane. Every caller
+        decodes the shared body itself; results of the same decoder are not
+        shared, so they may be modified.
+
+        Args:
+            url: Request URL
+            method: HTTP method
+            params: Query parameters
+            data: Request body data
+            retry_on_failure: Retry on transient failures
+            decode: Builds the result straight from the raw response body
+                (e.g. MatchDTO.model_validate_json), skipping the dict step
+
+        Returns:
+            Decoded result, or response data as dictionary or list
+
+        Raises:
+            RiotAPIError: For API errors
+        """
+        if method != "GET" or data is not None:
+            content = await self._send_request(
+                url, method, params, data, retry_on_failure, _request_priority.get()
+            )
+            return self._timed_decode(url, content, decode)
+
+        key = (
+            url,
+            tuple(sorted((name, str(value)) for name, value in (params or {}).items())),
+        )
+        priority = _request_priority.get()
+        flight = self._inflight.get(key)
+        if flight is None:
+            flight = _Flight(priority)
+            flight.future = asyncio.ensure_future(
+                self._send_request(
+                    url, method, params, data, retry_on_failure, flight.lane
+                )
+            )
+            self._inflight[key] = flight
+            flight.future.add_done_callback(lambda _: self._inflight.pop(key, None))
+        else:
+            flight.lane.raise_to(priority)
+            if self.enable_logging:
+                logger.debug("Joining in-flight request", url=url)
+
+        # Shielded so a cancelled caller does not cancel the other waiters
+        content = await asyncio.shield(flight.future)
+        return self._timed_decode(url, content, decode)
+
+    async def _send_request(
+        self,
+        url: str,
+        method: str,
+        params: Optional[Dict[str, Any]],
+        data: Optional[Dict[str, Any]],
+        retry_on_failure: bool,
+        priority: Union[RequestPriority, LaneTicket],
+    ) -> bytes:
         """
         Make HTTP request with rate limiting and retry logic.
 
@@ -237,9 +593,10 @@ class RiotAPIClient:
             params: Query parameters
             data: Request body data
             retry_on_failure: Retry on transient failures
+            priority: Lane to take permits in, or a ticket whose lane can rise
 
         Returns:
-            Response data as dictionary or list
+            Raw body of the successful response
 
         Raises:
             RiotAPIError: For API errors
@@ -249,35 +606,263 @@ class RiotAPIClient:
         if self.session is None:
             raise RiotAPIError("Session not initialized")
 
-        # Rate limiting
-        endpoint_path = self._extract_endpoint_path(url)
-        await self.rate_limiter.wait_if_needed(endpoint_path, method)
+        route = route_label(url)
+        self._raise_if_known_missing(url, method, route)
+
+        try:
+            return await self._send_with_retries(
+                url, method, params, data, retry_on_failure, priority, route
+            )
+        except NotFoundError:
+            if method == "GET":
+                self.not_found_cache.record(url)
+            raise
 
-        # Retry loop
+    def _raise_if_known_missing(self, url: str, method: str, route: str) -> None:
+        """Raise NotFoundError without using a permit if url recently 404ed."""
+        if method == "GET" and self.not_found_cache.is_known_missing(url):
+            self.metrics.count_cached_not_found(route)
+            raise NotFoundError("Resource not found (cached)", status_code=404)
+
+    async def _send_with_retries(
+        self,
+        url: str,
+        method: str,
+        params: Optional[Dict[str, Any]],
+        data: Optional[Dict[str, Any]],
+        retry_on_failure: bool,
+        priority: Union[RequestPriority, LaneTicket],
+        route: str,
+    ) -> bytes:
+        """Send the request until it succeeds or retries are exhausted."""
         max_retries = 3 if retry_on_failure else 0
         last_error = None
+        breaker = self._circuit_breaker(url)
+        attempts = 0
 
-        for attempt in range(max_retries + 1):
-            try:
-                result = await self._execute_single_request(
-                    url, method, params, data, endpoint_path, attempt, max_retries
-                )
-                if result is not None:
-                    return result
-            except (httpx.RequestError, asyncio.TimeoutError) as e:
-                last_error = e
-                if attempt < max_retries:
-                    await asyncio.sleep(2**attempt)
-
-        raise RiotAPIError(f"Request failed: {str(last_error)}")
-
-    def _extract_endpoint_path(self, url: str) -> str:
-        """Extract endpoint path from URL for rate limiting."""
-        stripped = url.replace("https://", "").replace("http://", "")
-        parts = stripped.split("/", 1)
-        if len(parts) == 2:
-            return parts[1]
-        return stripped
+        try:
+            for attempt in range(max_retries + 1):
+                await self._acquire_permit(url, method, route, breaker, priority)
+                attempts += 1
+                try:
+                    result = await self._execute_single_request(
+                        url, method, params, data, attempt, max_retries
+                    )
+                    if result is not None:
+                        return result
+                except (httpx.RequestError, asyncio.TimeoutError) as e:
+                    last_error = e
+                    await self._handle_transport_error(
+                        route, breaker, attempt, max_retries
+                    )
+
+            raise RiotAPIError(f"Request failed: {str(last_error)}")
+        finally:
+            if attempts:
+                self.metrics.observe_attempts(route, attempts)
+
+    async def _acquire_permit(
+        self,
+        url: str,
+        method: str,
+        route: str,
+        breaker: Optional[CircuitBreaker],
+        priority: Union[RequestPriority, LaneTicket],
+    ) -> None:
+        """Wait for the circuit breaker and a rate limit permit for one attempt."""
+        # Fail fast while the route is degraded, before using a permit
+        if breaker is not None:
+            breaker.before_request()
+
+        # Rate limiting (keyed on the route template and routing value of
+        # url). Every attempt takes its own permit, so retries count against
+        # the windows and wait out any cooldown a 429 started.
+        started = time.perf_counter()
+        await self.rate_limiter.wait_if_needed(url, method, priority)
+        self.metrics.observe_limiter_wait(route, time.perf_counter() - started)
+
+    async def _handle_transport_error(
+        self,
+        route: str,
+        breaker: Optional[CircuitBreaker],
+        attempt: int,
+        max_retries: int,
+    ) -> None:
+        """Count a failed connection and back off if another attempt follows."""
+        if breaker is not None:
+            breaker.record_failure()
+        if attempt < max_retries:
+            self.metrics.count_retry(route, "transport")
+            await asyncio.sleep(self._backoff_delay(attempt))
+
+    async def get_rate_limit_stats(self) -> Dict[str, Any]:
+        """Return rate limit usage per routing value (region or platform)."""
+        return await self.rate_limiter.get_stats()
+
+    def get_cooldown_stats(self) -> Dict[str, Dict[str, float]]:
+        """Return count and seconds of 429 cooldowns and 5xx backoff, by reason."""
+        return self.rate_limiter.get_cooldown_stats()
+
+    @property
+    def key_limits(self) -> ApiKeyLimits:
+        """App limits of the API key, learned from the first responses."""
+        return self.rate_limiter.key_limits
+
+    def bulk_concurrency(self) -> int:
+        """
+        Return how many match requests bulk fetches keep in flight.
+
+        RIOT_BULK_FETCH_CONCURRENCY if set, otherwise enough to use the burst
+        rate of the key at the observed match-v5 latency (Little's law), so
+        a production key gets more requests in flight than a development key.
+        """
+        configured = get_global_settings().riot_bulk_fetch_concurrency
+        if configured is not None:
+            return configured
+        latency = self.metrics.request_duration.mean(route=RiotRoute.MATCH_BY_ID.value)
+        return self.key_limits.concurrency(latency or DEFAULT_LATENCY)
+
+    def scale_batch(self, count: int) -> int:
+        """
+        Scale a per-run batch size tuned for a development key to the API key.
+
+        Args:
+            count: Batch size configured for a development key
+
+        Returns:
+            count times the sustained throughput of the key relative to a
+            development key (count itself until the limits are known)
+        """
+        if not self.key_limits.learned:
+            return count
+        return self.key_limits.scale_batch(count)
+
+    async def plan_calls(
+        self,
+        calls: Mapping[RiotRoute, int],
+        priority: Optional[RequestPriority] = None,
+        region: Optional[Region] = None,
+        platform: Optional[Platform] = None,
+    ) -> RatePlan:
+        """
+        Estimate how long planned calls take under the current rate limits.
+
+        Args:
+            calls: Number of planned calls per route
+            priority: Lane of the calls (lane of the current task if None)
+            region: Regional routing value of regional routes
+            platform: Platform routing value of platform routes
+
+        Returns:
+            Plan with the ETA of the last call and the limit it is bound by
+        """
+        return await rate_planner.plan(
+            self.rate_limiter,
+            self._planned_calls(calls, region, platform),
+            priority or _request_priority.get(),
+        )
+
+    async def plan_capacity(
+        self,
+        per_unit: Mapping[RiotRoute, int],
+        seconds: float,
+        priority: Optional[RequestPriority] = None,
+        region: Optional[Region] = None,
+        platform: Optional[Platform] = None,
+        maximum: int = 10_000,
+    ) -> int:
+        """
+        Return how many units of work (e.g. players to update) fit into seconds.
+
+        Args:
+            per_unit: Calls needed per unit, per route
+            seconds: Time budget (e.g. the interval of a job)
+            priority: Lane of the calls (lane of the current task if None)
+            region: Regional routing value of regional routes
+            platform: Platform routing value of platform routes
+            maximum: Upper bound of the answer (e.g. the units available)
+
+        Returns:
+            Number of units estimated to finish within the budget
+        """
+        return await rate_planner.capacity(
+            self.rate_limiter,
+            self._planned_calls(per_unit, region, platform),
+            seconds,
+            priority or _request_priority.get(),
+            maximum,
+        )
+
+    def _planned_calls(
+        self,
+        calls: Mapping[RiotRoute, int],
+        region: Optional[Region],
+        platform: Optional[Platform],
+    ) -> Dict[Tuple[str, RiotRoute], int]:
+        """Key planned calls by the routing value their route is served by."""
+        region_value = self._enum_str(region or self.region)
+        platform_value = self._enum_str(platform or self.platform)
+        return {
+            (
+                region_value if route in REGIONAL_ROUTES else platform_value,
+                route,
+            ): count
+            for route, count in calls.items()
+        }
+
+    def _circuit_breaker(self, url: str) -> Optional[CircuitBreaker]:
+        """Return the circuit breaker of the route of url (None if unknown)."""
+        _, route = resolve_route(url)
+        if route is None:
+            return None
+
+        breaker = self.circuit_breakers.get(route)
+        if breaker is None:
+            settings = get_global_settings()
+            breaker = CircuitBreaker(
+                route.value,
+                failure_ratio=settings.riot_circuit_failure_ratio,
+                min_requests=settings.riot_circuit_min_requests,
+                window=settings.riot_circuit_window,
+                open_seconds=settings.riot_circuit_open_seconds,
+            )
+            self.circuit_breakers[route] = breaker
+        return breaker
+
+    def _record_outcome(
+        self, url: str, status: int, headers: Mapping[str, str]
+    ) -> None:
+        """Feed a response to the circuit breaker of its route.
+
+        Server errors and service-level 429s mean the route is degraded. Any
+        other response, including 404s and our own rate limits, means it works.
+        """
+        breaker = self._circuit_breaker(url)
+        if breaker is None:
+            return
+        if status >= 500 or (
+            status == 429 and self._rate_limit_scope(headers) == RateLimitScope.SERVICE
+        ):
+            breaker.record_failure()
+        else:
+            breaker.record_success()
+
+    def is_circuit_open(self, route: RiotRoute) -> bool:
+        """
+        Return whether calls to a route currently fail fast.
+
+        Lets callers skip work that depends on a degraded route instead of
+        collecting CircuitOpenErrors.
+        """
+        breaker = self.circuit_breakers.get(route)
+        return breaker is not None and breaker.is_open()
+
+    def get_circuit_stats(self) -> Dict[str, Dict[str, Any]]:
+        """Return the circuit breaker state of every route used so far."""
+        return {
+            route.value: breaker.stats()
+            for route, breaker in self.circuit_breakers.items()
+        }
 
     @staticmethod
     def _enum_str(value: Union[Region, Platform, str]) -> str:
@@ -290,8 +875,14 @@ class RiotAPIClient:
     ) -> AccountDTO:
         """Get account by Riot ID (gameName#tagLine)."""
         url = self.endpoints.account_by_riot_id(game_name, tag_line, region)
-        response = await self._make_request(url)
-        return AccountDTO(**response)
+        return await self._make_request(url, decode=AccountDTO.model_validate_json)
+
+    async def get_account_by_puuid(
+        self, puuid: str, region: Optional[Region] = None
+    ) -> AccountDTO:
+        """Get account (current Riot ID) by PUUID."""
+        url = self.endpoints.account_by_puuid(puuid, region)
+        return await self._make_request(url, decode=AccountDTO.model_validate_json)
 
     # Summoner endpoints
 
@@ -300,8 +891,7 @@ class RiotAPIClient:
     ) -> SummonerDTO:
         """Get summoner by PUUID."""
         url = self.endpoints.summoner_by_puuid(puuid, platform)
-        response = await self._make_request(url)
-        return SummonerDTO(**response)
+        return await self._make_request(url, decode=SummonerDTO.model_validate_json)
 
     # Match endpoints
     async def get_match_list_by_puuid(
@@ -332,13 +922,162 @@ class RiotAPIClient:
 
         return MatchListDTO(match_ids=match_ids, start=start, count=count, puuid=puuid)
 
+    async def iter_match_ids(
+        self,
+        puuid: str,
+        queue: Optional[Union[int, QueueType]] = None,
+        type: Optional[str] = None,
+        start_time: Optional[int] = None,
+        end_time: Optional[int] = None,
+        page_size: int = 100,
+        limit: Optional[int] = None,
+        region: Optional[Region] = None,
+    ) -> AsyncIterator[List[str]]:
+        """
+        Yield a player's match IDs page by page, newest first.
+
+        The next page is only requested when the caller asks for it, so a
+        caller that stops iterating (e.g. on reaching a match it already
+        stored) saves every remaining list call.
+
+        Args:
+            puuid: Player PUUID
+            queue: Queue filter
+            type: Match type filter
+            start_time: Only matches after this epoch second
+            end_time: Only matches before this epoch second
+            page_size: IDs per request (the API allows at most 100)
+            limit: Stop after this many IDs (None for the whole history)
+            region: Regional routing value
+
+        Yields:
+            Non-empty pages of match IDs
+        """
+        page_size = max(1, min(page_size, 100))
+        start = 0
+        while limit is None or start < limit:
+            count = page_size if limit is None else min(page_size, limit - start)
+            match_list = await self.get_match_list_by_puuid(
+                puuid,
+                start=start,
+                count=count,
+                queue=queue,
+                type=type,
+                start_time=start_time,
+                end_time=end_time,
+                region=region,
+            )
+            page = list(match_list.match_ids)
+            if not page:
+                return
+
+            yield page
+
+            # A short page is the end of the history
+            if len(page) < count:
+                return
+            start += len(page)
+
     async def get_match(
         self, match_id: str, region: Optional[Region] = None
     ) -> MatchDTO:
         """Get match details by match ID."""
         url = self.endpoints.match_by_id(match_id, region)
-        response = await self._make_request(url)
-        return MatchDTO(**response)
+        return await self._make_request(url, decode=MatchDTO.model_validate_json)
+
+    async def get_matches(
+        self,
+        match_ids: Iterable[str],
+        concurrency: Optional[int] = None,
+        ordered: bool = False,
+        region: Optional[Region] = None,
+    ) -> AsyncIterator[Tuple[str, Any]]:
+        """
+        Fetch many matches concurrently, yielding each as it arrives.
+
+        Up to `concurrency` requests are in flight at once, all still paced by
+        the rate limiter, so throughput is bound by the rate limits rather
+        than by round-trip latency. A failed match does not affect the others:
+        its exception is yielded in place of the match, like
+        asyncio.gather(return_exceptions=True). Requests still in flight are
+        cancelled when the caller stops iterating, so wrap the call in
+        contextlib.aclosing when leaving the loop early.
+
+        Args:
+            match_ids: Match IDs to fetch (consumed lazily)
+            concurrency: Requests in flight at once (bulk_concurrency if None)
+            ordered: Yield in the order of match_ids instead of completion
+            region: Regional routing value
+
+        Yields:
+            Tuples of (match ID, match or the exception raised fetching it)
+        """
+        if concurrency is None:
+            concurrency = self.bulk_concurrency()
+        concurrency = max(1, concurrency)
+
+        pending_ids = iter(match_ids)
+        in_flight: Deque[Tuple[str, "asyncio.Future[Any]"]] = deque()
+        ready: List[Tuple[str, "asyncio.Future[Any]"]] = []
+
+        def launch() -> None:
+            while len(in_flight) < concurrency:
+                match_id = next(pending_ids, None)
+                if match_id is None:
+                    return
+                in_flight.append(
+                    (match_id, asyncio.ensure_future(self.get_match(match_id, region)))
+                )
+
+        try:
+            launch()
+            while in_flight:
+                ready = await self._next_finished(in_flight, ordered)
+                # Refill before handing results out, the caller may be slow
+                launch()
+                for match_id, task in ready:
+                    yield match_id, self._task_outcome(task)
+        finally:
+            # Includes finished results the caller never got to
+            await self._cancel_all([task for _, task in [*in_flight, *ready]])
+
+    @staticmethod
+    async def _next_finished(
+        in_flight: Deque[Tuple[str, "asyncio.Future[Any]"]], ordered: bool
+    ) -> List[Tuple[str, "asyncio.Future[Any]"]]:
+        """Wait for fetches to finish and remove them from in_flight.
+
+        Args:
+            in_flight: Running fetches, in launch order
+            ordered: Wait for the oldest fetch only instead of the first to finish
+
+        Returns:
+            The finished (match ID, task) pairs, in launch order
+        """
+        if ordered:
+            await asyncio.wait([in_flight[0][1]])
+            return [in_flight.popleft()]
+
+        done, _ = await asyncio.wait(
+            [task for _, task in in_flight], return_when=asyncio.FIRST_COMPLETED
+        )
+        ready = [item for item in in_flight if item[1] in done]
+        for item in ready:
+            in_flight.remove(item)
+        return ready
+
+    @staticmethod
+    def _task_outcome(task: "asyncio.Future[Any]") -> Any:
+        """Return the result of a finished task, or the exception it raised."""
+        error = task.exception()
+        return error if error is not None else task.result()
+
+    @staticmethod
+    async def _cancel_all(tasks: List["asyncio.Future[Any]"]) -> None:
+        """Cancel tasks and wait until they have all finished."""
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
 
     # League endpoints
     async def get_league_entries_by_puuid(
@@ -346,15 +1085,7 @@ class RiotAPIClient:
     ) -> List[LeagueEntryDTO]:
         """Get league entries by PUUID."""
         url = self.endpoints.league_entries_by_puuid(puuid, platform)
-        response = await self._make_request(url)
-
-        # API returns a list of league entries
-        if not isinstance(response, list):
-            raise RiotAPIError(
-                f"Expected list response for league entries, got {type(response)}"
-            )
-
-        return [LeagueEntryDTO(**entry) for entry in response]
+        return await self._make_request(url, decode=_decode_league_entries)
 
     # Utility methods
 
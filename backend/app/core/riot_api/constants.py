@@ -68,3 +68,42 @@ class QueueType(int, Enum):
     OVERCHARGE = 860
     SNOWURF = 870
     Odyssey = 880
+
+
+class RiotRoute(str, Enum):
+    """Named Riot API routes (method rate limits are enforced per route)."""
+
+    ACCOUNT_BY_RIOT_ID = "account-v1.by-riot-id"
+    ACCOUNT_BY_PUUID = "account-v1.by-puuid"
+    SUMMONER_BY_PUUID = "summoner-v4.by-puuid"
+    MATCH_IDS_BY_PUUID = "match-v5.ids-by-puuid"
+    MATCH_BY_ID = "match-v5.match-by-id"
+    LEAGUE_ENTRIES_BY_PUUID = "league-v4.entries-by-puuid"
+
+
+class RequestPriority(str, Enum):
+    """Priority lanes for Riot API calls, highest first.
+
+    The rate limiter hands out permits to higher lanes first and can keep part
+    of every window free for interactive calls.
+    """
+
+    INTERACTIVE = "interactive"  # made while a user waits for the response
+    NORMAL = "normal"  # scheduled work that keeps tracked data current
+    BACKFILL = "backfill"  # bulk ingestion that can wait
+
+
+class ApiKeyTier(str, Enum):
+    """Tier of a Riot API key, detected from the app limits it reports."""
+
+    UNKNOWN = "unknown"  # no app limits seen yet, sized like a development key
+    DEVELOPMENT = "development"  # 20/1s, 100/2min (development and personal keys)
+    PRODUCTION = "production"  # sustained throughput well above a development key
+
+
+class RateLimitScope(str, Enum):
+    """Scope of a 429, as reported by the X-Rate-Limit-Type header."""
+
+    APPLICATION = "application"  # app limit of the API key was exceeded
+    METHOD = "method"  # method limit of the endpoint was exceeded
+    SERVICE = "service"  # the underlying Riot service is throttling everyone
@@ -8,24 +8,33 @@ Simple flow:
 4. Store in database
 5. Return data
 
-No TTL caching, no freshness tracking, no queue management.
+Hot player lookups are served from the in-process player cache
+(app.features.players.cache) before the database.
 """
 
 from __future__ import annotations
 
+import asyncio
+import contextvars
 import structlog
 from datetime import datetime, timezone
-from typing import Optional, TYPE_CHECKING
+from typing import Dict, Iterable, List, Optional, Tuple, TYPE_CHECKING
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy import func, select, update
 from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.orm import joinedload
 
-from .client import RiotAPIClient
-from .errors import RateLimitError, RiotAPIError
-from .models import MatchDTO
-from .constants import Platform, Region
+from ..cache import TTLCache
+from ..config import get_global_settings
+from ..database import db_manager
+from .client import RiotAPIClient, request_priority
+from .errors import NotFoundError, RateLimitError, RiotAPIError
+from .models import AccountDTO, MatchDTO, SummonerDTO
+from .constants import Platform, Region, RequestPriority
+from .transformers import MatchTransformer
 
 # Import schemas only - models will be imported lazily to avoid circular import
+from app.features.players.cache import player_cache
 from app.features.players.schemas import PlayerResponse, PlayerCreate
 
 # TYPE_CHECKING imports for type annotations (not evaluated at runtime)
@@ -34,18 +43,69 @@ if TYPE_CHECKING:
 
 logger = structlog.get_logger(__name__)
 
+# Background player refreshes running at once in this process
+REFRESH_CONCURRENCY = 4
+
+# Background refreshes waiting or running at once; reads beyond that skip
+# the refresh, a later read starts it
+MAX_PENDING_REFRESHES = 256
+
+
+class _PlayerRefreshes:
+    """Background player refreshes of this process."""
+
+    def __init__(self, max_age: float):
+        """
+        Initialize refresh bookkeeping.
+
+        Args:
+            max_age: Seconds a refresh attempt is remembered
+        """
+        # Refreshes in flight by PUUID (referenced until they finish)
+        self.tasks: Dict[str, "asyncio.Task[None]"] = {}
+        self.slots = asyncio.Semaphore(REFRESH_CONCURRENCY)
+        # PUUIDs refreshed within max age, whether or not the refresh
+        # succeeded, so a player whose data stays stale (a failed refresh, or
+        # a timestamp Riot API cannot fill) is retried once per max age, not
+        # per read
+        self.attempts: TTLCache[bool] = TTLCache(maxsize=16 * 1024, ttl=max_age)
+
+    def started(self, puuid: str) -> bool:
+        """Return whether a refresh of puuid is pending or ran within max age."""
+        return puuid in self.tasks or self.attempts.get(puuid) is not None
+
+
+# Created on first use, once settings are loaded and an event loop runs
+_player_refreshes: Optional[_PlayerRefreshes] = None
+
+
+def _get_player_refreshes() -> _PlayerRefreshes:
+    """Return the background refreshes of this process."""
+    global _player_refreshes
+    if _player_refreshes is None:
+        _player_refreshes = _PlayerRefreshes(
+            get_global_settings().player_refresh_max_age
+        )
+    return _player_refreshes
+
 
 class RiotDataManager:
     """
     Simplified Riot API data manager with database-first approach.
 
     Flow: Database → Riot API (if miss) → Store in DB → Return
+
+    Players found in the cache or database are returned immediately; if
+    their Riot ID or profile is older than PLAYER_REFRESH_MAX_AGE, a
+    backfill-priority refresh is started in the background
+    (stale-while-revalidate), so reads never wait for Riot API.
     """
 
     def __init__(self, db: AsyncSession, api_client: RiotAPIClient):
         """Initialize data manager with database session and API client."""
         self.db = db
         self.api_client = api_client
+        self.transformer = MatchTransformer()
 
     # ===================
     # Player Data Methods
@@ -63,13 +123,17 @@ class RiotDataManager:
             platform: Platform region (e.g., "eun1")
 
         Returns:
-            PlayerResponse if found/fetched, None if rate limited
+            PlayerResponse if found/fetched, None if rate limited or not found
         """
         # Lazy import to avoid circular dependency
         from app.features.players.models import Player
 
         riot_id = f"{game_name}#{tag_line}"
 
+        cached = player_cache.get_by_riot_id(game_name, tag_line, platform)
+        if cached:
+            return self._revalidate(cached)
+
         try:
             # 1. Check database first
             result = await self.db.execute(
@@ -89,7 +153,9 @@ class RiotDataManager:
                     platform=platform,
                     puuid=player.puuid,
                 )
-                return PlayerResponse.model_validate(player)
+                return self._revalidate(
+                    player_cache.put(PlayerResponse.model_validate(player))
+                )
 
             # 2. Not in database, fetch from Riot API
             logger.info(
@@ -130,7 +196,7 @@ class RiotDataManager:
                 puuid=player.puuid,
             )
 
-            return PlayerResponse.model_validate(player)
+            return player_cache.put(PlayerResponse.model_validate(player))
 
         except RateLimitError as e:
             logger.warning(
@@ -141,6 +207,12 @@ class RiotDataManager:
             )
             return None
 
+        except NotFoundError:
+            # Repeated lookups of a wrong Riot ID are answered by the client's
+            # 404 cache without a request
+            logger.info("Player not found in Riot API", riot_id=riot_id)
+            return None
+
         except Exception as e:
             logger.error(
                 "Failed to get player by Riot ID",
@@ -162,21 +234,25 @@ class RiotDataManager:
             platform: Platform region
 
         Returns:
-            PlayerResponse if found/fetched, None if rate limited
+            PlayerResponse if found/fetched, None if rate limited or not found
         """
         # Lazy import to avoid circular dependency
         from app.features.players.models import Player
 
+        cached = player_cache.get_by_puuid(puuid)
+        if cached:
+            return self._revalidate(cached)
+
         try:
             # 1. Check database first
-            result = await self.db.execute(
-                select(Player).where(Player.puuid == puuid, Player.is_active)
-            )
+            result = await self.db.execute(select(Player).where(Player.puuid == puuid))
             player = result.scalar_one_or_none()
 
-            if player:
+            if player and not self._is_placeholder(player):
                 logger.debug("Player found in database", puuid=puuid)
-                return PlayerResponse.model_validate(player)
+                return self._revalidate(
+                    player_cache.put(PlayerResponse.model_validate(player))
+                )
 
             # 2. Not in database, fetch from Riot API
             logger.info("Player not in database, fetching from Riot API", puuid=puuid)
@@ -187,27 +263,12 @@ class RiotDataManager:
             summoner = await self.api_client.get_summoner_by_puuid(puuid, platform_enum)
 
             # 3. Store in database
-            # Ensure summoner_name is never null or empty
-            summoner_name = summoner.name
-            if not summoner_name or summoner_name.strip() == "":
-                summoner_name = "Unknown Player"  # Fallback for missing summoner name
-
-            player_data = PlayerCreate(
-                puuid=puuid,
-                riot_id=None,  # Not available when fetching by PUUID
-                tag_line=None,  # Not available when fetching by PUUID
-                summoner_name=summoner_name,
-                platform=platform,
-                account_level=summoner.summoner_level,
-                profile_icon_id=summoner.profile_icon_id,
-                summoner_id=summoner.id,
-            )
-
+            player_data = self._player_from_summoner(puuid, summoner, platform)
             player = await self._upsert_player(player_data)
 
             logger.info("Player fetched and stored", puuid=puuid)
 
-            return PlayerResponse.model_validate(player)
+            return player_cache.put(PlayerResponse.model_validate(player))
 
         except RateLimitError as e:
             logger.warning(
@@ -217,6 +278,10 @@ class RiotDataManager:
             )
             return None
 
+        except NotFoundError:
+            logger.info("Player not found in Riot API", puuid=puuid)
+            return None
+
         except Exception as e:
             logger.error(
                 "Failed to get player by PUUID",
@@ -226,34 +291,216 @@ class RiotDataManager:
             )
             raise
 
+    async def get_players_by_puuids(
+        self, puuids: Iterable[str], platform: str = "eun1"
+    ) -> Dict[str, PlayerResponse]:
+        """
+        Get many players by PUUID (database-first, batched).
+
+        Cached players are served from memory, the rest are read with one
+        IN query. Players missing from the database, or stored only as the
+        placeholders created for match participants, are fetched from the
+        Riot API concurrently (paced by the rate limiter) and stored with
+        one multi-row upsert. So resolving a match worth of participants
+        takes two database round trips instead of one per player. Without
+        an API client only cached and stored players are returned.
+
+        Args:
+            puuids: Player PUUIDs (duplicates are ignored)
+            platform: Platform region of players fetched from the API
+
+        Returns:
+            PlayerResponse by PUUID; PUUIDs that were not found, or could
+            not be fetched because of rate limits or errors, are missing
+        """
+        players, uncached = self._cached_players(puuids)
+        if uncached:
+            players.update(await self._stored_players(uncached))
+
+        missing = [puuid for puuid in uncached if puuid not in players]
+        if missing and self.api_client is not None:
+            players.update(await self._fetch_players(missing, platform))
+        return players
+
+    def _cached_players(
+        self, puuids: Iterable[str]
+    ) -> Tuple[Dict[str, PlayerResponse], List[str]]:
+        """Split PUUIDs into cached players and the PUUIDs not cached."""
+        players: Dict[str, PlayerResponse] = {}
+        uncached: List[str] = []
+        for puuid in dict.fromkeys(puuids):
+            cached = player_cache.get_by_puuid(puuid)
+            if cached:
+                players[puuid] = self._revalidate(cached)
+            else:
+                uncached.append(puuid)
+        return players, uncached
+
+    async def _stored_players(self, puuids: List[str]) -> Dict[str, PlayerResponse]:
+        """Read players with one query, returning (and caching) all but placeholders."""
+        # Lazy import to avoid circular dependency
+        from app.features.players.models import Player
+
+        result = await self.db.execute(select(Player).where(Player.puuid.in_(puuids)))
+        players: Dict[str, PlayerResponse] = {}
+        placeholders = 0
+        for player in result.scalars():
+            if self._is_placeholder(player):
+                # Refetched by the caller
+                placeholders += 1
+                continue
+            players[player.puuid] = self._revalidate(
+                player_cache.put(PlayerResponse.model_validate(player))
+            )
+        if placeholders:
+            logger.debug("Placeholder players found in database", count=placeholders)
+        return players
+
+    @staticmethod
+    def _is_placeholder(player: Player) -> bool:
+        """Return whether player is a match participant never fetched from Riot API."""
+        return not player.is_active and player.profile_refreshed_at is None
+
+    async def add_match_players(self, match_dto: MatchDTO) -> None:
+        """
+        Insert placeholder players for the unknown participants of a match.
+
+        Participant rows reference players, so they must exist before a
+        match is stored. Unknown participants get an inactive player built
+        from the match alone, without Riot API calls (like
+        PlayerService.discover_players_from_match); stored players are left
+        untouched. Placeholders are fetched from Riot API when looked up.
+        The caller commits.
+
+        Args:
+            match_dto: Match whose participants are about to be stored
+        """
+        # Lazy imports to avoid circular dependency
+        from app.features.matches.transformers import PlayerDataSanitizer
+        from app.features.players.models import Player
+
+        now = datetime.now(timezone.utc)
+        placeholders = [
+            PlayerDataSanitizer.sanitize_player_fields(
+                dict(
+                    puuid=participant.puuid,
+                    riot_id=participant.riot_id_game_name,
+                    tag_line=participant.riot_id_tagline,
+                    summoner_name=participant.summoner_name,
+                    platform=match_dto.info.platform_id,
+                    account_level=participant.summoner_level,
+                    created_at=now,
+                    updated_at=now,
+                    last_seen=now,
+                    is_active=False,
+                )
+            )
+            for participant in match_dto.info.participants
+        ]
+        await self.db.execute(
+            insert(Player)
+            .values(placeholders)
+            .on_conflict_do_nothing(index_elements=["puuid"])
+        )
+
+    async def _fetch_players(
+        self, puuids: List[str], platform: str
+    ) -> Dict[str, PlayerResponse]:
+        """Fetch players from Riot API concurrently and store them in one upsert."""
+        logger.info(
+            "Players not in database, fetching from Riot API",
+            count=len(puuids),
+            platform=platform,
+        )
+        platform_enum = Platform(platform.lower())
+        semaphore = asyncio.Semaphore(self.api_client.bulk_concurrency())
+        summoners = await asyncio.gather(
+            *(self._fetch_summoner(puuid, platform_enum, semaphore) for puuid in puuids)
+        )
+
+        fetched = [
+            self._player_from_summoner(puuid, summoner, platform)
+            for puuid, summoner in zip(puuids, summoners)
+            if summoner is not None
+        ]
+        stored = await self._upsert_players(fetched)
+        logger.info(
+            "Players fetched and stored",
+            requested=len(puuids),
+            stored=len(stored),
+        )
+        return {
+            player.puuid: player_cache.put(PlayerResponse.model_validate(player))
+            for player in stored
+        }
+
+    async def _fetch_summoner(
+        self, puuid: str, platform: Platform, semaphore: asyncio.Semaphore
+    ) -> Optional[SummonerDTO]:
+        """Fetch a summoner, returning None if it is missing or cannot be fetched."""
+        async with semaphore:
+            try:
+                return await self.api_client.get_summoner_by_puuid(puuid, platform)
+            except NotFoundError:
+                logger.info("Player not found in Riot API", puuid=puuid)
+            except RateLimitError as e:
+                logger.warning(
+                    "Rate limited when fetching player",
+                    puuid=puuid,
+                    retry_after=e.retry_after,
+                )
+            except RiotAPIError as e:
+                logger.warning("Failed to fetch player", puuid=puuid, error=str(e))
+            return None
+
+    @staticmethod
+    def _player_from_summoner(
+        puuid: str, summoner: SummonerDTO, platform: str
+    ) -> PlayerCreate:
+        """Build the player record of a summoner fetched by PUUID."""
+        # Ensure summoner_name is never null or empty
+        summoner_name = summoner.name
+        if not summoner_name or summoner_name.strip() == "":
+            summoner_name = "Unknown Player"  # Fallback for missing summoner name
+
+        return PlayerCreate(
+            puuid=puuid,
+            riot_id=None,  # Not available when fetching by PUUID
+            tag_line=None,  # Not available when fetching by PUUID
+            summoner_name=summoner_name,
+            platform=platform,
+            account_level=summoner.summoner_level,
+            profile_icon_id=summoner.profile_icon_id,
+            summoner_id=summoner.id,
+        )
+
     async def _upsert_player(self, player_data: PlayerCreate) -> Player:
         """
         Create or update player in database.
 
-        Uses PostgreSQL UPSERT to handle duplicates.
+        Uses PostgreSQL UPSERT to handle duplicates. The cached player is
+        invalidated, callers cache the returned row.
+        """
+        players = await self._upsert_players([player_data])
+        return players[0]
+
+    async def _upsert_players(self, players_data: List[PlayerCreate]) -> List[Player]:
+        """
+        Create or update players in database with one multi-row UPSERT.
+
+        The cached players are invalidated, callers cache the returned rows.
         """
         # Lazy import to avoid circular dependency
         from app.features.players.models import Player
 
-        stmt = (
-            insert(Player)
-            .values(
-                puuid=player_data.puuid,
-                riot_id=player_data.riot_id,
-                tag_line=player_data.tag_line,
-                summoner_name=player_data.summoner_name,
-                platform=player_data.platform,
-                account_level=player_data.account_level,
-                profile_icon_id=player_data.profile_icon_id,
-                summoner_id=player_data.summoner_id,
-                created_at=datetime.now(timezone.utc),
-                updated_at=datetime.now(timezone.utc),
-                last_seen=datetime.now(timezone.utc),
-                is_active=True,
-            )
-            .on_conflict_do_update(
-                index_elements=["puuid"],
-                set_=dict(
+        if not players_data:
+            return []
+
+        now = datetime.now(timezone.utc)
+        stmt = insert(Player).values(
+            [
+                dict(
+                    puuid=player_data.puuid,
                     riot_id=player_data.riot_id,
                     tag_line=player_data.tag_line,
                     summoner_name=player_data.summoner_name,
@@ -261,16 +508,186 @@ class RiotDataManager:
                     account_level=player_data.account_level,
                     profile_icon_id=player_data.profile_icon_id,
                     summoner_id=player_data.summoner_id,
-                    updated_at=datetime.now(timezone.utc),
-                    last_seen=datetime.now(timezone.utc),
-                ),
-            )
-            .returning(Player)
+                    created_at=now,
+                    updated_at=now,
+                    last_seen=now,
+                    is_active=True,
+                    riot_id_refreshed_at=now if player_data.riot_id else None,
+                    profile_refreshed_at=now,
+                )
+                for player_data in players_data
+            ]
         )
+        stmt = stmt.on_conflict_do_update(
+            index_elements=["puuid"],
+            set_=dict(
+                # Lookups by PUUID do not know the Riot ID, keep the stored one
+                riot_id=func.coalesce(stmt.excluded.riot_id, Player.riot_id),
+                tag_line=func.coalesce(stmt.excluded.tag_line, Player.tag_line),
+                riot_id_refreshed_at=func.coalesce(
+                    stmt.excluded.riot_id_refreshed_at, Player.riot_id_refreshed_at
+                ),
+                profile_refreshed_at=stmt.excluded.profile_refreshed_at,
+                summoner_name=stmt.excluded.summoner_name,
+                platform=stmt.excluded.platform,
+                account_level=stmt.excluded.account_level,
+                profile_icon_id=stmt.excluded.profile_icon_id,
+                summoner_id=stmt.excluded.summoner_id,
+                updated_at=stmt.excluded.updated_at,
+                last_seen=stmt.excluded.last_seen,
+            ),
+        ).returning(Player)
 
         result = await self.db.execute(stmt)
+        players = list(result.scalars().all())
         await self.db.commit()
-        return result.scalar_one()
+        player_cache.invalidate(*(player_data.puuid for player_data in players_data))
+        return players
+
+    def _revalidate(self, player: PlayerResponse) -> PlayerResponse:
+        """
+        Start a background refresh of player if its data is stale.
+
+        A player is refreshed at most once per max age, and not at all while
+        MAX_PENDING_REFRESHES refreshes are pending.
+
+        Args:
+            player: Player about to be returned from cache or database
+
+        Returns:
+            player, unchanged
+        """
+        max_age = get_global_settings().player_refresh_max_age
+        if max_age <= 0 or self.api_client is None:
+            return player
+        refreshes = _get_player_refreshes()
+        if refreshes.started(player.puuid):
+            return player
+
+        refresh_riot_id = self._is_stale(player.riot_id_refreshed_at, max_age)
+        refresh_profile = self._is_stale(player.profile_refreshed_at, max_age)
+        if not (refresh_riot_id or refresh_profile):
+            return player
+
+        if len(refreshes.tasks) >= MAX_PENDING_REFRESHES:
+            logger.debug("Background player refresh skipped, too many pending")
+            return player
+
+        refreshes.attempts.set(player.puuid, True, ttl=max_age)
+        # A fresh context keeps the caller's priority lane and request
+        # callback out of the refresh
+        task = asyncio.create_task(
+            self._refresh_player(player, refresh_riot_id, refresh_profile),
+            context=contextvars.Context(),
+        )
+        refreshes.tasks[player.puuid] = task
+        task.add_done_callback(lambda _: refreshes.tasks.pop(player.puuid, None))
+        return player
+
+    @staticmethod
+    def _is_stale(refreshed_at: Optional[datetime], max_age: float) -> bool:
+        """Return whether data fetched at refreshed_at is older than max_age."""
+        if refreshed_at is None:
+            return True
+        if refreshed_at.tzinfo is None:
+            refreshed_at = refreshed_at.replace(tzinfo=timezone.utc)
+        age = datetime.now(timezone.utc) - refreshed_at
+        return age.total_seconds() > max_age
+
+    async def _refresh_player(
+        self, player: PlayerResponse, refresh_riot_id: bool, refresh_profile: bool
+    ) -> None:
+        """
+        Refetch the stale parts of a player and store them.
+
+        Runs in the background with its own database session, so it outlives
+        the request that started it. Failures are logged and retried on a read
+        once the max age has passed.
+
+        Args:
+            player: Player to refresh
+            refresh_riot_id: Refetch Riot ID (account-v1)
+            refresh_profile: Refetch level and profile icon (summoner-v4)
+        """
+        async with _get_player_refreshes().slots:
+            try:
+                with request_priority(RequestPriority.BACKFILL):
+                    account = (
+                        await self.api_client.get_account_by_puuid(player.puuid)
+                        if refresh_riot_id
+                        else None
+                    )
+                    summoner = (
+                        await self.api_client.get_summoner_by_puuid(
+                            player.puuid, Platform(player.platform.lower())
+                        )
+                        if refresh_profile
+                        else None
+                    )
+
+                async with db_manager.get_session() as db:
+                    refreshed = await self._store_refresh(
+                        db, player.puuid, account, summoner
+                    )
+                if refreshed is not None:
+                    player_cache.put(PlayerResponse.model_validate(refreshed))
+                logger.debug(
+                    "Player refreshed in background",
+                    puuid=player.puuid,
+                    riot_id=refresh_riot_id,
+                    profile=refresh_profile,
+                )
+            except RiotAPIError as e:
+                logger.info(
+                    "Background player refresh failed",
+                    puuid=player.puuid,
+                    status_code=e.status_code,
+                    error=str(e),
+                )
+            except Exception as e:
+                logger.warning(
+                    "Background player refresh failed",
+                    puuid=player.puuid,
+                    error=str(e),
+                )
+
+    @staticmethod
+    async def _store_refresh(
+        db: AsyncSession,
+        puuid: str,
+        account: Optional[AccountDTO],
+        summoner: Optional[SummonerDTO],
+    ) -> Optional[Player]:
+        """Update the refreshed fields of a player, returning the row."""
+        # Lazy import to avoid circular dependency
+        from app.features.players.models import Player
+
+        now = datetime.now(timezone.utc)
+        # Keep updated_at: the tracked player updater schedules by it
+        values: Dict[str, object] = {"updated_at": Player.updated_at}
+        if account is not None:
+            values.update(
+                riot_id=account.game_name,
+                tag_line=account.tag_line,
+                riot_id_refreshed_at=now,
+            )
+        if summoner is not None:
+            values.update(
+                account_level=summoner.summoner_level,
+                profile_icon_id=summoner.profile_icon_id,
+                summoner_id=summoner.id,
+                profile_refreshed_at=now,
+            )
+
+        result = await db.execute(
+            update(Player)
+            .where(Player.puuid == puuid, Player.is_active)
+            .values(**values)
+            .returning(Player)
+        )
+        player = result.scalar_one_or_none()
+        await db.commit()
+        return player
 
     # ==================
     # Match Data Methods
@@ -282,30 +699,37 @@ class RiotDataManager:
         """
         Get match data (database-first).
 
-        Note: Match data is immutable once the game ends.
+        Match data is immutable once the game ends, so a stored match is
+        rebuilt from its rows instead of being fetched again. The rebuilt
+        MatchDTO carries the stored columns only (see
+        MatchTransformer.to_match_dto). A match fetched from the Riot API is
+        stored (see store_match), so the next read is served from the
+        database.
 
         Args:
             match_id: Match ID (e.g., "EUN1_3087654321")
             region: Regional endpoint
 
         Returns:
-            MatchDTO if found/fetched, None if rate limited
+            MatchDTO if found/fetched, None if rate limited or not found
         """
         # Lazy import to avoid circular dependency
         from app.features.matches.models import Match
 
         try:
-            # 1. Check database first
+            # 1. Check database first (match and participants in one query)
             result = await self.db.execute(
-                select(Match).where(Match.match_id == match_id)
+                select(Match)
+                .options(joinedload(Match.participants))
+                .where(Match.match_id == match_id)
             )
-            match = result.scalar_one_or_none()
+            match = result.unique().scalar_one_or_none()
 
-            if match:
+            # Rows without participants are incomplete, refetch those
+            if match and match.participants:
                 logger.debug("Match found in database", match_id=match_id)
-                # Would need to convert Match model to MatchDTO
-                # For now, fetch from API to get complete data
-                pass
+                participants = sorted(match.participants, key=lambda p: p.id)
+                return self.transformer.to_match_dto(match, participants)
 
             # 2. Fetch from Riot API
             logger.info("Fetching match from Riot API", match_id=match_id)
@@ -313,8 +737,8 @@ class RiotDataManager:
             region_enum = Region(region.lower())
             match_dto = await self.api_client.get_match(match_id, region_enum)
 
-            # 3. Store in database (implementation would store match details)
-            # This would require proper match storage logic
+            # 3. Store in database
+            await self.store_match(match_dto)
             logger.info("Match fetched", match_id=match_id)
 
             return match_dto
@@ -340,3 +764,44 @@ class RiotDataManager:
                 "Failed to get match", match_id=match_id, error=str(e), exc_info=True
             )
             raise
+
+    async def store_match(self, match_dto: MatchDTO) -> None:
+        """
+        Store a match fetched from the Riot API with its participants.
+
+        Unknown participants are stored as placeholder players first (see
+        add_match_players). Rows already stored are kept. A failure is
+        logged and rolled back instead of raised, since the caller already
+        has the match.
+
+        Args:
+            match_dto: Match fetched from the Riot API
+        """
+        # Lazy import to avoid circular dependency
+        from app.features.matches.models import Match
+        from app.features.matches.participants import MatchParticipant
+
+        try:
+            transformed = self.transformer.transform_match_data(
+                match_dto.model_dump(by_alias=True, mode="json")
+            )
+            await self.add_match_players(match_dto)
+            await self.db.execute(
+                insert(Match)
+                .values(**transformed["match"])
+                .on_conflict_do_nothing(index_elements=["match_id"])
+            )
+            if transformed["participants"]:
+                await self.db.execute(
+                    insert(MatchParticipant)
+                    .values(transformed["participants"])
+                    .on_conflict_do_nothing(index_elements=["match_id", "puuid"])
+                )
+            await self.db.commit()
+        except Exception as e:
+            logger.error(
+                "Failed to store match",
+                match_id=match_dto.metadata.match_id,
+                error=str(e),
+            )
+            await self.db.rollback()
@@ -1,12 +1,45 @@
 """Riot API endpoint definitions and routing information."""
 
-from typing import Dict, List, Optional
+import re
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import urlsplit
 import structlog
 
-from .constants import Region, Platform, QueueType
+from .constants import Region, Platform, QueueType, RiotRoute
 
 logger = structlog.get_logger(__name__)
 
+RIOT_API_HOST_SUFFIX = ".api.riotgames.com"
+
+# Path templates of every endpoint the client calls, keyed by route name
+ROUTE_TEMPLATES: Dict[RiotRoute, str] = {
+    RiotRoute.ACCOUNT_BY_RIOT_ID: (
+        "/riot/account/v1/accounts/by-riot-id/{game_name}/{tag_line}"
+    ),
+    RiotRoute.ACCOUNT_BY_PUUID: "/riot/account/v1/accounts/by-puuid/{puuid}",
+    RiotRoute.SUMMONER_BY_PUUID: "/lol/summoner/v4/summoners/by-puuid/{puuid}",
+    RiotRoute.MATCH_IDS_BY_PUUID: "/lol/match/v5/matches/by-puuid/{puuid}/ids",
+    RiotRoute.MATCH_BY_ID: "/lol/match/v5/matches/{match_id}",
+    RiotRoute.LEAGUE_ENTRIES_BY_PUUID: "/lol/league/v4/entries/by-puuid/{puuid}",
+}
+
+# Routes served by regional hosts (e.g. europe), the rest by platform hosts
+REGIONAL_ROUTES = frozenset(
+    {
+        RiotRoute.ACCOUNT_BY_RIOT_ID,
+        RiotRoute.ACCOUNT_BY_PUUID,
+        RiotRoute.MATCH_IDS_BY_PUUID,
+        RiotRoute.MATCH_BY_ID,
+    }
+)
+
+# Compiled matchers used to resolve a request URL back to its route
+_ROUTE_PATTERNS: List[Tuple[RiotRoute, re.Pattern[str]]] = [
+    (route, re.compile("^" + re.sub(r"\{\w+\}", "[^/]+", template) + "$"))
+    for route, template in ROUTE_TEMPLATES.items()
+]
+
 
 class RiotAPIEndpoints:
     """Riot API endpoint definitions and routing."""
@@ -39,18 +72,41 @@ class RiotAPIEndpoints:
         """Extract string value from enum or return as-is."""
         return value.value if hasattr(value, "value") else value
 
+    @staticmethod
+    def build(route: RiotRoute, base_url: str, **params: str) -> str:
+        """
+        Build URL for a named route.
+
+        Args:
+            route: Route to build
+            base_url: Regional or platform base URL
+            params: Values for the template placeholders
+        """
+        return f"{base_url}{ROUTE_TEMPLATES[route].format(**params)}"
+
     # Account endpoints (Regional)
     def account_by_riot_id(
         self, game_name: str, tag_line: str, region: Optional[Region] = None
     ) -> str:
         """Get account by Riot ID endpoint."""
-        base_url = self.get_base_url(region)
-        return f"{base_url}/riot/account/v1/accounts/by-riot-id/{game_name}/{tag_line}"
+        return self.build(
+            RiotRoute.ACCOUNT_BY_RIOT_ID,
+            self.get_base_url(region),
+            game_name=game_name,
+            tag_line=tag_line,
+        )
+
+    def account_by_puuid(self, puuid: str, region: Optional[Region] = None) -> str:
+        """Get account by PUUID endpoint."""
+        return self.build(
+            RiotRoute.ACCOUNT_BY_PUUID, self.get_base_url(region), puuid=puuid
+        )
 
     def summoner_by_puuid(self, puuid: str, platform: Optional[Platform] = None) -> str:
         """Get summoner by PUUID endpoint."""
-        platform_url = self.get_platform_url(platform)
-        return f"{platform_url}/lol/summoner/v4/summoners/by-puuid/{puuid}"
+        return self.build(
+            RiotRoute.SUMMONER_BY_PUUID, self.get_platform_url(platform), puuid=puuid
+        )
 
     # Match endpoints (Regional)
     def match_list_by_puuid(
@@ -65,8 +121,9 @@ class RiotAPIEndpoints:
         region: Optional[Region] = None,
     ) -> str:
         """Get match list by PUUID endpoint."""
-        base_url = self.get_base_url(region)
-        url = f"{base_url}/lol/match/v5/matches/by-puuid/{puuid}/ids"
+        url = self.build(
+            RiotRoute.MATCH_IDS_BY_PUUID, self.get_base_url(region), puuid=puuid
+        )
 
         params: list[str] = []
         params.append(f"start={start}")
@@ -85,24 +142,57 @@ class RiotAPIEndpoints:
 
     def match_by_id(self, match_id: str, region: Optional[Region] = None) -> str:
         """Get match by ID endpoint."""
-        base_url = self.get_base_url(region)
-        return f"{base_url}/lol/match/v5/matches/{match_id}"
+        return self.build(
+            RiotRoute.MATCH_BY_ID, self.get_base_url(region), match_id=match_id
+        )
 
     # League endpoints (Platform)
     def league_entries_by_puuid(
         self, puuid: str, platform: Optional[Platform] = None
     ) -> str:
         """Get league entries by PUUID endpoint."""
-        platform_url = self.get_platform_url(platform)
-        return f"{platform_url}/lol/league/v4/entries/by-puuid/{puuid}"
+        return self.build(
+            RiotRoute.LEAGUE_ENTRIES_BY_PUUID,
+            self.get_platform_url(platform),
+            puuid=puuid,
+        )
+
+
+def resolve_route(url: str) -> Tuple[str, Optional[RiotRoute]]:
+    """
+    Resolve a request URL to its routing value and named route.
 
+    Example: "https://europe.api.riotgames.com/lol/match/v5/matches/EUN1_1"
+    -> ("europe", RiotRoute.MATCH_BY_ID)
 
+    Args:
+        url: Full request URL (query string is ignored)
+
+    Returns:
+        Tuple of (routing value, route or None for unknown paths)
+    """
+    parts = urlsplit(url if "://" in url else f"https://{url}")
+    host = parts.netloc
+    if host.endswith(RIOT_API_HOST_SUFFIX):
+        host = host[: -len(RIOT_API_HOST_SUFFIX)]
+
+    for route, pattern in _ROUTE_PATTERNS:
+        if pattern.match(parts.path):
+            return host, route
+
+    return host, None
+
+
+@lru_cache(maxsize=256)
 def parse_rate_limit_header(header_value: str) -> List[Dict[str, int]]:
     """
     Parse rate limit header value.
 
     Example: "20:1,100:120" -> [{"requests": 20, "window": 1}, {"requests": 100, "window": 120}]
 
+    Results are cached (the same values repeat on every response), so the
+    returned list must not be modified.
+
     Args:
         header_value: Rate limit header value
 
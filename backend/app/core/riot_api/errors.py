@@ -73,6 +73,12 @@ class ServiceUnavailableError(RiotAPIError):
     pass
 
 
+class CircuitOpenError(RiotAPIError):
+    """Circuit open - the route is failing, request was not sent."""
+
+    pass
+
+
 class BadRequestError(RiotAPIError):
     """Bad request (400) - invalid parameters."""
 
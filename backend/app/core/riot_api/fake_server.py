@@ -0,0 +1,622 @@
+"""
+Local stand-in for the Riot API.
+
+Serves account-v1, summoner-v4, match-v5 and league-v4 from a synthetic
+dataset and enforces app and method rate limits the way Riot does, with the
+same X-App-Rate-Limit(-Count), X-Method-Rate-Limit(-Count), Retry-After and
+X-Rate-Limit-Type headers. Latency, 5xx and service 429s can be injected, at
+random or on demand, so the client, the rate limiter and the jobs can be
+exercised without a live API key.
+
+In-process (no sockets), e.g. in a test or a benchmark:
+
+    fake = FakeRiotAPI(app_limits="20:1,100:120")
+    client = RiotAPIClient(api_key="RGAPI-fake", transport=fake.transport())
+
+On localhost, for the whole backend (set RIOT_API_BASE_URL=http://127.0.0.1:8081):
+
+    docker compose exec backend uv run python -m app.core.riot_api.fake_server \\
+        --port 8081 --players 200 --latency 0.05 --error-rate 0.01
+"""
+
+import argparse
+import asyncio
+import math
+import random
+import time
+from collections import deque
+from typing import Any, Deque, Dict, List, Optional, Tuple
+
+import httpx
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse, Response
+
+from .constants import RateLimitScope, RiotRoute
+from .endpoints import RIOT_API_HOST_SUFFIX, ROUTE_TEMPLATES, parse_rate_limit_header
+
+# Method limits of a personal key, per routing value
+DEFAULT_METHOD_LIMITS: Dict[RiotRoute, str] = {
+    RiotRoute.ACCOUNT_BY_RIOT_ID: "1000:60",
+    RiotRoute.ACCOUNT_BY_PUUID: "1000:60",
+    RiotRoute.SUMMONER_BY_PUUID: "1600:60",
+    RiotRoute.MATCH_IDS_BY_PUUID: "2000:10",
+    RiotRoute.MATCH_BY_ID: "2000:10",
+    RiotRoute.LEAGUE_ENTRIES_BY_PUUID: "20000:10",
+}
+
+_TIERS = ["IRON", "BRONZE", "SILVER", "GOLD", "PLATINUM", "EMERALD", "DIAMOND"]
+_RANKS = ["IV", "III", "II", "I"]
+_POSITIONS = ["TOP", "JUNGLE", "MIDDLE", "BOTTOM", "UTILITY"]
+
+
+class FakeRiotDataset:
+    """Deterministic synthetic players and the matches they played together."""
+
+    def __init__(
+        self,
+        players: int = 50,
+        matches_per_player: int = 40,
+        seed: int = 0,
+        platform: str = "eun1",
+        queue: int = 420,
+        newest_game: Optional[int] = None,
+    ):
+        """
+        Generate the dataset.
+
+        Args:
+            players: Number of players (at least 10, a match has 10)
+            matches_per_player: Average number of matches per player
+            seed: Seed of the generator, equal seeds give equal datasets
+            platform: Platform of the players and matches
+            queue: Queue ID of every match
+            newest_game: Creation time of the newest match in epoch ms (now if None)
+        """
+        rng = random.Random(seed)
+        players = max(10, players)
+        self.platform = platform.lower()
+        self.accounts: Dict[str, Dict[str, Any]] = {}
+        self.summoners: Dict[str, Dict[str, Any]] = {}
+        self.league_entries: Dict[str, List[Dict[str, Any]]] = {}
+        self.matches: Dict[str, Dict[str, Any]] = {}
+        # Match IDs of every player, newest first like the API returns them
+        self.match_ids: Dict[str, List[str]] = {}
+        self._riot_ids: Dict[Tuple[str, str], str] = {}
+
+        for index in range(players):
+            puuid = f"fake-puuid-{index:05d}".ljust(78, "0")
+            game_name = f"FakePlayer{index}"
+            tag_line = self.platform.upper()[:4]
+            self.add_player(
+                puuid,
+                game_name,
+                tag_line,
+                summoner_level=rng.randint(30, 700),
+                tier=rng.choice(_TIERS),
+                rank=rng.choice(_RANKS),
+                wins=rng.randint(10, 300),
+                losses=rng.randint(10, 300),
+            )
+
+        newest_game = newest_game or int(time.time() * 1000)
+        puuids = list(self.accounts)
+        for index in range(players * matches_per_player // 10):
+            created = newest_game - index * 40 * 60 * 1000
+            self.add_match(
+                self._build_match(rng, index, rng.sample(puuids, 10), created, queue)
+            )
+
+    def add_player(
+        self,
+        puuid: str,
+        game_name: str,
+        tag_line: str,
+        summoner_level: int = 100,
+        tier: Optional[str] = "GOLD",
+        rank: str = "IV",
+        wins: int = 50,
+        losses: int = 50,
+    ) -> None:
+        """
+        Add a player (account, summoner and, if tier is set, a solo queue entry).
+
+        Args:
+            puuid: Player PUUID
+            game_name: Riot ID game name
+            tag_line: Riot ID tag line
+            summoner_level: Summoner level
+            tier: Solo queue tier, None for an unranked player
+            rank: Solo queue division
+            wins: Solo queue wins
+            losses: Solo queue losses
+        """
+        self.accounts[puuid] = {
+            "puuid": puuid,
+            "gameName": game_name,
+            "tagLine": tag_line,
+        }
+        self._riot_ids[(game_name.lower(), tag_line.lower())] = puuid
+        self.summoners[puuid] = {
+            "puuid": puuid,
+            "profileIconId": summoner_level % 30,
+            "revisionDate": int(time.time() * 1000),
+            "summonerLevel": summoner_level,
+        }
+        self.league_entries[puuid] = (
+            [
+                {
+                    "leagueId": f"fake-league-{tier.lower()}",
+                    "puuid": puuid,
+                    "queueType": "RANKED_SOLO_5x5",
+                    "tier": tier,
+                    "rank": rank,
+                    "leaguePoints": (wins * 7) % 100,
+                    "wins": wins,
+                    "losses": losses,
+                    "veteran": False,
+                    "inactive": False,
+                    "freshBlood": False,
+                    "hotStreak": False,
+                }
+            ]
+            if tier
+            else []
+        )
+        self.match_ids.setdefault(puuid, [])
+
+    def add_match(self, match: Dict[str, Any]) -> None:
+        """
+        Add a match payload and list it in the history of its participants.
+
+        Args:
+            match: Match payload shaped like a match-v5 response
+        """
+        match_id = match["metadata"]["matchId"]
+        self.matches[match_id] = match
+        for puuid in match["metadata"]["participants"]:
+            history = self.match_ids.setdefault(puuid, [])
+            history.append(match_id)
+            history.sort(
+                key=lambda known: self.matches[known]["info"]["gameCreation"],
+                reverse=True,
+            )
+
+    def puuid_by_riot_id(self, game_name: str, tag_line: str) -> Optional[str]:
+        """Return the PUUID of a Riot ID (case-insensitive), None if unknown."""
+        return self._riot_ids.get((game_name.lower(), tag_line.lower()))
+
+    def _build_match(
+        self,
+        rng: random.Random,
+        index: int,
+        puuids: List[str],
+        created: int,
+        queue: int,
+    ) -> Dict[str, Any]:
+        """Build a match-v5 payload of 10 players (first 5 on the blue team)."""
+        game_id = 3_000_000_000 - index
+        duration = rng.randint(15 * 60, 45 * 60)
+        blue_won = rng.random() < 0.5
+        participants = []
+        for slot, puuid in enumerate(puuids):
+            account = self.accounts[puuid]
+            team_id = 100 if slot < 5 else 200
+            minutes = duration / 60
+            participants.append(
+                {
+                    "puuid": puuid,
+                    "summonerName": account["gameName"],
+                    "summonerLevel": self.summoners[puuid]["summonerLevel"],
+                    "riotIdGameName": account["gameName"],
+                    "riotIdTagline": account["tagLine"],
+                    "teamId": team_id,
+                    "win": blue_won == (team_id == 100),
+                    "championId": rng.randint(1, 950),
+                    "championName": f"Champion{rng.randint(1, 170)}",
+                    "kills": rng.randint(0, 20),
+                    "deaths": rng.randint(0, 15),
+                    "assists": rng.randint(0, 25),
+                    "champLevel": rng.randint(9, 18),
+                    "visionScore": float(rng.randint(5, 80)),
+                    "goldEarned": int(minutes * rng.randint(250, 500)),
+                    "totalMinionsKilled": int(minutes * rng.uniform(1, 9)),
+                    "neutralMinionsKilled": rng.randint(0, 150),
+                    "totalDamageDealt": rng.randint(40_000, 250_000),
+                    "totalDamageDealtToChampions": rng.randint(5_000, 60_000),
+                    "totalDamageTaken": rng.randint(8_000, 50_000),
+                    "totalHeal": rng.randint(500, 20_000),
+                    "role": "SOLO",
+                    "individualPosition": _POSITIONS[slot % 5],
+                    "teamPosition": _POSITIONS[slot % 5],
+                    "challenges": {
+                        f"challenge{n}": rng.random() * 10 for n in range(100)
+                    },
+                }
+            )
+
+        return {
+            "metadata": {
+                "dataVersion": "2",
+                "matchId": f"{self.platform.upper()}_{game_id}",
+                "participants": puuids,
+            },
+            "info": {
+                "gameCreation": created,
+                "gameStartTimestamp": created + 30_000,
+                "gameEndTimestamp": created + 30_000 + duration * 1000,
+                "gameDuration": duration,
+                "gameId": game_id,
+                "gameMode": "CLASSIC",
+                "gameType": "MATCHED_GAME",
+                "gameVersion": "14.20.628.2870",
+                "mapId": 11,
+                "participants": participants,
+                "platformId": self.platform.upper(),
+                "queueId": queue,
+                "teams": [
+                    {"teamId": team_id, "win": blue_won == (team_id == 100)}
+                    for team_id in (100, 200)
+                ],
+            },
+        }
+
+
+class FakeRateLimit:
+    """Sliding-window limits of one scope, counted like Riot counts them."""
+
+    def __init__(self, spec: str):
+        """
+        Initialize limits.
+
+        Args:
+            spec: Limits in header format, e.g. "20:1,100:120"
+        """
+        self.spec = spec
+        self.limits = [
+            (limit["requests"], limit["window"])
+            for limit in parse_rate_limit_header(spec)
+        ]
+        longest = max((window for _, window in self.limits), default=0)
+        self.longest = longest
+        self.requests: Deque[float] = deque()
+
+    def retry_after(self, now: float) -> float:
+        """Return seconds until a request fits every window (0 if it fits now)."""
+        self._prune(now)
+        wait = 0.0
+        for limit, window in self.limits:
+            in_window = [issued for issued in self.requests if issued > now - window]
+            if len(in_window) >= limit:
+                oldest = in_window[len(in_window) - limit]
+                wait = max(wait, oldest + window - now)
+        return wait
+
+    def hit(self, now: float) -> None:
+        """Count a request."""
+        self.requests.append(now)
+
+    def counts(self, now: float) -> str:
+        """Return the usage header value, e.g. "3:1,40:120"."""
+        return ",".join(
+            f"{sum(1 for issued in self.requests if issued > now - window)}:{window}"
+            for _, window in self.limits
+        )
+
+    def _prune(self, now: float) -> None:
+        """Forget requests older than the longest window."""
+        while self.requests and self.requests[0] <= now - self.longest:
+            self.requests.popleft()
+
+
+class FakeRiotAPI:
+    """ASGI app serving a FakeRiotDataset behind Riot-like rate limits.
+
+    Limits are tracked per routing value (the host the request was sent to),
+    the app limit across all routes and method limits per route. Requests
+    rejected with a 429 do not count, like on the real API.
+    """
+
+    def __init__(
+        self,
+        dataset: Optional[FakeRiotDataset] = None,
+        api_key: Optional[str] = None,
+        app_limits: str = "20:1,100:120",
+        method_limits: Optional[Dict[RiotRoute, str]] = None,
+        latency: float = 0.0,
+        latency_jitter: float = 0.0,
+        error_rate: float = 0.0,
+        service_429_rate: float = 0.0,
+        seed: int = 0,
+    ):
+        """
+        Initialize the fake API.
+
+        Args:
+            dataset: Data to serve (a default FakeRiotDataset if None)
+            api_key: Required X-Riot-Token, any token is accepted if None
+            app_limits: App rate limits in header format
+            method_limits: Method rate limits per route (personal key defaults)
+            latency: Seconds added to every response
+            latency_jitter: Up to this many seconds added at random
+            error_rate: Share of requests answered with a 503
+            service_429_rate: Share of requests answered with a service 429
+            seed: Seed of the fault injection
+        """
+        self.dataset = dataset or FakeRiotDataset()
+        self.api_key = api_key
+        self.app_limits = app_limits
+        self.method_limits = {**DEFAULT_METHOD_LIMITS, **(method_limits or {})}
+        self.latency = latency
+        self.latency_jitter = latency_jitter
+        self.error_rate = error_rate
+        self.service_429_rate = service_429_rate
+        self.rng = random.Random(seed)
+
+        self.request_counts: Dict[str, int] = {}
+        self._limits: Dict[Tuple[str, str], FakeRateLimit] = {}
+        # Queued failures as (route or None for any, status, Retry-After)
+        self._failures: Deque[Tuple[Optional[RiotRoute], int, Optional[int]]] = deque()
+
+        self.app = FastAPI(title="Fake Riot API", docs_url=None, redoc_url=None)
+        self._add_routes()
+
+    async def __call__(self, scope, receive, send) -> None:
+        """Serve ASGI requests."""
+        await self.app(scope, receive, send)
+
+    def transport(self) -> httpx.ASGITransport:
+        """Return an httpx transport that serves requests in-process."""
+        return httpx.ASGITransport(app=self)
+
+    def fail_next(
+        self,
+        count: int = 1,
+        status: int = 503,
+        route: Optional[RiotRoute] = None,
+        retry_after: Optional[int] = None,
+    ) -> None:
+        """
+        Answer the next requests with an error, before any limit is checked.
+
+        A 429 is sent as a service rate limit (no X-Rate-Limit-Type).
+
+        Args:
+            count: Number of requests to fail
+            status: Status code to answer with
+            route: Only fail requests of this route (any route if None)
+            retry_after: Retry-After header to send, if any
+        """
+        for _ in range(count):
+            self._failures.append((route, status, retry_after))
+
+    def reset_limits(self) -> None:
+        """Forget all counted requests."""
+        self._limits.clear()
+
+    def _add_routes(self) -> None:
+        """Register a handler for every route of ROUTE_TEMPLATES."""
+        handlers = {
+            RiotRoute.ACCOUNT_BY_RIOT_ID: self._account_by_riot_id,
+            RiotRoute.ACCOUNT_BY_PUUID: self._account_by_puuid,
+            RiotRoute.SUMMONER_BY_PUUID: self._summoner_by_puuid,
+            RiotRoute.MATCH_IDS_BY_PUUID: self._match_ids_by_puuid,
+            RiotRoute.MATCH_BY_ID: self._match_by_id,
+            RiotRoute.LEAGUE_ENTRIES_BY_PUUID: self._league_entries_by_puuid,
+        }
+        for route, template in ROUTE_TEMPLATES.items():
+            self.app.add_api_route(
+                template, self._endpoint(route, handlers[route]), methods=["GET"]
+            )
+
+    def _endpoint(self, route: RiotRoute, handler):
+        """Wrap a handler with authentication, fault injection and limits."""
+
+        async def endpoint(request: Request) -> Response:
+            self.request_counts[route.value] = (
+                self.request_counts.get(route.value, 0) + 1
+            )
+            await self._delay()
+
+            if self.api_key is not None:
+                token = request.headers.get("X-Riot-Token")
+                if not token:
+                    return self._status(401, "Unauthorized")
+                if token != self.api_key:
+                    return self._status(403, "Forbidden")
+
+            injected = self._injected_failure(route)
+            if injected is not None:
+                return injected
+
+            routing = request.headers.get("host", "").split(":")[0]
+            routing = routing.removesuffix(RIOT_API_HOST_SUFFIX)
+            now = time.monotonic()
+            app_limit = self._limit(routing, "app", self.app_limits)
+            method_limit = self._limit(routing, route.value, self.method_limits[route])
+
+            for scope, limit in (
+                (RateLimitScope.APPLICATION, app_limit),
+                (RateLimitScope.METHOD, method_limit),
+            ):
+                wait = limit.retry_after(now)
+                if wait > 0:
+                    response = self._status(429, "Rate limit exceeded")
+                    response.headers["Retry-After"] = str(math.ceil(wait))
+                    response.headers["X-Rate-Limit-Type"] = scope.value
+                    self._add_limit_headers(response, app_limit, method_limit, now)
+                    return response
+
+            app_limit.hit(now)
+            method_limit.hit(now)
+            response = handler(request, **request.path_params)
+            self._add_limit_headers(response, app_limit, method_limit, now)
+            return response
+
+        return endpoint
+
+    async def _delay(self) -> None:
+        """Wait the configured latency."""
+        delay = self.latency
+        if self.latency_jitter:
+            delay += self.rng.uniform(0, self.latency_jitter)
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+    def _injected_failure(self, route: RiotRoute) -> Optional[Response]:
+        """Return a queued or random failure for this request, if any."""
+        return self._queued_failure(route) or self._random_failure()
+
+    def _queued_failure(self, route: RiotRoute) -> Optional[Response]:
+        """Pop the first failure queued by fail_next for route, if any."""
+        for index, (failing_route, status, retry_after) in enumerate(self._failures):
+            if failing_route in (None, route):
+                del self._failures[index]
+                response = self._status(status, "Injected failure")
+                if retry_after is not None:
+                    response.headers["Retry-After"] = str(retry_after)
+                return response
+        return None
+
+    def _random_failure(self) -> Optional[Response]:
+        """Return a 503 or service 429 at the configured rates, if drawn."""
+        if self.error_rate and self.rng.random() < self.error_rate:
+            return self._status(503, "Service unavailable")
+        if self.service_429_rate and self.rng.random() < self.service_429_rate:
+            return self._status(429, "Rate limit exceeded")
+        return None
+
+    def _limit(self, routing: str, key: str, spec: str) -> FakeRateLimit:
+        """Return the limits of a scope on a routing value."""
+        limit = self._limits.get((routing, key))
+        if limit is None or limit.spec != spec:
+            limit = FakeRateLimit(spec)
+            self._limits[(routing, key)] = limit
+        return limit
+
+    @staticmethod
+    def _add_limit_headers(
+        response: Response,
+        app_limit: FakeRateLimit,
+        method_limit: FakeRateLimit,
+        now: float,
+    ) -> None:
+        """Add the rate limit headers Riot sends with every response."""
+        response.headers["X-App-Rate-Limit"] = app_limit.spec
+        response.headers["X-App-Rate-Limit-Count"] = app_limit.counts(now)
+        response.headers["X-Method-Rate-Limit"] = method_limit.spec
+        response.headers["X-Method-Rate-Limit-Count"] = method_limit.counts(now)
+
+    @staticmethod
+    def _status(status: int, message: str) -> JSONResponse:
+        """Build an error response shaped like Riot's."""
+        return JSONResponse(
+            {"status": {"message": message, "status_code": status}},
+            status_code=status,
+        )
+
+    def _account_by_riot_id(
+        self, request: Request, game_name: str, tag_line: str
+    ) -> Response:
+        """Serve account-v1 by Riot ID."""
+        puuid = self.dataset.puuid_by_riot_id(game_name, tag_line)
+        if puuid is None:
+            return self._status(404, "Data not found - No results found")
+        return JSONResponse(self.dataset.accounts[puuid])
+
+    def _account_by_puuid(self, request: Request, puuid: str) -> Response:
+        """Serve account-v1 by PUUID."""
+        account = self.dataset.accounts.get(puuid)
+        if account is None:
+            return self._status(404, "Data not found - No results found")
+        return JSONResponse(account)
+
+    def _summoner_by_puuid(self, request: Request, puuid: str) -> Response:
+        """Serve summoner-v4 by PUUID."""
+        summoner = self.dataset.summoners.get(puuid)
+        if summoner is None:
+            return self._status(404, "Data not found - summoner not found")
+        return JSONResponse(summoner)
+
+    def _match_ids_by_puuid(self, request: Request, puuid: str) -> Response:
+        """Serve match-v5 match IDs by PUUID, newest first, with its filters."""
+        params = request.query_params
+        try:
+            start = int(params.get("start", 0))
+            count = int(params.get("count", 20))
+            queue = params.get("queue")
+            start_time = int(params.get("startTime", 0))
+            end_time = int(params.get("endTime", 2**63))
+        except ValueError:
+            return self._status(400, "Bad request")
+        if not 0 <= count <= 100 or start < 0:
+            return self._status(400, "Bad request - count must be 0-100")
+
+        match_ids = [
+            match_id
+            for match_id in self.dataset.match_ids.get(puuid, [])
+            if self._match_listed(match_id, queue, start_time, end_time)
+        ]
+        # Unknown players get an empty list, not a 404
+        return JSONResponse(match_ids[start : start + count])
+
+    def _match_listed(
+        self, match_id: str, queue: Optional[str], start_time: int, end_time: int
+    ) -> bool:
+        """Return whether a match passes the queue and time filters."""
+        info = self.dataset.matches[match_id]["info"]
+        created = info["gameCreation"] // 1000
+        if queue is not None and str(info["queueId"]) != queue:
+            return False
+        return start_time <= created <= end_time
+
+    def _match_by_id(self, request: Request, match_id: str) -> Response:
+        """Serve match-v5 match by ID."""
+        match = self.dataset.matches.get(match_id)
+        if match is None:
+            return self._status(404, "Data not found - match file not found")
+        return JSONResponse(match)
+
+    def _league_entries_by_puuid(self, request: Request, puuid: str) -> Response:
+        """Serve league-v4 entries by PUUID."""
+        if puuid not in self.dataset.accounts:
+            return self._status(404, "Data not found - summoner not found")
+        return JSONResponse(self.dataset.league_entries[puuid])
+
+
+def main() -> None:
+    """Serve the fake API on localhost."""
+    parser = argparse.ArgumentParser(description=__doc__.strip().split("\n")[0])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8081)
+    parser.add_argument("--players", type=int, default=50)
+    parser.add_argument("--matches-per-player", type=int, default=40)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--api-key", help="Required X-Riot-Token (any if unset)")
+    parser.add_argument("--app-limits", default="20:1,100:120")
+    parser.add_argument("--latency", type=float, default=0.0)
+    parser.add_argument("--latency-jitter", type=float, default=0.0)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--service-429-rate", type=float, default=0.0)
+    args = parser.parse_args()
+
+    import uvicorn
+
+    fake = FakeRiotAPI(
+        dataset=FakeRiotDataset(
+            players=args.players,
+            matches_per_player=args.matches_per_player,
+            seed=args.seed,
+        ),
+        api_key=args.api_key,
+        app_limits=args.app_limits,
+        latency=args.latency,
+        latency_jitter=args.latency_jitter,
+        error_rate=args.error_rate,
+        service_429_rate=args.service_429_rate,
+        seed=args.seed,
+    )
+    uvicorn.run(fake, host=args.host, port=args.port)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,445 @@
+"""Latency and queueing metrics of the Riot API client in Prometheus format."""
+
+import hashlib
+from bisect import bisect_left
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+import structlog
+
+from .endpoints import resolve_route
+
+logger = structlog.get_logger(__name__)
+
+# Seconds, from a free permit / cached connection up to a full window wait
+LATENCY_BUCKETS: Tuple[float, ...] = (
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+    30.0,
+    60.0,
+    120.0,
+)
+# Seconds spent turning a response body into DTOs
+DECODE_BUCKETS: Tuple[float, ...] = (
+    0.0001,
+    0.00025,
+    0.0005,
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+)
+# Response body sizes, from an account (~200 B) to a full match (~100 KiB+)
+SIZE_BUCKETS: Tuple[float, ...] = (
+    256,
+    1024,
+    4096,
+    16384,
+    65536,
+    131072,
+    262144,
+    524288,
+    1048576,
+)
+# HTTP attempts per call (1 means no retry)
+ATTEMPT_BUCKETS: Tuple[float, ...] = (1, 2, 3, 4)
+
+UNKNOWN_ROUTE = "unknown"
+
+Labels = Tuple[Tuple[str, str], ...]
+
+
+def route_label(url: str) -> str:
+    """Return the route template of url used as metric label."""
+    _, route = resolve_route(url)
+    return route.value if route is not None else UNKNOWN_ROUTE
+
+
+def _format_labels(labels: Labels) -> str:
+    """Format labels as `{name="value",...}` with Prometheus escaping."""
+    if not labels:
+        return ""
+    pairs = ",".join(
+        '{}="{}"'.format(
+            name,
+            str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n"),
+        )
+        for name, value in labels
+    )
+    return "{" + pairs + "}"
+
+
+def _format_value(value: float) -> str:
+    """Format a sample value (integers without a trailing .0)."""
+    if value == int(value):
+        return str(int(value))
+    return repr(float(value))
+
+
+class Histogram:
+    """Cumulative histogram with fixed buckets, one series per label set."""
+
+    def __init__(self, name: str, documentation: str, buckets: Sequence[float]):
+        """
+        Initialize histogram.
+
+        Args:
+            name: Metric name
+            documentation: HELP text
+            buckets: Upper bounds of the buckets, ascending (+Inf is implied)
+        """
+        self.name = name
+        self.documentation = documentation
+        self.buckets = tuple(buckets)
+        # Per label set: non-cumulative counts per bucket (+Inf last), sum
+        self.series: Dict[Labels, Tuple[List[int], List[float]]] = {}
+
+    def observe(self, value: float, **labels: str) -> None:
+        """Add an observation to the series of labels."""
+        key = tuple(sorted(labels.items()))
+        series = self.series.get(key)
+        if series is None:
+            series = ([0] * (len(self.buckets) + 1), [0.0])
+            self.series[key] = series
+        counts, total = series
+        counts[bisect_left(self.buckets, value)] += 1
+        total[0] += value
+
+    def mean(self, **labels: str) -> Optional[float]:
+        """Return the mean of the series of labels (None without observations)."""
+        series = self.series.get(tuple(sorted(labels.items())))
+        if series is None:
+            return None
+        counts, total = series
+        observed = sum(counts)
+        return total[0] / observed if observed else None
+
+    def render(self) -> List[str]:
+        """Return the exposition lines of every series."""
+        lines = [
+            f"# HELP {self.name} {self.documentation}",
+            f"# TYPE {self.name} histogram",
+        ]
+        for labels, (counts, total) in sorted(self.series.items()):
+            cumulative = 0
+            for bound, count in zip(self.buckets + (float("inf"),), counts):
+                cumulative += count
+                le = "+Inf" if bound == float("inf") else _format_value(bound)
+                lines.append(
+                    f"{self.name}_bucket{_format_labels(labels + (('le', le),))} "
+                    f"{cumulative}"
+                )
+            lines.append(
+                f"{self.name}_sum{_format_labels(labels)} {_format_value(total[0])}"
+            )
+            lines.append(f"{self.name}_count{_format_labels(labels)} {cumulative}")
+        return lines
+
+
+class Counter:
+    """Monotonic counter, one series per label set."""
+
+    def __init__(self, name: str, documentation: str):
+        """
+        Initialize counter.
+
+        Args:
+            name: Metric name (should end in _total)
+            documentation: HELP text
+        """
+        self.name = name
+        self.documentation = documentation
+        self.series: Dict[Labels, float] = {}
+
+    def inc(self, amount: float = 1.0, **labels: str) -> None:
+        """Add amount to the series of labels."""
+        key = tuple(sorted(labels.items()))
+        self.series[key] = self.series.get(key, 0.0) + amount
+
+    def render(self) -> List[str]:
+        """Return the exposition lines of every series."""
+        lines = [
+            f"# HELP {self.name} {self.documentation}",
+            f"# TYPE {self.name} counter",
+        ]
+        for labels, value in sorted(self.series.items()):
+            lines.append(f"{self.name}{_format_labels(labels)} {_format_value(value)}")
+        return lines
+
+
+class Gauge:
+    """Point-in-time values collected at scrape time."""
+
+    def __init__(self, name: str, documentation: str):
+        """
+        Initialize gauge.
+
+        Args:
+            name: Metric name
+            documentation: HELP text
+        """
+        self.name = name
+        self.documentation = documentation
+        self.series: Dict[Labels, float] = {}
+
+    def set(self, value: float, **labels: str) -> None:
+        """Set the series of labels to value."""
+        self.series[tuple(sorted(labels.items()))] = value
+
+    def render(self) -> List[str]:
+        """Return the exposition lines of every series."""
+        lines = [
+            f"# HELP {self.name} {self.documentation}",
+            f"# TYPE {self.name} gauge",
+        ]
+        for labels, value in sorted(self.series.items()):
+            lines.append(f"{self.name}{_format_labels(labels)} {_format_value(value)}")
+        return lines
+
+
+class RiotAPIMetrics:
+    """Where the time of Riot API calls goes, per route template.
+
+    A call first waits for a rate limit permit, then for the network, then
+    for decoding; comparing the three histograms tells whether a slow job is
+    limiter-bound, network-bound or parse-bound.
+    """
+
+    def __init__(self):
+        """Initialize empty metrics."""
+        self.limiter_wait = Histogram(
+            "riot_api_limiter_wait_seconds",
+            "Time spent waiting for a rate limit permit, per attempt.",
+            LATENCY_BUCKETS,
+        )
+        self.request_duration = Histogram(
+            "riot_api_request_duration_seconds",
+            "Time from sending a request to having read the response body.",
+            LATENCY_BUCKETS,
+        )
+        self.decode_duration = Histogram(
+            "riot_api_decode_seconds",
+            "Time spent decoding response bodies.",
+            DECODE_BUCKETS,
+        )
+        self.response_size = Histogram(
+            "riot_api_response_bytes",
+            "Size of response bodies received.",
+            SIZE_BUCKETS,
+        )
+        self.attempts = Histogram(
+            "riot_api_attempts",
+            "HTTP attempts per call, including retries.",
+            ATTEMPT_BUCKETS,
+        )
+        self.responses = Counter(
+            "riot_api_responses_total", "Responses received, by status code."
+        )
+        self.rate_limited = Counter(
+            "riot_api_rate_limited_total", "429 responses, by rate limit scope."
+        )
+        self.retries = Counter("riot_api_retries_total", "Attempts retried, by reason.")
+        self.cached_not_found = Counter(
+            "riot_api_cached_not_found_total",
+            "Calls answered with a remembered 404 instead of a request.",
+        )
+
+    def observe_limiter_wait(self, route: str, seconds: float) -> None:
+        """Record the wait for one permit."""
+        self.limiter_wait.observe(seconds, route=route)
+
+    def observe_response(
+        self, route: str, status: int, seconds: float, size: int
+    ) -> None:
+        """Record the latency, status and body size of one response."""
+        self.request_duration.observe(seconds, route=route)
+        self.response_size.observe(size, route=route)
+        self.responses.inc(route=route, status=str(status))
+
+    def observe_decode(self, route: str, seconds: float) -> None:
+        """Record the decoding of one response body."""
+        self.decode_duration.observe(seconds, route=route)
+
+    def observe_attempts(self, route: str, attempts: int) -> None:
+        """Record the attempts one call needed, successful or not."""
+        self.attempts.observe(attempts, route=route)
+
+    def count_rate_limited(self, route: str, scope: str) -> None:
+        """Count a 429 response of a rate limit scope."""
+        self.rate_limited.inc(route=route, scope=scope)
+
+    def count_retry(self, route: str, reason: str) -> None:
+        """Count an attempt that is retried (rate_limit, server_error, transport)."""
+        self.retries.inc(route=route, reason=reason)
+
+    def count_cached_not_found(self, route: str) -> None:
+        """Count a call answered by the 404 cache."""
+        self.cached_not_found.inc(route=route)
+
+    def render(self) -> List[str]:
+        """Return the exposition lines of the request metrics."""
+        lines: List[str] = []
+        for metric in (
+            self.limiter_wait,
+            self.request_duration,
+            self.decode_duration,
+            self.response_size,
+            self.attempts,
+            self.responses,
+            self.rate_limited,
+            self.retries,
+            self.cached_not_found,
+        ):
+            lines.extend(metric.render())
+        return lines
+
+
+# Process-wide metrics shared by every client, exposed on /metrics
+riot_api_metrics = RiotAPIMetrics()
+
+
+def _key_id(api_key: str) -> str:
+    """Return a short, non-secret label identifying an API key."""
+    return hashlib.sha256(api_key.encode()).hexdigest()[:8]
+
+
+class _ClientGauges:
+    """Gauges read from the clients at scrape time."""
+
+    def __init__(self):
+        """Initialize empty gauges."""
+        self.limit = Gauge(
+            "riot_api_rate_limit", "Requests allowed per rate limit window."
+        )
+        self.remaining = Gauge(
+            "riot_api_rate_limit_remaining",
+            "Requests left in a rate limit window.",
+        )
+        self.next_permit = Gauge(
+            "riot_api_rate_limit_next_permit_seconds",
+            "Seconds until a rate limit window issues its next permit.",
+        )
+        self.cooldown = Gauge(
+            "riot_api_cooldown_seconds",
+            "Seconds left of an active 429 cooldown.",
+        )
+        self.backoff_count = Counter(
+            "riot_api_backoff_total", "Cooldowns and backoffs started, by reason."
+        )
+        self.backoff_seconds = Counter(
+            "riot_api_backoff_seconds_total",
+            "Seconds requests were held back by cooldowns and backoff, by reason.",
+        )
+        self.circuit_open = Gauge(
+            "riot_api_circuit_open",
+            "Whether the circuit of a route is open or half-open (1) or closed (0).",
+        )
+        self.circuit_opened = Counter(
+            "riot_api_circuit_opened_total", "Times the circuit of a route opened."
+        )
+
+    async def collect(self, client: Any) -> None:
+        """Add the rate limit, backoff and circuit state of a client."""
+        key = _key_id(client.api_key)
+        await self._collect_rate_limits(key, client)
+        self._collect_backoff(key, client)
+        self._collect_circuits(key, client)
+
+    async def _collect_rate_limits(self, key: str, client: Any) -> None:
+        """Add the window budgets and active cooldowns of every routing value."""
+        try:
+            stats = await client.get_rate_limit_stats()
+        except Exception as e:
+            # Budgets live in the shared backend; keep serving the rest
+            logger.warning("Failed to collect rate limit stats", error=str(e))
+            stats = {}
+        for routing_value, partition in stats.items():
+            buckets = [("app", partition.get("app", []))] + list(
+                partition.get("methods", {}).items()
+            )
+            for bucket, windows in buckets:
+                self._collect_windows(key, routing_value, bucket, windows)
+            for scope, seconds in partition.get("cooldowns", {}).items():
+                self.cooldown.set(seconds, key=key, routing=routing_value, scope=scope)
+
+    def _collect_windows(
+        self, key: str, routing_value: str, bucket: str, windows: List[Dict[str, Any]]
+    ) -> None:
+        """Add the budget of every window of a bucket."""
+        for window in windows:
+            if window["window"] <= 0:
+                continue
+            labels = {
+                "key": key,
+                "routing": routing_value,
+                "bucket": bucket,
+                "window": str(window["window"]),
+            }
+            self.limit.set(window["limit"], **labels)
+            self.remaining.set(window["remaining"], **labels)
+            self.next_permit.set(max(0.0, window["next_permit_in"]), **labels)
+
+    def _collect_backoff(self, key: str, client: Any) -> None:
+        """Add the cooldown and backoff totals of a client, by reason."""
+        for reason, totals in client.get_cooldown_stats().items():
+            self.backoff_count.inc(totals["count"], key=key, reason=reason)
+            self.backoff_seconds.inc(totals["seconds"], key=key, reason=reason)
+
+    def _collect_circuits(self, key: str, client: Any) -> None:
+        """Add the circuit breaker state of a client, by route."""
+        for route, state in client.get_circuit_stats().items():
+            self.circuit_open.set(int(state["state"] != "closed"), key=key, route=route)
+            self.circuit_opened.inc(state["times_opened"], key=key, route=route)
+
+    def render(self) -> List[str]:
+        """Return the exposition lines of the gauges."""
+        lines: List[str] = []
+        for gauge in (
+            self.limit,
+            self.remaining,
+            self.next_permit,
+            self.cooldown,
+            self.backoff_count,
+            self.backoff_seconds,
+            self.circuit_open,
+            self.circuit_opened,
+        ):
+            lines.extend(gauge.render())
+        return lines
+
+
+async def render_prometheus(
+    clients: Iterable[Any], metrics: Optional[RiotAPIMetrics] = None
+) -> str:
+    """
+    Render Riot API metrics in the Prometheus text exposition format.
+
+    Request histograms come from the shared metrics; rate limit budgets,
+    cooldowns and circuit breaker states are read from the clients at scrape
+    time.
+
+    Args:
+        clients: RiotAPIClient instances to collect gauges from
+        metrics: Request metrics (process-wide metrics if None)
+
+    Returns:
+        Exposition text
+    """
+    metrics = metrics or riot_api_metrics
+    gauges = _ClientGauges()
+    for client in clients:
+        await gauges.collect(client)
+
+    lines = metrics.render() + gauges.render()
+    return "\n".join(lines) + "\n"
@@ -68,6 +68,8 @@ class ParticipantDTO(BaseModel):
         ..., alias="totalDamageDealtToChampions"
     )
     total_damage_taken: int = Field(..., alias="totalDamageTaken")
+    total_damage_dealt: int = Field(0, alias="totalDamageDealt")
+    total_heal: int = Field(0, alias="totalHeal")
     role: Optional[str] = None
     individual_position: Optional[str] = Field(None, alias="individualPosition")
     team_position: Optional[str] = Field(None, alias="teamPosition")
@@ -92,6 +94,7 @@ class MatchInfoDTO(BaseModel):
     game_version: str = Field(..., alias="gameVersion")
     game_mode: str = Field(..., alias="gameMode")
     game_type: str = Field(..., alias="gameType")
+    game_end_timestamp: Optional[int] = Field(None, alias="gameEndTimestamp")
     participants: List[ParticipantDTO]
     platform_id: str = Field(..., alias="platformId")
 
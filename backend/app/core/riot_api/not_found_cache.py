@@ -0,0 +1,192 @@
+"""Negative cache of Riot API 404s, persisted in core.riot_not_found."""
+
+import asyncio
+from typing import Dict, Optional
+
+import structlog
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from ..cache import TTLCache
+from ..config import get_global_settings
+from ..database import db_manager
+from .constants import RiotRoute
+from .endpoints import resolve_route
+
+logger = structlog.get_logger(__name__)
+
+# Routes whose 404 says the resource does not exist (rather than "no results")
+NOT_FOUND_ROUTES = frozenset(
+    {
+        RiotRoute.ACCOUNT_BY_RIOT_ID,
+        RiotRoute.ACCOUNT_BY_PUUID,
+        RiotRoute.SUMMONER_BY_PUUID,
+        RiotRoute.MATCH_BY_ID,
+    }
+)
+
+_LOAD_NOT_FOUND_SQL = text(
+    """
+    SELECT url, EXTRACT(EPOCH FROM expires_at - now())
+      FROM core.riot_not_found
+     WHERE expires_at > now()
+     ORDER BY expires_at DESC
+     LIMIT :limit
+    """
+)
+
+_PURGE_NOT_FOUND_SQL = text(
+    """
+    DELETE FROM core.riot_not_found
+     WHERE expires_at <= now()
+    """
+)
+
+_SAVE_NOT_FOUND_SQL = text(
+    """
+    INSERT INTO core.riot_not_found (url, expires_at)
+    VALUES (:url, now() + make_interval(secs => CAST(:ttl AS double precision)))
+    ON CONFLICT (url)
+    DO UPDATE SET expires_at = EXCLUDED.expires_at
+    """
+)
+
+
+class NotFoundCache:
+    """Remembers which account, summoner and match URLs returned 404.
+
+    A wrong Riot ID retried from the UI, or a PUUID that keeps 404ing in the
+    ban checker, would otherwise spend a rate limit permit on every attempt.
+    Known misses are answered locally until their TTL expires. Riot IDs get
+    a TTL of their own, short because a mistyped Riot ID may be an account
+    created or renamed minutes later. Entries are written to the database in
+    the background, in batches, and loaded when the first client of a
+    process starts, so they survive restarts; other running processes pick
+    them up on their next start.
+    """
+
+    def __init__(
+        self,
+        engine: AsyncEngine,
+        ttl: float,
+        maxsize: int,
+        riot_id_ttl: Optional[float] = None,
+    ):
+        """
+        Initialize negative cache.
+
+        Args:
+            engine: Async engine of the application database
+            ttl: Seconds a 404 is remembered (0 disables the cache)
+            maxsize: Maximum number of URLs kept in memory
+            riot_id_ttl: Seconds a 404 of an account by Riot ID is remembered
+                (0 never remembers it, None uses ttl)
+        """
+        self.engine = engine
+        self.ttl = ttl
+        self.riot_id_ttl = ttl if riot_id_ttl is None else min(riot_id_ttl, ttl)
+        self.entries: TTLCache[bool] = TTLCache(maxsize if ttl > 0 else 0, ttl)
+        self._restored = False
+        self._restore_lock = asyncio.Lock()
+        # 404s not written to the database yet, with their TTL
+        self._unsaved: Dict[str, float] = {}
+        self._save_task: Optional["asyncio.Task[None]"] = None
+
+    @property
+    def enabled(self) -> bool:
+        """Whether 404s are remembered."""
+        return self.ttl > 0
+
+    @staticmethod
+    def cacheable(url: str) -> bool:
+        """Return whether a 404 of url is remembered."""
+        _, route = resolve_route(url)
+        return route in NOT_FOUND_ROUTES
+
+    def ttl_of(self, url: str) -> float:
+        """Return the seconds a 404 of url is remembered (0 if it is not)."""
+        _, route = resolve_route(url)
+        if route == RiotRoute.ACCOUNT_BY_RIOT_ID:
+            return self.riot_id_ttl
+        return self.ttl if route in NOT_FOUND_ROUTES else 0.0
+
+    def is_known_missing(self, url: str) -> bool:
+        """Return whether url returned 404 within the TTL."""
+        return self.enabled and self.entries.get(url) is not None
+
+    def record(self, url: str) -> None:
+        """Remember a 404 of url, saved to the database in the background."""
+        ttl = self.ttl_of(url) if self.enabled else 0.0
+        if ttl <= 0:
+            return
+        self.entries.set(url, True, ttl=ttl)
+
+        self._unsaved[url] = ttl
+        if self._save_task is None or self._save_task.done():
+            self._save_task = asyncio.create_task(self._save_unsaved())
+
+    async def flush(self) -> None:
+        """Wait until every recorded 404 is written to the database."""
+        if self._save_task is not None:
+            await asyncio.shield(self._save_task)
+
+    async def _save_unsaved(self) -> None:
+        """Write recorded 404s in batches until none is left."""
+        # Let 404s of the same burst join the first batch
+        await asyncio.sleep(0)
+        while self._unsaved:
+            batch = [{"url": url, "ttl": ttl} for url, ttl in self._unsaved.items()]
+            self._unsaved.clear()
+            try:
+                async with self.engine.begin() as conn:
+                    await conn.execute(_SAVE_NOT_FOUND_SQL, batch)
+            except Exception as e:
+                logger.warning(
+                    "Failed to persist Riot API 404s", count=len(batch), error=str(e)
+                )
+
+    async def restore(self) -> None:
+        """Load unexpired 404s from the database on first use."""
+        if self._restored or not self.enabled:
+            return
+
+        async with self._restore_lock:
+            if self._restored:
+                return
+            self._restored = True
+
+            try:
+                async with self.engine.begin() as conn:
+                    await conn.execute(_PURGE_NOT_FOUND_SQL)
+                    rows = (
+                        await conn.execute(
+                            _LOAD_NOT_FOUND_SQL, {"limit": self.entries.maxsize}
+                        )
+                    ).all()
+                # Soonest to expire first, so they are the first evicted
+                for url, remaining in reversed(rows):
+                    ttl = min(float(remaining), self.ttl_of(url))
+                    if ttl > 0:
+                        self.entries.set(url, True, ttl=ttl)
+                if rows:
+                    logger.info("Restored Riot API 404s", count=len(rows))
+            except Exception as e:
+                logger.warning("Failed to restore Riot API 404s", error=str(e))
+
+
+# Process-wide negative cache (404s do not depend on the API key)
+_not_found_cache: Optional[NotFoundCache] = None
+
+
+def get_not_found_cache() -> NotFoundCache:
+    """Return the negative cache configured by RIOT_NOT_FOUND_TTL."""
+    global _not_found_cache
+    if _not_found_cache is None:
+        settings = get_global_settings()
+        _not_found_cache = NotFoundCache(
+            db_manager.engine,
+            settings.riot_not_found_ttl,
+            settings.riot_not_found_cache_size,
+            riot_id_ttl=settings.riot_not_found_riot_id_ttl,
+        )
+    return _not_found_cache
@@ -0,0 +1,762 @@
+"""Shared rate limit backends coordinating Riot API usage across processes."""
+
+import asyncio
+import fcntl
+import hashlib
+import json
+import os
+import time
+from contextlib import contextmanager
+from typing import (
+    Any,
+    BinaryIO,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    TypeVar,
+)
+
+import structlog
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncEngine
+
+from ..config import get_global_settings
+from ..database import db_manager
+from .rate_limiter import (
+    APP_COOLDOWN,
+    InMemoryRateLimitBackend,
+    RateLimitBackend,
+    RateLimiter,
+    RatePair,
+    RoutingPartition,
+)
+
+logger = structlog.get_logger(__name__)
+
+T = TypeVar("T")
+
+# Permits appended to a shared memory state file before it is compacted
+COMPACT_AFTER = 1000
+
+# Process-wide backends, one per API key
+_backends: Dict[str, RateLimitBackend] = {}
+
+
+class SharedMemoryRateLimitBackend(RateLimitBackend):
+    """Single-host backend keeping partitions in files on shared memory.
+
+    All processes on the host (uvicorn workers and the scheduler) open the
+    same files, by default on the /dev/shm tmpfs, and serialize access with an
+    exclusive flock. Every routing value has its own file, so requests to
+    different regions never wait for each other's lock. A file holds the
+    partition on its first line followed by one line per permit issued since:
+    a permit appends its line, and only every COMPACT_AFTER permits the file
+    is rewritten with the pruned partition. File I/O runs in a worker thread
+    to keep the event loop free while another process holds a lock.
+    """
+
+    def __init__(self, prefix: str):
+        """
+        Initialize backend.
+
+        Args:
+            prefix: Path prefix of the state files shared by all processes
+                using the same API key
+        """
+        self.prefix = prefix
+
+    def _path(self, routing_value: str) -> str:
+        """Return the state file of a routing value."""
+        return f"{self.prefix}.{routing_value}.json"
+
+    def _routing_values(self) -> List[str]:
+        """Return the routing values that have a state file."""
+        directory, name = os.path.split(self.prefix)
+        head, tail = f"{name}.", ".json"
+        try:
+            files = os.listdir(directory or ".")
+        except FileNotFoundError:
+            return []
+        return sorted(
+            file[len(head) : -len(tail)]
+            for file in files
+            if file.startswith(head) and file.endswith(tail)
+        )
+
+    @contextmanager
+    def _locked(self, routing_value: str) -> Iterator[BinaryIO]:
+        """Open the state file of a routing value and hold its lock."""
+        fd = os.open(self._path(routing_value), os.O_RDWR | os.O_CREAT, 0o600)
+        with os.fdopen(fd, "r+b") as file:
+            # Released when the file is closed
+            fcntl.flock(file, fcntl.LOCK_EX)
+            yield file
+
+    def _load(
+        self, routing_value: str, raw: bytes
+    ) -> Tuple[RoutingPartition, Optional[int]]:
+        """
+        Decode a state file, starting over if it is empty or corrupt.
+
+        Returns:
+            Tuple of (partition, number of permit lines replayed or None when
+            the file has no readable partition line)
+        """
+        lines = raw.splitlines()
+        if not lines:
+            return RoutingPartition(routing_value), None
+        try:
+            partition = RoutingPartition.from_dict(routing_value, json.loads(lines[0]))
+        except (ValueError, KeyError, TypeError) as e:
+            logger.warning(
+                "Discarding unreadable rate limit state",
+                path=self._path(routing_value),
+                error=str(e),
+            )
+            return RoutingPartition(routing_value), None
+
+        for line in lines[1:]:
+            try:
+                endpoint_key, timestamp = json.loads(line)
+            except (ValueError, TypeError):
+                # Line cut short by a process killed mid-write
+                continue
+            partition.record(endpoint_key, float(timestamp))
+        return partition, len(lines) - 1
+
+    @staticmethod
+    def _rewrite(file: BinaryIO, partition: RoutingPartition, now: float) -> None:
+        """Replace the file with the pruned partition and no permit lines."""
+        file.seek(0)
+        file.truncate()
+        file.write(json.dumps(partition.to_dict(now)).encode() + b"\n")
+
+    def _transact(
+        self,
+        routing_value: str,
+        operation: Callable[[RoutingPartition, float], T],
+        write: bool = True,
+    ) -> T:
+        """Run an operation on a partition while holding its file lock."""
+        with self._locked(routing_value) as file:
+            now = time.time()
+            partition, _ = self._load(routing_value, file.read())
+            result = operation(partition, now)
+            if write:
+                self._rewrite(file, partition, now)
+            return result
+
+    def _acquire(
+        self, routing_value: str, endpoint_key: str, spacing: float, reserve: float
+    ) -> float:
+        """Take a permit, appending it to the file instead of rewriting it."""
+        with self._locked(routing_value) as file:
+            now = time.time()
+            raw = file.read()
+            partition, appended = self._load(routing_value, raw)
+            wait = partition.acquire(endpoint_key, now, spacing, reserve)
+            if wait > 0:
+                return wait
+            # A torn last line would swallow the appended one
+            torn = not raw.endswith(b"\n")
+            if appended is None or appended >= COMPACT_AFTER or torn:
+                self._rewrite(file, partition, now)
+            else:
+                # Positioned at the end of the file by the read
+                file.write(json.dumps([endpoint_key, now]).encode() + b"\n")
+            return 0.0
+
+    def _restore(self, routing_value: str, data: Dict[str, Any]) -> None:
+        """Write a partition from a snapshot unless its file has state."""
+        with self._locked(routing_value) as file:
+            if not file.read():
+                partition = RoutingPartition.from_dict(routing_value, data)
+                self._rewrite(file, partition, time.time())
+
+    async def acquire(
+        self,
+        routing_value: str,
+        endpoint_key: str,
+        spacing: float,
+        reserve: float = 0.0,
+    ) -> float:
+        """Take a permit from the shared partition."""
+        return await asyncio.to_thread(
+            self._acquire, routing_value, endpoint_key, spacing, reserve
+        )
+
+    async def update(
+        self,
+        routing_value: str,
+        endpoint_key: str,
+        app: Optional[RatePair],
+        method: Optional[RatePair],
+    ) -> None:
+        """Apply reported limits to the shared partition."""
+        await asyncio.to_thread(
+            self._transact,
+            routing_value,
+            lambda partition, now: partition.update(endpoint_key, app, method, now),
+        )
+
+    async def cooldown(
+        self, routing_value: str, cooldown_key: str, until: float
+    ) -> None:
+        """Start a cooldown in the shared partition."""
+        await asyncio.to_thread(
+            self._transact,
+            routing_value,
+            lambda partition, now: partition.cooldown(cooldown_key, until),
+        )
+
+    async def next_permit(
+        self, routing_value: str, endpoint_key: str, spacing: float
+    ) -> float:
+        """Return the earliest permit time of the shared partition."""
+        return await asyncio.to_thread(
+            self._transact,
+            routing_value,
+            lambda partition, now: partition.next_permit(endpoint_key, now, spacing),
+            False,
+        )
+
+    def _collect(
+        self, operation: Callable[[RoutingPartition, float], Any]
+    ) -> Dict[str, Any]:
+        """Run a read-only operation on every partition with a state file."""
+        return {
+            routing_value: self._transact(routing_value, operation, False)
+            for routing_value in self._routing_values()
+        }
+
+    async def stats(self) -> Dict[str, Any]:
+        """Return usage of the shared partitions."""
+        return await asyncio.to_thread(
+            self._collect, lambda partition, now: partition.stats(now)
+        )
+
+    async def snapshot(self) -> Optional[Dict[str, Any]]:
+        """Serialize the shared partitions (tmpfs does not survive reboots)."""
+        return await asyncio.to_thread(
+            self._collect, lambda partition, now: partition.to_dict(now)
+        )
+
+    async def restore(self, state: Dict[str, Any]) -> None:
+        """Add partitions from a snapshot that have no state file yet."""
+        for routing_value, data in state.items():
+            await asyncio.to_thread(self._restore, routing_value, data)
+
+
+# Every permit is stored once per window it counts against, mirroring the
+# per-window logs of RateLimitWindow. Request spacing uses window 0 rows, and
+# so do cooldowns, whose single row holds the time the cooldown ends.
+_LOCK_SQL = text("SELECT pg_advisory_xact_lock(hashtext(:lock_key))")
+
+_PERMIT_TIMES_SQL = text(
+    """
+    SELECT (
+        SELECT p.issued_at
+          FROM core.rate_limit_permits p
+         WHERE p.bucket_key = w.bucket_key
+           AND p.window_seconds = w.window_seconds
+           AND p.issued_at > CAST(:now AS double precision) - w.window_seconds
+         ORDER BY p.issued_at DESC
+        OFFSET GREATEST(
+                   w.max_requests
+                   - CEIL(w.max_requests * CAST(:reserve AS double precision)),
+                   1
+               )::integer - 1
+         LIMIT 1
+    ) + w.window_seconds AS permit_at
+      FROM core.rate_limit_windows w
+     WHERE w.bucket_key IN (:app_key, :method_key)
+    UNION ALL
+    SELECT max(issued_at) + CAST(:spacing AS double precision)
+      FROM core.rate_limit_permits
+     WHERE bucket_key = :spacing_key
+    UNION ALL
+    SELECT max(issued_at)
+      FROM core.rate_limit_permits
+     WHERE bucket_key IN (:app_cooldown_key, :method_cooldown_key)
+    """
+)
+
+_RECORD_PERMIT_SQL = text(
+    """
+    INSERT INTO core.rate_limit_permits (bucket_key, window_seconds, issued_at)
+    SELECT bucket_key, window_seconds, CAST(:now AS double precision)
+      FROM core.rate_limit_windows
+     WHERE bucket_key IN (:app_key, :method_key)
+    UNION ALL
+    SELECT CAST(:spacing_key AS varchar), 0, CAST(:now AS double precision)
+    """
+)
+
+_START_COOLDOWN_SQL = text(
+    """
+    INSERT INTO core.rate_limit_permits (bucket_key, window_seconds, issued_at)
+    VALUES (:cooldown_key, 0, CAST(:until AS double precision))
+    """
+)
+
+_DROP_WINDOWS_SQL = text(
+    """
+    DELETE FROM core.rate_limit_windows
+     WHERE bucket_key = :bucket_key
+       AND window_seconds <> ALL(CAST(:windows AS integer[]))
+    """
+)
+
+_DROP_PERMITS_SQL = text(
+    """
+    DELETE FROM core.rate_limit_permits
+     WHERE bucket_key = :bucket_key
+       AND window_seconds <> ALL(CAST(:windows AS integer[]))
+    """
+)
+
+_UPSERT_WINDOW_SQL = text(
+    """
+    INSERT INTO core.rate_limit_windows (bucket_key, window_seconds, max_requests)
+    VALUES (:bucket_key, :window_seconds, :max_requests)
+    ON CONFLICT (bucket_key, window_seconds)
+    DO UPDATE SET max_requests = EXCLUDED.max_requests
+    """
+)
+
+# Pads the window with permits at `now` when Riot counted more requests
+# than are recorded (see RateLimitWindow.calibrate)
+_CALIBRATE_SQL = text(
+    """
+    INSERT INTO core.rate_limit_permits (bucket_key, window_seconds, issued_at)
+    SELECT CAST(:bucket_key AS varchar),
+           CAST(:window_seconds AS integer),
+           CAST(:now AS double precision)
+      FROM generate_series(
+               1,
+               CAST(:reported AS integer) - (
+                   SELECT count(*)::integer
+                     FROM core.rate_limit_permits
+                    WHERE bucket_key = :bucket_key
+                      AND window_seconds = CAST(:window_seconds AS integer)
+                      AND issued_at > CAST(:now AS double precision)
+                                      - CAST(:window_seconds AS integer)
+                      AND issued_at <= CAST(:now AS double precision)
+               )
+           )
+    """
+)
+
+_CLEANUP_SQL = text(
+    """
+    DELETE FROM core.rate_limit_permits
+     WHERE issued_at < CAST(:now AS double precision) - GREATEST(window_seconds, 60)
+    """
+)
+
+_STATS_SQL = text(
+    """
+    SELECT w.bucket_key,
+           w.window_seconds,
+           w.max_requests,
+           count(p.issued_at) AS used,
+           min(p.issued_at) AS oldest,
+           (
+               SELECT b.issued_at
+                 FROM core.rate_limit_permits b
+                WHERE b.bucket_key = w.bucket_key
+                  AND b.window_seconds = w.window_seconds
+                  AND b.issued_at > CAST(:now AS double precision) - w.window_seconds
+                ORDER BY b.issued_at DESC
+               OFFSET w.max_requests - 1
+                LIMIT 1
+           ) AS blocking_at
+      FROM core.rate_limit_windows w
+      LEFT JOIN core.rate_limit_permits p
+        ON p.bucket_key = w.bucket_key
+       AND p.window_seconds = w.window_seconds
+       AND p.issued_at > CAST(:now AS double precision) - w.window_seconds
+     WHERE w.bucket_key LIKE :prefix
+     GROUP BY w.bucket_key, w.window_seconds, w.max_requests
+     ORDER BY w.bucket_key, w.window_seconds
+    """
+)
+
+
+class PostgresRateLimitBackend(RateLimitBackend):
+    """Backend coordinating every process through Postgres.
+
+    Windows and issued permits live in unlogged tables of the core schema.
+    Each routing value is guarded by a transaction-scoped advisory lock, so
+    permits are checked and recorded atomically across all API workers,
+    scheduler jobs and hosts sharing the database.
+    """
+
+    # Seconds between purges of expired permits
+    CLEANUP_INTERVAL = 60.0
+
+    def __init__(self, engine: AsyncEngine, namespace: str):
+        """
+        Initialize backend.
+
+        Args:
+            engine: Async engine of the application database
+            namespace: Prefix separating the state of different API keys
+        """
+        self.engine = engine
+        self.namespace = namespace
+        self._last_cleanup = 0.0
+
+    def _keys(self, routing_value: str, endpoint_key: str) -> Dict[str, str]:
+        """Return the bucket keys of a routing value and endpoint key."""
+        prefix = f"{self.namespace}|{routing_value}"
+        return {
+            "app_key": f"{prefix}|app",
+            "method_key": f"{prefix}|{endpoint_key}",
+            "spacing_key": f"{prefix}|spacing",
+            "app_cooldown_key": f"{prefix}|cooldown:{APP_COOLDOWN}",
+            "method_cooldown_key": f"{prefix}|cooldown:{endpoint_key}",
+        }
+
+    async def _lock(self, conn: AsyncConnection, routing_value: str) -> float:
+        """Take the advisory lock of a routing value and return the time."""
+        await conn.execute(
+            _LOCK_SQL, {"lock_key": f"rate_limit|{self.namespace}|{routing_value}"}
+        )
+        return time.time()
+
+    async def _next_permit(
+        self,
+        conn: AsyncConnection,
+        keys: Dict[str, str],
+        now: float,
+        spacing: float,
+        reserve: float = 0.0,
+    ) -> float:
+        """Return the earliest time all windows and the spacing allow."""
+        result = await conn.execute(
+            _PERMIT_TIMES_SQL,
+            {**keys, "now": now, "spacing": spacing, "reserve": reserve},
+        )
+        return max(
+            [now] + [permit_at for (permit_at,) in result if permit_at is not None]
+        )
+
+    async def acquire(
+        self,
+        routing_value: str,
+        endpoint_key: str,
+        spacing: float,
+        reserve: float = 0.0,
+    ) -> float:
+        """Take a permit inside one locked transaction."""
+        keys = self._keys(routing_value, endpoint_key)
+        async with self.engine.begin() as conn:
+            now = await self._lock(conn, routing_value)
+            permit_at = await self._next_permit(conn, keys, now, spacing, reserve)
+            if permit_at > now:
+                return permit_at - now
+            await conn.execute(_RECORD_PERMIT_SQL, {**keys, "now": now})
+            return 0.0
+
+    async def update(
+        self,
+        routing_value: str,
+        endpoint_key: str,
+        app: Optional[RatePair],
+        method: Optional[RatePair],
+    ) -> None:
+        """Configure and calibrate the app and method windows."""
+        keys = self._keys(routing_value, endpoint_key)
+        async with self.engine.begin() as conn:
+            now = await self._lock(conn, routing_value)
+            if app is not None:
+                await self._apply(conn, keys["app_key"], app, now)
+            if method is not None:
+                await self._apply(conn, keys["method_key"], method, now)
+
+            if now - self._last_cleanup >= self.CLEANUP_INTERVAL:
+                self._last_cleanup = now
+                await conn.execute(_CLEANUP_SQL, {"now": now})
+
+    async def _apply(
+        self, conn: AsyncConnection, bucket_key: str, pair: RatePair, now: float
+    ) -> None:
+        """Apply one header pair to the windows of a bucket."""
+        limits, counts = pair
+        declared = {limit["window"]: limit["requests"] for limit in limits}
+        windows = list(declared)
+
+        await conn.execute(
+            _DROP_WINDOWS_SQL, {"bucket_key": bucket_key, "windows": windows}
+        )
+        await conn.execute(
+            _DROP_PERMITS_SQL, {"bucket_key": bucket_key, "windows": windows}
+        )
+        await conn.execute(
+            _UPSERT_WINDOW_SQL,
+            [
+                {
+                    "bucket_key": bucket_key,
+                    "window_seconds": window,
+                    "max_requests": requests,
+                }
+                for window, requests in declared.items()
+            ],
+        )
+
+        for count in counts:
+            if count["window"] in declared:
+                await conn.execute(
+                    _CALIBRATE_SQL,
+                    {
+                        "bucket_key": bucket_key,
+                        "window_seconds": count["window"],
+                        "reported": count["requests"],
+                        "now": now,
+                    },
+                )
+
+    async def cooldown(
+        self, routing_value: str, cooldown_key: str, until: float
+    ) -> None:
+        """Record the end of a cooldown, visible to every process at once."""
+        async with self.engine.begin() as conn:
+            await self._lock(conn, routing_value)
+            await conn.execute(
+                _START_COOLDOWN_SQL,
+                {
+                    "cooldown_key": (
+                        f"{self.namespace}|{routing_value}|cooldown:{cooldown_key}"
+                    ),
+                    "until": until,
+                },
+            )
+
+    async def next_permit(
+        self, routing_value: str, endpoint_key: str, spacing: float
+    ) -> float:
+        """Return the earliest permit time without taking a permit."""
+        keys = self._keys(routing_value, endpoint_key)
+        async with self.engine.connect() as conn:
+            return await self._next_permit(conn, keys, time.time(), spacing)
+
+    async def stats(self) -> Dict[str, Any]:
+        """Return usage of every window stored for this API key."""
+        now = time.time()
+        async with self.engine.connect() as conn:
+            result = await conn.execute(
+                _STATS_SQL, {"now": now, "prefix": f"{self.namespace}|%"}
+            )
+            rows = result.all()
+
+        stats: Dict[str, Any] = {}
+        for bucket_key, window, limit, used, oldest, blocking_at in rows:
+            _, routing_value, scope = bucket_key.split("|", 2)
+            partition = stats.setdefault(routing_value, {"app": [], "methods": {}})
+            entries: List[Dict[str, Any]] = (
+                partition["app"]
+                if scope == "app"
+                else partition["methods"].setdefault(scope, [])
+            )
+            entries.append(
+                {
+                    "limit": limit,
+                    "window": window,
+                    "used": used,
+                    "remaining": max(0, limit - used),
+                    "reset_in": max(0.0, oldest + window - now) if oldest else 0.0,
+                    "next_permit_in": (
+                        max(0.0, blocking_at + window - now) if blocking_at else 0.0
+                    ),
+                }
+            )
+        return stats
+
+
+_LOAD_SNAPSHOT_SQL = text(
+    """
+    SELECT state::text
+      FROM core.rate_limit_snapshots
+     WHERE namespace = :namespace
+    """
+)
+
+_SAVE_SNAPSHOT_SQL = text(
+    """
+    INSERT INTO core.rate_limit_snapshots (namespace, state, saved_at)
+    VALUES (:namespace, CAST(:state AS jsonb), now())
+    ON CONFLICT (namespace)
+    DO UPDATE SET state = EXCLUDED.state, saved_at = EXCLUDED.saved_at
+    """
+)
+
+
+class RateLimitSnapshotStore:
+    """Persists rate limit backend state in core.rate_limit_snapshots.
+
+    Riot keeps counting the traffic of a previous process after a deploy or
+    crash, so a fresh limiter would burst into 429s. Snapshots are saved
+    periodically and on shutdown, and restored before the first request.
+    One store exists per API key and process, so restoring happens once no
+    matter how many clients are created.
+    """
+
+    def __init__(
+        self,
+        engine: AsyncEngine,
+        namespace: str,
+        backend: RateLimitBackend,
+        interval: float,
+    ):
+        """
+        Initialize snapshot store.
+
+        Args:
+            engine: Async engine of the application database
+            namespace: Identifier of the API key the state belongs to
+            backend: Backend whose state is persisted
+            interval: Minimum seconds between periodic saves
+        """
+        self.engine = engine
+        self.namespace = namespace
+        self.backend = backend
+        self.interval = interval
+        self._restored = False
+        self._restore_lock = asyncio.Lock()
+        self._saved_at = 0.0
+
+    async def restore(self) -> None:
+        """Load the last snapshot into the backend on first use."""
+        if self._restored:
+            return
+
+        async with self._restore_lock:
+            if self._restored:
+                return
+            self._restored = True
+
+            try:
+                async with self.engine.connect() as conn:
+                    raw = await conn.scalar(
+                        _LOAD_SNAPSHOT_SQL, {"namespace": self.namespace}
+                    )
+                if raw:
+                    state = json.loads(raw)
+                    await self.backend.restore(state)
+                    logger.info(
+                        "Restored rate limit state",
+                        routing_values=sorted(state),
+                    )
+            except Exception as e:
+                logger.warning("Failed to restore rate limit state", error=str(e))
+
+    def due(self) -> bool:
+        """Return whether the interval since the last save has elapsed."""
+        return self.interval > 0 and time.time() - self._saved_at >= self.interval
+
+    async def save(self, force: bool = False) -> None:
+        """
+        Save the backend state if the interval has elapsed.
+
+        Args:
+            force: Save regardless of the interval
+        """
+        if not force and not self.due():
+            return
+        self._saved_at = time.time()
+
+        try:
+            state = await self.backend.snapshot()
+            if state is None:
+                return
+            async with self.engine.begin() as conn:
+                await conn.execute(
+                    _SAVE_SNAPSHOT_SQL,
+                    {"namespace": self.namespace, "state": json.dumps(state)},
+                )
+        except Exception as e:
+            logger.warning("Failed to save rate limit state", error=str(e))
+
+
+# Process-wide snapshot stores, one per API key
+_snapshot_stores: Dict[str, RateLimitSnapshotStore] = {}
+
+
+def _namespace(api_key: str) -> str:
+    """Return a stable, non-reversible identifier of an API key."""
+    return hashlib.sha256(api_key.encode()).hexdigest()[:16]
+
+
+def create_rate_limit_backend(api_key: str) -> RateLimitBackend:
+    """
+    Return the rate limit backend configured by RIOT_RATE_LIMIT_BACKEND.
+
+    Riot limits are enforced per API key, so state is namespaced by key:
+    clients using the same key share one backend, different keys never do.
+
+    Args:
+        api_key: Riot API key the limits belong to
+
+    Returns:
+        "memory": backend shared by all clients of this process (default)
+        "shared_memory": file backend shared by all processes on the host
+        "postgres": backend shared by everything using the database
+    """
+    namespace = _namespace(api_key)
+    backend = _backends.get(namespace)
+    if backend is not None:
+        return backend
+
+    settings = get_global_settings()
+    if settings.riot_rate_limit_backend == "postgres":
+        backend = PostgresRateLimitBackend(db_manager.engine, namespace)
+    elif settings.riot_rate_limit_backend == "shared_memory":
+        prefix = os.path.join(
+            settings.riot_rate_limit_shm_dir, f"riot-rate-limits-{namespace}"
+        )
+        backend = SharedMemoryRateLimitBackend(prefix)
+    else:
+        backend = InMemoryRateLimitBackend()
+
+    _backends[namespace] = backend
+    return backend
+
+
+def create_rate_limiter(api_key: str) -> RateLimiter:
+    """
+    Create a rate limiter using the configured backend and snapshot store.
+
+    Args:
+        api_key: Riot API key the limits belong to
+
+    Returns:
+        RateLimiter coordinating with every other limiter of the same key
+    """
+    namespace = _namespace(api_key)
+    backend = create_rate_limit_backend(api_key)
+
+    snapshots = _snapshot_stores.get(namespace)
+    if snapshots is None:
+        snapshots = RateLimitSnapshotStore(
+            db_manager.engine,
+            namespace,
+            backend,
+            get_global_settings().riot_rate_limit_snapshot_interval,
+        )
+        _snapshot_stores[namespace] = snapshots
+
+    return RateLimiter(
+        backend,
+        snapshots,
+        interactive_reserve=get_global_settings().riot_rate_limit_interactive_reserve,
+    )
+
+
+async def save_rate_limit_snapshots() -> None:
+    """Save the state of every rate limit backend of this process."""
+    for snapshots in list(_snapshot_stores.values()):
+        await snapshots.save(force=True)
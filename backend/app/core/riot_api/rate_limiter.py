@@ -1,140 +1,941 @@
 """Rate limiting implementation for Riot API using response headers."""
 
 import asyncio
+import bisect
+import itertools
+import math
 import time
-from typing import Dict, Optional
+from abc import ABC, abstractmethod
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    List,
+    Mapping,
+    Optional,
+    Tuple,
+    Union,
+)
+from urllib.parse import urlsplit
+
 import structlog
 
-from .endpoints import parse_rate_limit_header, parse_rate_count_header
+from .constants import ApiKeyTier, RateLimitScope, RequestPriority
+from .endpoints import (
+    parse_rate_limit_header,
+    parse_rate_count_header,
+    resolve_route,
+)
+
+if TYPE_CHECKING:
+    from .rate_limit_backends import RateLimitSnapshotStore
 
 logger = structlog.get_logger(__name__)
 
+# Parsed (limits, counts) of one rate limit header pair
+RatePair = Tuple[List[Dict[str, int]], List[Dict[str, int]]]
 
-class RateLimiter:
-    """Header-based rate limiter that trusts Riot API response headers."""
+# Cooldown key of the app scope; method and service cooldowns are keyed by
+# the endpoint key they apply to
+APP_COOLDOWN = "app"
+
+# App limits assumed by the planner until Riot reports the real ones
+# (those of a development key, the lowest there are)
+DEFAULT_APP_LIMITS = "20:1,100:120"
+
+# Keys sustaining more than this multiple of a development key are production
+PRODUCTION_THROUGHPUT_RATIO = 1.5
+
+
+class ApiKeyLimits:
+    """App limits of an API key and the client sizing derived from them.
+
+    The shortest window bounds bursts, so it sets the request spacing and the
+    number of requests worth keeping in flight. The window with the lowest
+    rate bounds sustained throughput, which tells the key tier and how much
+    larger than for a development key per-run batches can be.
+    """
+
+    def __init__(self, header: str = DEFAULT_APP_LIMITS, learned: bool = False):
+        """
+        Initialize limits.
+
+        Args:
+            header: App limits in header format, e.g. "20:1,100:120"
+            learned: Whether Riot reported the limits (else they are assumed)
+        """
+        self.header = header
+        self.learned = learned
+        windows = sorted(
+            (item["window"], item["requests"])
+            for item in parse_rate_limit_header(header)
+            if item["window"] > 0 and item["requests"] > 0
+        ) or [(1, 20)]
+        shortest_window, shortest_limit = windows[0]
+        self.burst_rate = shortest_limit / shortest_window
+        self.sustained_rate = min(limit / window for window, limit in windows)
+
+    @property
+    def throughput_ratio(self) -> float:
+        """Sustained throughput relative to a development key."""
+        return self.sustained_rate / _DEVELOPMENT_LIMITS.sustained_rate
+
+    @property
+    def tier(self) -> ApiKeyTier:
+        """Tier of the key (unknown until Riot reported its limits)."""
+        if not self.learned:
+            return ApiKeyTier.UNKNOWN
+        if self.throughput_ratio >= PRODUCTION_THROUGHPUT_RATIO:
+            return ApiKeyTier.PRODUCTION
+        return ApiKeyTier.DEVELOPMENT
+
+    @property
+    def request_spacing(self) -> float:
+        """Seconds between requests that spreads a burst over its window."""
+        return 1.0 / self.burst_rate
+
+    def concurrency(self, latency: float, maximum: int = 64) -> int:
+        """
+        Return how many requests to keep in flight to use the burst rate.
+
+        Args:
+            latency: Seconds one request takes
+            maximum: Upper bound of the answer
+        """
+        return max(1, min(maximum, math.ceil(self.burst_rate * latency)))
+
+    def scale_batch(self, count: int) -> int:
+        """Scale a per-run count tuned for a development key to this key."""
+        return max(count, int(count * self.throughput_ratio))
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Return the limits and derived sizing for logs and API responses."""
+        return {
+            "tier": self.tier.value,
+            "app_limits": self.header,
+            "burst_rate": self.burst_rate,
+            "sustained_rate": self.sustained_rate,
+            "request_spacing": self.request_spacing,
+        }
+
+
+_DEVELOPMENT_LIMITS = ApiKeyLimits(DEFAULT_APP_LIMITS)
+
+
+class RateLimitWindow:
+    """Sliding log of permit timestamps for a single declared window.
+
+    Riot declares limits such as "20:1,100:120" (20 requests per second and
+    100 requests per two minutes). Every pair is tracked by its own window,
+    so a short window can never hide the state of a long one.
+    """
+
+    def __init__(self, limit: int, window: float):
+        """
+        Initialize window.
+
+        Args:
+            limit: Maximum number of requests allowed inside the window
+            window: Window length in seconds
+        """
+        self.limit = limit
+        self.window = window
+        self.log: List[float] = []
+
+    def prune(self, now: float) -> None:
+        """Drop timestamps that have left the window."""
+        cutoff = bisect.bisect_right(self.log, now - self.window)
+        if cutoff:
+            del self.log[:cutoff]
+
+    def used(self, now: float) -> int:
+        """Return number of permits currently counted against the window."""
+        self.prune(now)
+        return len(self.log)
+
+    def usable(self, reserve: float = 0.0) -> int:
+        """
+        Return how many permits a caller may use when part is held back.
+
+        Args:
+            reserve: Fraction of the limit the caller must leave free
+        """
+        if reserve <= 0:
+            return self.limit
+        return max(1, self.limit - math.ceil(self.limit * reserve))
+
+    def next_permit(self, now: float, reserve: float = 0.0) -> float:
+        """
+        Return the earliest time a new permit fits into the window.
+
+        With fewer than `limit` live entries a permit is available immediately.
+        Otherwise the window frees up once the `limit`-th newest entry expires.
+        A reserve lowers the limit the caller is checked against.
+        """
+        self.prune(now)
+        limit = self.usable(reserve)
+        if len(self.log) < limit:
+            return now
+        return max(now, self.log[-limit] + self.window)
+
+    def record(self, timestamp: float) -> None:
+        """Record a permit issued at the given time."""
+        bisect.insort(self.log, timestamp)
+
+    def calibrate(self, reported: int, now: float) -> None:
+        """
+        Align local state with the count Riot reported for this window.
+
+        Requests made before this process started (or by another client using
+        the same key) are unknown locally, so missing entries are added at
+        `now`. This is conservative: they expire later than the real ones.
+        Local entries are never removed, because requests still in flight may
+        not be counted by Riot yet.
+        """
+        self.prune(now)
+        local = bisect.bisect_right(self.log, now)
+        missing = reported - local
+        if missing > 0:
+            index = bisect.bisect_right(self.log, now)
+            self.log[index:index] = [now] * missing
+
+    def reset_time(self, now: float) -> Optional[float]:
+        """Return when the oldest live entry leaves the window."""
+        self.prune(now)
+        if not self.log:
+            return None
+        return self.log[0] + self.window
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Serialize the window for shared or persisted state."""
+        return {"limit": self.limit, "window": self.window, "log": self.log}
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "RateLimitWindow":
+        """Restore a window serialized with `to_dict`."""
+        window = cls(int(data["limit"]), data["window"])
+        window.log = sorted(float(timestamp) for timestamp in data.get("log", []))
+        return window
+
+
+class RateLimitBucket:
+    """All windows declared for one rate limit scope (app or method)."""
 
     def __init__(self):
-        """Initialize rate limiter."""
-        # Track remaining requests from headers
-        self.app_remaining: Optional[int] = None
-        self.app_reset_time: Optional[float] = None
-        self.method_remaining: Dict[str, Optional[int]] = {}
-        self.method_reset_time: Dict[str, Optional[float]] = {}
+        """Initialize bucket without any known windows."""
+        self.windows: Dict[int, RateLimitWindow] = {}
 
-        # Request spacing to avoid bursts
-        self.last_request_time = 0
-        self.request_spacing = 0.05  # 50ms between requests
+    def configure(self, limits: List[Dict[str, int]]) -> None:
+        """
+        Apply the windows declared by a rate limit header.
 
-        # Lock for thread safety
-        self.lock = asyncio.Lock()
+        Windows that are no longer declared are dropped, existing ones keep
+        their log and only pick up the new limit.
 
-    async def wait_if_needed(self, endpoint: str, method: str = "GET") -> None:
+        Args:
+            limits: Parsed limit dicts with 'requests' and 'window' keys
         """
-        Wait if rate limits would be exceeded based on headers.
+        declared = {limit["window"]: limit["requests"] for limit in limits}
+
+        for window in list(self.windows):
+            if window not in declared:
+                del self.windows[window]
+
+        for window, requests in declared.items():
+            existing = self.windows.get(window)
+            if existing is None:
+                self.windows[window] = RateLimitWindow(requests, window)
+            else:
+                existing.limit = requests
+
+    def next_permit(self, now: float, reserve: float = 0.0) -> float:
+        """Return the earliest time every window has capacity."""
+        return max(
+            (window.next_permit(now, reserve) for window in self.windows.values()),
+            default=now,
+        )
+
+    def record(self, timestamp: float) -> None:
+        """Record a permit in every window."""
+        for window in self.windows.values():
+            window.record(timestamp)
+
+    def calibrate(self, counts: List[Dict[str, int]], now: float) -> None:
+        """
+        Align every window with the counts Riot reported.
 
         Args:
-            endpoint: API endpoint being called
-            method: HTTP method being used
+            counts: Parsed count dicts with 'requests' and 'window' keys
+            now: Current time
         """
-        async with self.lock:
-            now = time.time()
+        for count in counts:
+            window = self.windows.get(count["window"])
+            if window is not None:
+                window.calibrate(count["requests"], now)
 
-            # Check app-level limit
-            should_reset = await self._check_and_wait_for_limit(
-                self.app_remaining, self.app_reset_time, now, "App"
+    def stats(self, now: float) -> List[Dict[str, Any]]:
+        """Return per-window usage for monitoring."""
+        result: List[Dict[str, Any]] = []
+        for window in sorted(self.windows.values(), key=lambda w: w.window):
+            used = window.used(now)
+            reset_time = window.reset_time(now)
+            result.append(
+                {
+                    "limit": window.limit,
+                    "window": window.window,
+                    "used": used,
+                    "remaining": max(0, window.limit - used),
+                    "reset_in": max(0.0, reset_time - now) if reset_time else 0.0,
+                    "next_permit_in": window.next_permit(now) - now,
+                }
             )
-            if should_reset:
-                self.app_remaining = None
-                self.app_reset_time = None
-
-            # Check method-level limit
-            endpoint_key = self._get_endpoint_key(endpoint, method)
-            if endpoint_key in self.method_remaining:
-                remaining = self.method_remaining[endpoint_key]
-                reset_time = self.method_reset_time.get(endpoint_key)
-
-                should_reset = await self._check_and_wait_for_limit(
-                    remaining, reset_time, now, "Method", endpoint_key
-                )
-                if should_reset:
-                    self.method_remaining[endpoint_key] = None
-                    self.method_reset_time[endpoint_key] = None
+        return result
+
+    def to_dict(self, now: float) -> List[Dict[str, Any]]:
+        """Serialize the live part of every window."""
+        for window in self.windows.values():
+            window.prune(now)
+        return [window.to_dict() for window in self.windows.values()]
+
+    @classmethod
+    def from_dict(cls, data: List[Dict[str, Any]]) -> "RateLimitBucket":
+        """Restore a bucket serialized with `to_dict`."""
+        bucket = cls()
+        for item in data:
+            window = RateLimitWindow.from_dict(item)
+            bucket.windows[window.window] = window
+        return bucket
+
+
+class RoutingPartition:
+    """Rate limit state for one routing value (e.g. "europe" or "euw1").
+
+    Riot enforces app and method limits per routing value, so every region
+    and platform gets its own buckets and request spacing.
+    """
+
+    def __init__(self, routing_value: str):
+        """
+        Initialize partition.
+
+        Args:
+            routing_value: Region or platform host the partition belongs to
+        """
+        self.routing_value = routing_value
+        self.app_bucket = RateLimitBucket()
+        self.method_buckets: Dict[str, RateLimitBucket] = {}
+        self.last_request_time = 0.0
+        # Cooldown key -> time until which no permits are handed out
+        self.cooldowns: Dict[str, float] = {}
+
+    def next_permit(
+        self, endpoint_key: str, now: float, spacing: float, reserve: float = 0.0
+    ) -> float:
+        """Return the earliest time all windows and request spacing allow."""
+        permit_at = max(now, self.last_request_time + spacing)
+        permit_at = max(permit_at, self.app_bucket.next_permit(now, reserve))
 
-            # Request spacing to avoid bursts
-            time_since_last = now - self.last_request_time
-            if time_since_last < self.request_spacing:
-                await asyncio.sleep(self.request_spacing - time_since_last)
+        method_bucket = self.method_buckets.get(endpoint_key)
+        if method_bucket is not None:
+            permit_at = max(permit_at, method_bucket.next_permit(now, reserve))
 
-            self.last_request_time = time.time()
+        return max(
+            permit_at,
+            self.cooldowns.get(APP_COOLDOWN, 0.0),
+            self.cooldowns.get(endpoint_key, 0.0),
+        )
 
-    async def _check_and_wait_for_limit(
+    def record(self, endpoint_key: str, timestamp: float) -> None:
+        """Record an issued permit in the app and method buckets."""
+        self.app_bucket.record(timestamp)
+        method_bucket = self.method_buckets.get(endpoint_key)
+        if method_bucket is not None:
+            method_bucket.record(timestamp)
+        self.last_request_time = max(self.last_request_time, timestamp)
+
+    def acquire(
+        self, endpoint_key: str, now: float, spacing: float, reserve: float = 0.0
+    ) -> float:
+        """
+        Take a permit if every window and the request spacing allow it.
+
+        Args:
+            endpoint_key: Method rate limit key of the endpoint
+            now: Current time
+            spacing: Minimum seconds between requests
+            reserve: Fraction of every window the caller must leave free
+
+        Returns:
+            0.0 when the permit was taken, otherwise seconds until the next try
+        """
+        permit_at = self.next_permit(endpoint_key, now, spacing, reserve)
+        if permit_at <= now:
+            self.record(endpoint_key, now)
+            return 0.0
+        return permit_at - now
+
+    def update(
         self,
-        remaining: Optional[int],
-        reset_time: Optional[float],
+        endpoint_key: str,
+        app: Optional[RatePair],
+        method: Optional[RatePair],
         now: float,
-        scope_name: str,
-        endpoint_key: Optional[str] = None,
-    ) -> bool:
+    ) -> None:
         """
-        Check if rate limit is exceeded and wait if needed.
+        Apply the limits and counts Riot reported for a response.
+
+        The method bucket is created the first time Riot declares a method
+        limit for the endpoint key.
 
         Args:
-            remaining: Number of requests remaining
-            reset_time: Time when limit resets
+            endpoint_key: Method rate limit key of the endpoint
+            app: Parsed (limits, counts) of the app headers, if present
+            method: Parsed (limits, counts) of the method headers, if present
             now: Current time
-            scope_name: Name of the scope for logging (e.g., "App", "Method")
-            endpoint_key: Optional endpoint key for method-scoped limits
+        """
+        if app is not None:
+            self.app_bucket.configure(app[0])
+            self.app_bucket.calibrate(app[1], now)
+
+        if method is not None:
+            bucket = self.method_buckets.get(endpoint_key)
+            if bucket is None:
+                bucket = RateLimitBucket()
+                self.method_buckets[endpoint_key] = bucket
+            bucket.configure(method[0])
+            bucket.calibrate(method[1], now)
+
+    def cooldown(self, cooldown_key: str, until: float) -> None:
+        """
+        Hold back every permit of a scope until the given time.
+
+        Args:
+            cooldown_key: APP_COOLDOWN or the endpoint key of the scope
+            until: Epoch seconds the cooldown ends at (never shortened)
+        """
+        self.cooldowns[cooldown_key] = max(self.cooldowns.get(cooldown_key, 0.0), until)
+
+    def active_cooldowns(self, now: float) -> Dict[str, float]:
+        """Drop expired cooldowns and return the remaining ones."""
+        self.cooldowns = {
+            key: until for key, until in self.cooldowns.items() if until > now
+        }
+        return self.cooldowns
+
+    def stats(self, now: float) -> Dict[str, Any]:
+        """Return usage of the app and method windows and active cooldowns."""
+        return {
+            "app": self.app_bucket.stats(now),
+            "methods": {
+                key: bucket.stats(now) for key, bucket in self.method_buckets.items()
+            },
+            "cooldowns": {
+                key: until - now for key, until in self.active_cooldowns(now).items()
+            },
+        }
+
+    def to_dict(self, now: float) -> Dict[str, Any]:
+        """Serialize the partition for shared or persisted state."""
+        return {
+            "app": self.app_bucket.to_dict(now),
+            "methods": {
+                key: bucket.to_dict(now) for key, bucket in self.method_buckets.items()
+            },
+            "last_request_time": self.last_request_time,
+            "cooldowns": dict(self.active_cooldowns(now)),
+        }
+
+    @classmethod
+    def from_dict(cls, routing_value: str, data: Dict[str, Any]) -> "RoutingPartition":
+        """Restore a partition serialized with `to_dict`."""
+        partition = cls(routing_value)
+        partition.app_bucket = RateLimitBucket.from_dict(data.get("app", []))
+        partition.method_buckets = {
+            key: RateLimitBucket.from_dict(windows)
+            for key, windows in data.get("methods", {}).items()
+        }
+        partition.last_request_time = float(data.get("last_request_time", 0.0))
+        partition.cooldowns = {
+            key: float(until) for key, until in data.get("cooldowns", {}).items()
+        }
+        return partition
+
+
+class RateLimitBackend(ABC):
+    """Store holding the rate limit partitions.
+
+    Every client using the same backend store coordinates through it, so a
+    shared store lets API workers and scheduler jobs draw from one budget.
+    Implementations must make `acquire` atomic across all their users.
+    """
+
+    @abstractmethod
+    async def acquire(
+        self,
+        routing_value: str,
+        endpoint_key: str,
+        spacing: float,
+        reserve: float = 0.0,
+    ) -> float:
+        """
+        Take a permit for an endpoint key if every window allows it.
+
+        Args:
+            routing_value: Region or platform the request goes to
+            endpoint_key: Method rate limit key of the endpoint
+            spacing: Minimum seconds between requests to the routing value
+            reserve: Fraction of every window the caller must leave free
+
+        Returns:
+            0.0 when the permit was taken, otherwise seconds until the next try
+        """
+
+    @abstractmethod
+    async def update(
+        self,
+        routing_value: str,
+        endpoint_key: str,
+        app: Optional[RatePair],
+        method: Optional[RatePair],
+    ) -> None:
+        """
+        Apply the limits and counts Riot reported for a response.
+
+        Args:
+            routing_value: Region or platform the request went to
+            endpoint_key: Method rate limit key of the endpoint
+            app: Parsed (limits, counts) of the app headers, if present
+            method: Parsed (limits, counts) of the method headers, if present
+        """
+
+    @abstractmethod
+    async def cooldown(
+        self, routing_value: str, cooldown_key: str, until: float
+    ) -> None:
+        """
+        Stop handing out permits of a scope until the given time.
+
+        Args:
+            routing_value: Region or platform the 429 came from
+            cooldown_key: APP_COOLDOWN or the endpoint key of the scope
+            until: Epoch seconds the cooldown ends at
+        """
+
+    @abstractmethod
+    async def next_permit(
+        self, routing_value: str, endpoint_key: str, spacing: float
+    ) -> float:
+        """Return the earliest time (epoch seconds) a permit could be taken."""
+
+    @abstractmethod
+    async def stats(self) -> Dict[str, Any]:
+        """Return usage of every known window, per routing value."""
+
+    async def snapshot(self) -> Optional[Dict[str, Any]]:
+        """
+        Return the state to persist across restarts.
 
         Returns:
-            True if limit was reset, False otherwise
-        """
-        if remaining is not None and remaining <= 0:
-            if reset_time and reset_time > now:
-                wait_time = reset_time - now
-                logger.info(
-                    f"{scope_name} rate limit reached, waiting",
-                    wait_time=wait_time,
-                    remaining=remaining,
-                    endpoint=endpoint_key,
+            Serialized partitions, or None if the store outlives the process
+        """
+        return None
+
+    async def restore(self, state: Dict[str, Any]) -> None:
+        """
+        Rehydrate partitions from a snapshot.
+
+        Routing values already known to the store are left untouched, their
+        state is newer than any snapshot.
+
+        Args:
+            state: Serialized partitions as returned by `snapshot`
+        """
+        return None
+
+
+class InMemoryRateLimitBackend(RateLimitBackend):
+    """Process-local backend.
+
+    Operations never await, so they are atomic within the event loop.
+    """
+
+    def __init__(self):
+        """Initialize backend without any partitions."""
+        self.partitions: Dict[str, RoutingPartition] = {}
+
+    def _get_partition(self, routing_value: str) -> RoutingPartition:
+        """Return the partition of a routing value, creating it on first use."""
+        partition = self.partitions.get(routing_value)
+        if partition is None:
+            partition = RoutingPartition(routing_value)
+            self.partitions[routing_value] = partition
+        return partition
+
+    async def acquire(
+        self,
+        routing_value: str,
+        endpoint_key: str,
+        spacing: float,
+        reserve: float = 0.0,
+    ) -> float:
+        """Take a permit from the local partition."""
+        return self._get_partition(routing_value).acquire(
+            endpoint_key, time.time(), spacing, reserve
+        )
+
+    async def update(
+        self,
+        routing_value: str,
+        endpoint_key: str,
+        app: Optional[RatePair],
+        method: Optional[RatePair],
+    ) -> None:
+        """Apply reported limits to the local partition."""
+        self._get_partition(routing_value).update(
+            endpoint_key, app, method, time.time()
+        )
+
+    async def cooldown(
+        self, routing_value: str, cooldown_key: str, until: float
+    ) -> None:
+        """Start a cooldown in the local partition."""
+        self._get_partition(routing_value).cooldown(cooldown_key, until)
+
+    async def next_permit(
+        self, routing_value: str, endpoint_key: str, spacing: float
+    ) -> float:
+        """Return the earliest permit time of the local partition."""
+        return self._get_partition(routing_value).next_permit(
+            endpoint_key, time.time(), spacing
+        )
+
+    async def stats(self) -> Dict[str, Any]:
+        """Return usage of the local partitions."""
+        now = time.time()
+        return {
+            routing_value: partition.stats(now)
+            for routing_value, partition in self.partitions.items()
+        }
+
+    async def snapshot(self) -> Optional[Dict[str, Any]]:
+        """Serialize the local partitions."""
+        now = time.time()
+        return {
+            routing_value: partition.to_dict(now)
+            for routing_value, partition in self.partitions.items()
+        }
+
+    async def restore(self, state: Dict[str, Any]) -> None:
+        """Add partitions from a snapshot that are not known yet."""
+        for routing_value, data in state.items():
+            if routing_value not in self.partitions:
+                self.partitions[routing_value] = RoutingPartition.from_dict(
+                    routing_value, data
                 )
-                await asyncio.sleep(wait_time)
-                return False
-            else:
-                # Reset time passed, reset counter
-                return True
-        return False
-
-    def _get_endpoint_key(self, endpoint: str, method: str) -> str:
-        """Generate a key for the endpoint."""
-        stripped = endpoint.replace("https://", "").replace("http://", "")
-        path = stripped.split("/", 1)[1] if "/" in stripped else stripped
-        segments = [segment for segment in path.split("/") if segment]
 
-        if segments:
-            service_key = "-".join(segments[:4])
-        else:
-            service_key = path
 
-        return f"{method}:{service_key}"
+# Caller waiting for its turn: (current lane rank, arrival order, loop time it
+# may try from, future resolved when it is its turn)
+_Waiter = Tuple[Callable[[], int], int, float, "asyncio.Future[None]"]
+
+
+class _LaneQueue:
+    """Callers sharing one app bucket (routing value), served by priority lane.
+
+    One caller at a time, the head, asks the backend for a permit. Among
+    the callers ready to try, higher lanes go first and callers of the same
+    lane are served in arrival order, whatever endpoint they call. A caller
+    that has to wait steps aside until its next try instead of holding the
+    head, so waiting out a method window never blocks other endpoints, and
+    when an app window frees up the highest waiting lane gets the permit.
+    """
+
+    def __init__(self):
+        """Initialize an empty queue."""
+        self._waiters: List[_Waiter] = []
+        self._busy = False
+        self._timer: Optional[asyncio.TimerHandle] = None
+
+    async def acquire(
+        self, rank: Callable[[], int], sequence: int, delay: float = 0.0
+    ) -> None:
+        """
+        Wait until it is the caller's turn to try for a permit.
+
+        Args:
+            rank: Returns the lane rank of the caller (lower is served first),
+                read when turns are handed out so a caller can move up a lane
+                while it waits
+            sequence: Arrival order of the caller, kept across retries
+            delay: Seconds before the caller may try (its last wait time)
+        """
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._waiters.append((rank, sequence, loop.time() + delay, future))
+        self._dispatch()
+        try:
+            await future
+        except asyncio.CancelledError:
+            if future.done() and not future.cancelled():
+                # Got the turn right before being cancelled, hand it on
+                self.release()
+            raise
+
+    def wake(self, sequence: int) -> None:
+        """Let a waiting caller try at once, e.g. after it moved up a lane."""
+        now = asyncio.get_running_loop().time()
+        self._waiters = [
+            (rank, order, min(ready_at, now) if order == sequence else ready_at, future)
+            for rank, order, ready_at, future in self._waiters
+        ]
+        self._dispatch()
+
+    def release(self) -> None:
+        """End the turn of the head and start the next one."""
+        self._busy = False
+        self._dispatch()
+
+    def _dispatch(self) -> None:
+        """Give the turn to the first ready caller, or wake up when one is."""
+        self._waiters = [waiter for waiter in self._waiters if not waiter[3].done()]
+        if self._busy or not self._waiters:
+            return
+
+        waiter = self._first_ready()
+        if waiter is None:
+            self._wake_at(min(waiter[2] for waiter in self._waiters))
+            return
+
+        self._waiters.remove(waiter)
+        self._busy = True
+        waiter[3].set_result(None)
+
+    def _first_ready(self) -> Optional[_Waiter]:
+        """Return the highest lane, earliest caller allowed to try by now."""
+        now = asyncio.get_running_loop().time()
+        ready = [waiter for waiter in self._waiters if waiter[2] <= now]
+        return min(ready, key=lambda waiter: (waiter[0](), waiter[1]), default=None)
+
+    def _wake_at(self, when: float) -> None:
+        """Dispatch again at loop time when."""
+        if self._timer is not None:
+            self._timer.cancel()
+        self._timer = asyncio.get_running_loop().call_at(when, self._dispatch)
+
+
+# Lane ranks, lower ranks are served first
+_LANE_RANKS = {priority: rank for rank, priority in enumerate(RequestPriority)}
+
+
+class LaneTicket:
+    """Lane of a call that can move up to a higher lane while it waits.
+
+    A request shared by several callers starts in the lane of the first
+    one. When a caller of a higher lane joins, `raise_to` moves the request
+    up and lets it try for a permit at once, since the higher lane may use
+    capacity (the interactive reserve) the lower one could not.
+    """
+
+    def __init__(self, priority: RequestPriority):
+        """
+        Initialize ticket.
+
+        Args:
+            priority: Lane the call starts in
+        """
+        self.priority = RequestPriority(priority)
+        # Wakes the call up while it waits in RateLimiter.wait_if_needed
+        self._wake: Optional[Callable[[], None]] = None
+
+    @property
+    def rank(self) -> int:
+        """Rank of the current lane (lower is served first)."""
+        return _LANE_RANKS[self.priority]
+
+    def raise_to(self, priority: RequestPriority) -> None:
+        """Move the call to a higher lane (lower lanes are ignored)."""
+        priority = RequestPriority(priority)
+        if _LANE_RANKS[priority] >= self.rank:
+            return
+        self.priority = priority
+        if self._wake is not None:
+            self._wake()
+
+
+class RateLimiter:
+    """Multi-window rate limiter calibrated by Riot API response headers."""
 
-    def _update_app_limit(self, remaining: int, reset_time: float) -> None:
-        """Update application-wide rate limit if more restrictive."""
-        if self.app_remaining is None or remaining < self.app_remaining:
-            self.app_remaining = remaining
-            self.app_reset_time = reset_time
+    def __init__(
+        self,
+        backend: Optional[RateLimitBackend] = None,
+        snapshots: Optional["RateLimitSnapshotStore"] = None,
+        interactive_reserve: float = 0.0,
+    ):
+        """
+        Initialize rate limiter.
 
-    def _update_method_limit(
-        self, endpoint_key: str, remaining: int, reset_time: float
+        Args:
+            backend: Store holding the rate limit state (process-local if None)
+            snapshots: Persists backend state across restarts (disabled if None)
+            interactive_reserve: Fraction of every window only interactive
+                calls may use
+        """
+        self.backend = backend or InMemoryRateLimitBackend()
+        self.snapshots = snapshots
+        self.interactive_reserve = interactive_reserve
+
+        # Used when a shared backend is unreachable, so requests keep being
+        # limited by what this process knows instead of failing
+        self._fallback = InMemoryRateLimitBackend()
+
+        # Request spacing to avoid bursts (applied per routing value), sized
+        # from the app limits once Riot reports them
+        self.key_limits = ApiKeyLimits()
+        self.request_spacing = self.key_limits.request_spacing
+
+        # Per routing value (app bucket) queues, served by priority lane
+        self._queues: Dict[str, _LaneQueue] = {}
+        self._sequence = itertools.count()
+
+        # Seconds of throughput lost to 429 cooldowns and 5xx backoff, by reason
+        self.cooldown_totals: Dict[str, Dict[str, float]] = {}
+        # End of the last cooldown started per (routing value, cooldown key),
+        # so overlapping 429s of concurrent callers are not counted twice
+        self._cooldown_ends: Dict[Tuple[str, str], float] = {}
+
+        # Periodic snapshot started by a response, if one is running
+        self._save_task: Optional["asyncio.Task[None]"] = None
+
+    async def wait_if_needed(
+        self,
+        endpoint: str,
+        method: str = "GET",
+        priority: Union[RequestPriority, LaneTicket] = RequestPriority.NORMAL,
     ) -> None:
-        """Update method-specific rate limit if more restrictive."""
-        current = self.method_remaining.get(endpoint_key)
-        if current is None or remaining < current:
-            self.method_remaining[endpoint_key] = remaining
-            self.method_reset_time[endpoint_key] = reset_time
+        """
+        Wait until every app and method window has capacity, then take a permit.
+
+        Callers queue per routing value, the app bucket they share, and take
+        turns asking the backend for a permit: higher lanes first, then in
+        arrival order. A caller without a permit waits outside of any lock
+        until its next try, so a caller waiting out a method window never
+        blocks callers of other endpoints. The backend re-checks all windows
+        on every try because other endpoints (or other processes) may have
+        used app capacity meanwhile. Non-interactive callers leave the
+        interactive reserve of every window untouched.
+
+        Args:
+            endpoint: API endpoint being called
+            method: HTTP method being used
+            priority: Lane of the call, or a ticket whose lane can be raised
+                while the call waits
+        """
+        routing_value, endpoint_key = self._resolve(endpoint, method)
+        ticket = priority if isinstance(priority, LaneTicket) else LaneTicket(priority)
+        sequence = next(self._sequence)
+        queue = self._get_queue(routing_value)
+        wait_time = 0.0
+        logged = False
+
+        ticket._wake = lambda: queue.wake(sequence)
+        try:
+            while True:
+                await queue.acquire(lambda: ticket.rank, sequence, wait_time)
+                lane = ticket.priority
+                try:
+                    wait_time = await self._acquire(
+                        routing_value, endpoint_key, self.lane_reserve(lane)
+                    )
+                finally:
+                    queue.release()
+                if wait_time <= 0:
+                    return
+                if ticket.priority != lane:
+                    # Raised during the try, the new lane may not have to wait
+                    wait_time = 0.0
+                    continue
+                logged = logged or self._log_wait(wait_time, endpoint_key, lane)
+        finally:
+            ticket._wake = None
+
+    def _log_wait(
+        self, wait_time: float, endpoint_key: str, lane: RequestPriority
+    ) -> bool:
+        """Log a wait longer than the request spacing, returning whether it did."""
+        if wait_time <= self.request_spacing:
+            return False
+        logger.info(
+            "Rate limit reached, waiting",
+            wait_time=wait_time,
+            endpoint=endpoint_key,
+            priority=lane.value,
+        )
+        return True
+
+    async def _acquire(
+        self, routing_value: str, endpoint_key: str, reserve: float
+    ) -> float:
+        """Try to take a permit, falling back to local state on backend errors."""
+        try:
+            return await self.backend.acquire(
+                routing_value, endpoint_key, self.request_spacing, reserve
+            )
+        except Exception as e:
+            logger.warning(
+                "Rate limit backend unavailable, using local state",
+                backend=type(self.backend).__name__,
+                error=str(e),
+            )
+            return await self._fallback.acquire(
+                routing_value, endpoint_key, self.request_spacing, reserve
+            )
+
+    def _get_queue(self, routing_value: str) -> _LaneQueue:
+        """Return the queue for callers of a routing value."""
+        queue = self._queues.get(routing_value)
+        if queue is None:
+            queue = _LaneQueue()
+            self._queues[routing_value] = queue
+        return queue
+
+    async def next_permit_time(self, endpoint: str, method: str = "GET") -> float:
+        """
+        Return the earliest time (epoch seconds) a request could be sent.
+
+        Args:
+            endpoint: API endpoint to check
+            method: HTTP method to check
+        """
+        routing_value, endpoint_key = self._resolve(endpoint, method)
+        return await self.backend.next_permit(
+            routing_value, endpoint_key, self.request_spacing
+        )
+
+    def _resolve(self, endpoint: str, method: str) -> Tuple[str, str]:
+        """
+        Resolve an endpoint to its routing value and method rate limit key.
+
+        Known endpoints are keyed by their route template plus routing value
+        (e.g. "GET:europe:match-v5.match-by-id"), so routes that share a path
+        prefix still get their own method buckets. Unknown paths fall back to
+        their leading path segments.
+
+        Returns:
+            Tuple of (routing value, endpoint key)
+        """
+        routing_value, route = resolve_route(endpoint)
+        if route is not None:
+            return routing_value, f"{method}:{routing_value}:{route.value}"
+
+        path = urlsplit(endpoint if "://" in endpoint else f"https://{endpoint}").path
+        segments = [segment for segment in path.split("/") if segment]
+        service_key = "-".join(segments[:4]) if segments else path
+        return routing_value, f"{method}:{routing_value}:{service_key}"
 
     def _parse_rate_headers(
         self, limit_header: str, count_header: str
-    ) -> tuple[list, list] | None:
+    ) -> Optional[RatePair]:
         """
         Parse rate limit header pair.
 
@@ -152,121 +953,211 @@ class RateLimiter:
 
         return (limits, counts)
 
-    def _apply_rate_limit_update(
-        self,
-        limit: Dict,
-        count: Dict,
-        scope: str,
-        endpoint_key: str | None = None,
+    async def update_limits(
+        self, headers: Mapping[str, str], endpoint: str, method: str = "GET"
     ) -> None:
         """
-        Apply a single rate limit update to internal state.
+        Update rate limits from Riot API response headers.
 
         Args:
-            limit: Parsed limit dict with 'requests' and 'window' keys
-            count: Parsed count dict with 'requests' key
-            scope: Either "app" or "method" for logging
-            endpoint_key: Endpoint key for method-scoped limits
+            headers: Response headers containing rate limit info
+            endpoint: API endpoint that was called
+            method: HTTP method used
         """
-        limit_requests = limit["requests"]
-        used_requests = count["requests"]
-        window = limit["window"]
+        try:
+            routing_value, endpoint_key = self._resolve(endpoint, method)
+            app, method_limits = self._parse_response_limits(headers)
+            if app is None and method_limits is None:
+                return
 
-        remaining = limit_requests - used_requests
-        reset_time = time.time() + window
+            if app is not None:
+                self._check_key_limits(headers.get("X-App-Rate-Limit", ""))
+            await self.backend.update(routing_value, endpoint_key, app, method_limits)
+            self._schedule_save()
 
-        # Update app-level limit
-        if scope == "app":
-            self._update_app_limit(remaining, reset_time)
             logger.debug(
-                "Updated app rate limit",
-                limit=limit_requests,
-                used=used_requests,
-                remaining=remaining,
-                window=window,
+                "Updated rate limits",
+                endpoint=endpoint_key,
+                app_count=headers.get("X-App-Rate-Limit-Count"),
+                method_count=headers.get("X-Method-Rate-Limit-Count"),
             )
-            return
 
-        # Update method-level limit
-        if endpoint_key:
-            self._update_method_limit(endpoint_key, remaining, reset_time)
-            logger.debug(
-                "Updated method rate limit",
-                endpoint=endpoint_key,
-                limit=limit_requests,
-                used=used_requests,
-                remaining=remaining,
-                window=window,
+        except Exception as e:
+            logger.warning(
+                "Failed to update rate limits",
+                error=str(e),
+                headers={
+                    k: v
+                    for k, v in headers.items()
+                    if k.lower().startswith(("x-app-rate", "x-method-rate"))
+                },
             )
 
-    def _process_rate_limit_pair(
-        self,
-        limit_header: str,
-        count_header: str,
-        scope: str,
-        endpoint_key: str | None = None,
-    ) -> None:
-        """
-        Process a pair of rate limit headers and update internal state.
+    def _parse_response_limits(
+        self, headers: Mapping[str, str]
+    ) -> Tuple[Optional[RatePair], Optional[RatePair]]:
+        """Return the parsed app and method header pairs of a response."""
+        app = self._parse_rate_headers(
+            headers.get("X-App-Rate-Limit", ""),
+            headers.get("X-App-Rate-Limit-Count", ""),
+        )
+        method_limits = self._parse_rate_headers(
+            headers.get("X-Method-Rate-Limit", ""),
+            headers.get("X-Method-Rate-Limit-Count", ""),
+        )
+        return app, method_limits
 
-        Args:
-            limit_header: Rate limit header value (e.g., "20:1,100:120")
-            count_header: Rate count header value (e.g., "15:1,80:120")
-            scope: Either "app" or "method" for logging
-            endpoint_key: Endpoint key for method-scoped limits
+    def _check_key_limits(self, header: str) -> None:
+        """Learn the app limits of the key if unknown or changed."""
+        if not self.key_limits.learned or header != self.key_limits.header:
+            self._learn_key_limits(header)
+
+    def _schedule_save(self) -> None:
+        """Persist backend state in the background once the interval elapsed.
+
+        Responses only check the interval; the snapshot is written by a
+        single background task, so no request waits on the database.
         """
-        parsed = self._parse_rate_headers(limit_header, count_header)
-        if not parsed:
+        if self.snapshots is None or not self.snapshots.due():
             return
+        if self._save_task is None or self._save_task.done():
+            self._save_task = asyncio.ensure_future(self.save_state())
+
+    def _learn_key_limits(self, header: str) -> None:
+        """
+        Size the limiter for the app limits of the key.
 
-        limits, counts = parsed
-        for limit, count in zip(limits, counts):
-            self._apply_rate_limit_update(limit, count, scope, endpoint_key)
+        Args:
+            header: X-App-Rate-Limit header value
+        """
+        self.key_limits = ApiKeyLimits(header, learned=True)
+        self.request_spacing = self.key_limits.request_spacing
+        logger.info("Detected Riot API key limits", **self.key_limits.to_dict())
 
-    def update_limits(
-        self, headers: Dict[str, str], endpoint: str, method: str = "GET"
+    async def cooldown(
+        self,
+        endpoint: str,
+        method: str,
+        scope: RateLimitScope,
+        seconds: float,
     ) -> None:
         """
-        Update rate limits from Riot API response headers.
+        Pause every caller sharing the scope of a 429.
+
+        An application 429 pauses all endpoints of the routing value, method
+        and service 429s pause the endpoint. The cooldown lives in the backend,
+        so every caller of the store honors it, and is only ever extended.
 
         Args:
-            headers: Response headers containing rate limit info
-            endpoint: API endpoint that was called
+            endpoint: API endpoint that returned the 429
             method: HTTP method used
+            scope: Scope reported by the X-Rate-Limit-Type header
+            seconds: Length of the cooldown
         """
+        routing_value, endpoint_key = self._resolve(endpoint, method)
+        cooldown_key = (
+            APP_COOLDOWN if scope == RateLimitScope.APPLICATION else endpoint_key
+        )
+        now = time.time()
+        until = now + seconds
+
+        previous_end = self._cooldown_ends.get((routing_value, cooldown_key), 0.0)
+        if until > previous_end:
+            self._cooldown_ends[(routing_value, cooldown_key)] = until
+            self.record_backoff(scope.value, until - max(now, previous_end))
+
+        logger.warning(
+            "Rate limit cooldown started",
+            scope=scope.value,
+            routing=routing_value,
+            endpoint=endpoint_key,
+            seconds=round(seconds, 3),
+        )
+
         try:
-            # Process app rate limits
-            self._process_rate_limit_pair(
-                headers.get("X-App-Rate-Limit", ""),
-                headers.get("X-App-Rate-Limit-Count", ""),
-                scope="app",
+            await self.backend.cooldown(routing_value, cooldown_key, until)
+        except Exception as e:
+            logger.warning(
+                "Rate limit backend unavailable, using local state",
+                backend=type(self.backend).__name__,
+                error=str(e),
             )
+            await self._fallback.cooldown(routing_value, cooldown_key, until)
+        self._schedule_save()
 
-            # Process method rate limits
-            endpoint_key = self._get_endpoint_key(endpoint, method)
-            self._process_rate_limit_pair(
-                headers.get("X-Method-Rate-Limit", ""),
-                headers.get("X-Method-Rate-Limit-Count", ""),
-                scope="method",
-                endpoint_key=endpoint_key,
-            )
+    def record_backoff(self, reason: str, seconds: float) -> None:
+        """
+        Add time lost to a cooldown or backoff to the totals.
 
+        Args:
+            reason: Rate limit scope, or "server_error" for 5xx backoff
+            seconds: Seconds requests were held back
+        """
+        totals = self.cooldown_totals.setdefault(reason, {"count": 0, "seconds": 0.0})
+        totals["count"] += 1
+        totals["seconds"] += seconds
+
+    def get_cooldown_stats(self) -> Dict[str, Dict[str, float]]:
+        """Return how often and for how long requests were held back, by reason."""
+        return {reason: dict(totals) for reason, totals in self.cooldown_totals.items()}
+
+    async def restore_state(self) -> None:
+        """Rehydrate state persisted by a previous process, once per backend."""
+        if self.snapshots is not None:
+            await self.snapshots.restore()
+
+        # Limits of the key are known before the first response if a previous
+        # process (or another one sharing the store) saw them
+        if not self.key_limits.learned:
+            stats = await self.planning_stats()
+            for partition in stats.values():
+                windows = partition.get("app") or []
+                if windows:
+                    self._learn_key_limits(
+                        ",".join(
+                            f"{int(window['limit'])}:{int(window['window'])}"
+                            for window in sorted(windows, key=lambda w: w["window"])
+                        )
+                    )
+                    break
+
+    async def save_state(self, force: bool = False) -> None:
+        """
+        Persist backend state if the snapshot interval has elapsed.
+
+        Args:
+            force: Save regardless of the interval (e.g. on shutdown)
+        """
+        if self.snapshots is not None:
+            await self.snapshots.save(force=force)
+
+    async def get_stats(self) -> Dict[str, Any]:
+        """Return current usage of every known window, per routing value."""
+        return await self.backend.stats()
+
+    async def planning_stats(self) -> Dict[str, Any]:
+        """Return bucket state for planning, local state if the backend fails."""
+        try:
+            return await self.backend.stats()
         except Exception as e:
             logger.warning(
-                "Failed to parse rate limit headers",
+                "Rate limit backend unavailable, planning with local state",
+                backend=type(self.backend).__name__,
                 error=str(e),
-                headers={
-                    k: v
-                    for k, v in headers.items()
-                    if k.startswith("X-App-Rate") or k.startswith("X-Method-Rate")
-                },
             )
+            return await self._fallback.stats()
+
+    def lane_reserve(self, priority: RequestPriority) -> float:
+        """Return the fraction of every window a lane must leave free."""
+        if priority == RequestPriority.INTERACTIVE:
+            return 0.0
+        return self.interactive_reserve
 
     async def record_success(self, endpoint: str, method: str = "GET") -> None:
         """
         Record a successful request.
 
-        Note: With header-based approach, this is a no-op since headers
-        provide the truth about remaining requests.
+        Note: Permits are recorded when they are issued and corrected from
+        response headers, so there is nothing left to do here.
         """
         pass
@@ -0,0 +1,227 @@
+"""Estimates of how long planned Riot API calls take under the rate limits."""
+
+import math
+from typing import Any, Dict, List, Mapping, Optional, Tuple
+
+from .constants import RequestPriority, RiotRoute
+from .endpoints import parse_rate_limit_header
+from .rate_limiter import APP_COOLDOWN, DEFAULT_APP_LIMITS, RateLimiter, RateLimitWindow
+
+# Planned calls by (routing value, route)
+PlannedCalls = Mapping[Tuple[str, RiotRoute], int]
+
+# Seconds until the last call gets its permit, and the limit that bounds it
+Bound = Tuple[float, Optional[str]]
+
+
+class RatePlan:
+    """Estimate of how long a set of planned calls takes under the rate limits."""
+
+    def __init__(self, eta: float, calls: int, bottleneck: Optional[str] = None):
+        """
+        Initialize plan.
+
+        Args:
+            eta: Seconds until the last planned call gets its permit
+            calls: Number of planned calls
+            bottleneck: Limit the ETA is bound by (None if nothing waits)
+        """
+        self.eta = eta
+        self.calls = calls
+        self.bottleneck = bottleneck
+
+    @property
+    def eta_minutes(self) -> int:
+        """ETA rounded up to whole minutes."""
+        return math.ceil(self.eta / 60)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Return the plan for logs and API responses."""
+        return {"eta": self.eta, "calls": self.calls, "bottleneck": self.bottleneck}
+
+
+async def plan(
+    limiter: RateLimiter,
+    calls: PlannedCalls,
+    priority: RequestPriority = RequestPriority.NORMAL,
+) -> RatePlan:
+    """
+    Estimate how long the planned calls take from the current bucket state.
+
+    Uses the learned app and method limits, what is already used of every
+    window, active cooldowns and request spacing. Routes without a learned
+    method limit are bound by the app limits only, and app limits not learned
+    yet are assumed to be those of a development key. The estimate assumes
+    nobody else uses the key meanwhile.
+
+    Args:
+        limiter: Rate limiter of the API key making the calls
+        calls: Number of planned calls by (routing value, route)
+        priority: Lane the calls will be made in
+
+    Returns:
+        Plan with the ETA of the last call and the limit it is bound by
+    """
+    stats = await limiter.planning_stats()
+    return estimate(
+        stats, calls, limiter.lane_reserve(priority), limiter.request_spacing
+    )
+
+
+async def capacity(
+    limiter: RateLimiter,
+    per_unit: PlannedCalls,
+    seconds: float,
+    priority: RequestPriority = RequestPriority.NORMAL,
+    maximum: int = 10_000,
+) -> int:
+    """
+    Return how many units of work fit into a time budget.
+
+    A unit is e.g. one player to update, needing `per_unit` calls.
+
+    Args:
+        limiter: Rate limiter of the API key making the calls
+        per_unit: Calls needed per unit by (routing value, route)
+        seconds: Time budget
+        priority: Lane the calls will be made in
+        maximum: Upper bound of the answer
+
+    Returns:
+        Largest number of units whose calls are estimated to finish in time
+    """
+    stats = await limiter.planning_stats()
+    reserve = limiter.lane_reserve(priority)
+    low, high = 0, maximum
+    while low < high:
+        units = (low + high + 1) // 2
+        calls = {key: count * units for key, count in per_unit.items()}
+        plan_eta = estimate(stats, calls, reserve, limiter.request_spacing).eta
+        if plan_eta <= seconds:
+            low = units
+        else:
+            high = units - 1
+    return low
+
+
+def estimate(
+    stats: Dict[str, Any], calls: PlannedCalls, reserve: float, spacing: float
+) -> RatePlan:
+    """
+    Estimate planned calls against bucket state from `RateLimiter.get_stats`.
+
+    Args:
+        stats: Bucket state per routing value
+        calls: Number of planned calls by (routing value, route)
+        reserve: Fraction of every window the calls must leave free
+        spacing: Minimum seconds between two calls of a routing value
+
+    Returns:
+        Plan bound by the slowest method, app or spacing limit
+    """
+    per_routing: Dict[str, int] = {}
+    bounds: List[Bound] = []
+
+    for (routing_value, route), count in calls.items():
+        if count <= 0:
+            continue
+        per_routing[routing_value] = per_routing.get(routing_value, 0) + count
+        bounds.append(_method_bound(stats, routing_value, route, count, reserve))
+
+    for routing_value, count in per_routing.items():
+        bounds.extend(_app_bounds(stats, routing_value, count, reserve, spacing))
+
+    eta, bottleneck = 0.0, None
+    for bound_eta, limit in bounds:
+        if bound_eta > eta:
+            eta, bottleneck = bound_eta, limit
+    return RatePlan(eta, sum(per_routing.values()), bottleneck)
+
+
+def _method_bound(
+    stats: Dict[str, Any],
+    routing_value: str,
+    route: RiotRoute,
+    count: int,
+    reserve: float,
+) -> Bound:
+    """Return when the method bucket of a route has issued count permits."""
+    partition = stats.get(routing_value, {})
+    endpoint_key = f"GET:{routing_value}:{RiotRoute(route).value}"
+    windows = partition.get("methods", {}).get(endpoint_key, [])
+    cooldown = partition.get("cooldowns", {}).get(endpoint_key, 0.0)
+    eta, window = _windows_eta(windows, count, reserve)
+    if window is None:
+        return cooldown + eta, f"{endpoint_key} cooldown"
+    return (
+        cooldown + eta,
+        f"{endpoint_key} method limit {window['limit']}:{window['window']}",
+    )
+
+
+def _app_bounds(
+    stats: Dict[str, Any],
+    routing_value: str,
+    count: int,
+    reserve: float,
+    spacing: float,
+) -> List[Bound]:
+    """Return when the app bucket and the spacing have issued count permits."""
+    partition = stats.get(routing_value, {})
+    windows = partition.get("app") or _default_app_windows()
+    cooldown = partition.get("cooldowns", {}).get(APP_COOLDOWN, 0.0)
+    eta, window = _windows_eta(windows, count, reserve)
+    limit = (
+        f"{routing_value} app limit {window['limit']}:{window['window']}"
+        if window
+        else f"{routing_value} app cooldown"
+    )
+    return [
+        (cooldown + eta, limit),
+        ((count - 1) * spacing, f"{routing_value} request spacing"),
+    ]
+
+
+def _default_app_windows() -> List[Dict[str, Any]]:
+    """Return unused app windows of a development key."""
+    return [
+        {
+            "limit": item["requests"],
+            "window": item["window"],
+            "used": 0,
+            "reset_in": 0.0,
+        }
+        for item in parse_rate_limit_header(DEFAULT_APP_LIMITS)
+    ]
+
+
+def _windows_eta(
+    windows: List[Dict[str, Any]], count: int, reserve: float
+) -> Tuple[float, Optional[Dict[str, Any]]]:
+    """
+    Estimate when the last of count permits fits into every window.
+
+    Permits left in a window are free; beyond that the window issues permits
+    at its steady rate (limit per window length), but not before its oldest
+    entry expires.
+
+    Args:
+        windows: Window usage as returned by RateLimitBucket.stats
+        count: Number of permits needed
+        reserve: Fraction of every window the caller must leave free
+
+    Returns:
+        Tuple of (seconds, window the estimate is bound by or None)
+    """
+    eta, bound = 0.0, None
+    for window in windows:
+        if window["window"] <= 0 or window["limit"] <= 0:
+            continue
+        usable = RateLimitWindow(window["limit"], window["window"]).usable(reserve)
+        free = max(0, usable - window["used"])
+        if count <= free:
+            continue
+        window_eta = max(window["reset_in"], (count - free) * window["window"] / usable)
+        if window_eta > eta:
+            eta, bound = window_eta, window
+    return eta, bound
@@ -0,0 +1,97 @@
+"""Process-wide registry of Riot API clients."""
+
+import asyncio
+from typing import Dict, List
+
+import structlog
+
+from .client import RiotAPIClient
+
+logger = structlog.get_logger(__name__)
+
+# Seconds a client of a replaced API key stays open, so requests it already
+# sent (and their retries) can finish before its connections are closed
+RETIRE_GRACE = 60.0
+
+
+class RiotClientRegistry:
+    """Shares one RiotAPIClient per API key across the whole process.
+
+    Routers and scheduler jobs reuse the same client, so pooled connections
+    (and their TLS sessions) survive between requests and job runs, and
+    in-flight requests are coalesced across all callers. Clients are closed
+    by the application lifespan on shutdown, never by their users.
+
+    Callers always ask for the currently configured key, so when a new key
+    is asked for, the clients of older keys are dropped from the registry
+    (their metrics stop being exported) and closed after RETIRE_GRACE.
+    """
+
+    def __init__(self):
+        """Initialize registry without any clients."""
+        self._clients: Dict[str, RiotAPIClient] = {}
+        self._lock = asyncio.Lock()
+        # Clients of replaced keys not closed yet, with their pending close
+        self._retiring: Dict["asyncio.Task[None]", RiotAPIClient] = {}
+
+    async def get(self, api_key: str) -> RiotAPIClient:
+        """
+        Return the started client of an API key, creating it on first use.
+
+        Args:
+            api_key: Riot API key the client authenticates with
+
+        Returns:
+            Shared RiotAPIClient with an open session
+        """
+        client = self._clients.get(api_key)
+        if client is None:
+            async with self._lock:
+                client = self._clients.get(api_key)
+                if client is None:
+                    self._retire_others(api_key)
+                    client = RiotAPIClient(api_key=api_key)
+                    self._clients[api_key] = client
+
+        await client.start_session()
+        return client
+
+    def _retire_others(self, api_key: str) -> None:
+        """Drop the clients of every other key and close them after a grace period."""
+        for old_key in [key for key in self._clients if key != api_key]:
+            client = self._clients.pop(old_key)
+            logger.info("Retiring Riot API client of a replaced API key")
+            task = asyncio.create_task(self._close_later(client))
+            self._retiring[task] = client
+            task.add_done_callback(lambda done: self._retiring.pop(done, None))
+
+    async def _close_later(self, client: RiotAPIClient) -> None:
+        """Close a retired client once its running requests had time to end."""
+        await asyncio.sleep(RETIRE_GRACE)
+        await self._close_client(client)
+
+    @staticmethod
+    async def _close_client(client: RiotAPIClient) -> None:
+        """Close a client, logging instead of raising on failure."""
+        try:
+            await client.close()
+        except Exception as e:
+            logger.warning("Failed to close Riot API client", error=str(e))
+
+    def clients(self) -> List[RiotAPIClient]:
+        """Return the clients created so far (e.g. to collect their metrics)."""
+        return list(self._clients.values())
+
+    async def close(self) -> None:
+        """Close every client, including retired ones, and forget it."""
+        clients = [*self._retiring.values(), *self._clients.values()]
+        for task in list(self._retiring):
+            task.cancel()
+        self._retiring.clear()
+        self._clients.clear()
+        for client in clients:
+            await self._close_client(client)
+
+
+# Global registry, closed by the application lifespan
+riot_client_registry = RiotClientRegistry()
@@ -1,9 +1,10 @@
 """Data transformation utilities for Riot API match data."""
 
-from typing import Dict, List, Any
+from typing import Dict, List, Any, Sequence
 import structlog
 
 from app.core.validation import validate_nested_fields, validate_list_items
+from .models import MatchDTO
 
 logger = structlog.get_logger(__name__)
 
@@ -88,7 +89,7 @@ class MatchTransformer:
                     "total_damage_dealt_to_champions": participant.get(
                         "totalDamageDealtToChampions", 0
                     ),
-                    "total_damage_taken": participant.get("damageTaken", 0),
+                    "total_damage_taken": participant.get("totalDamageTaken", 0),
                     "total_heal": participant.get("totalHeal", 0),
                     "individual_position": participant.get("individualPosition"),
                     "team_position": participant.get("teamPosition"),
@@ -122,6 +123,68 @@ class MatchTransformer:
             return float(kills + assists)
         return (kills + assists) / deaths
 
+    def to_match_dto(self, match: Any, participants: Sequence[Any]) -> MatchDTO:
+        """
+        Rebuild a MatchDTO from stored match and participant rows.
+
+        Only stored columns are available: creep score is reported as
+        minions killed (neutral minions 0) and names missing in the database
+        are empty strings.
+
+        Args:
+            match: Match row
+            participants: MatchParticipant rows of the match, in API order
+
+        Returns:
+            MatchDTO equivalent to the stored subset of the API response
+        """
+        return MatchDTO(
+            metadata={
+                "match_id": match.match_id,
+                "participants": [p.puuid for p in participants],
+            },
+            info={
+                "game_creation": match.game_creation,
+                "game_duration": match.game_duration,
+                "queue_id": match.queue_id,
+                "map_id": match.map_id,
+                "game_version": match.game_version,
+                "game_mode": match.game_mode or "",
+                "game_type": match.game_type or "",
+                "platform_id": match.platform_id,
+                "participants": [
+                    self._participant_to_dto_data(p) for p in participants
+                ],
+            },
+        )
+
+    def _participant_to_dto_data(self, participant: Any) -> Dict[str, Any]:
+        """Map a stored participant row to ParticipantDTO fields."""
+        return {
+            "puuid": participant.puuid,
+            "summoner_name": participant.summoner_name or "",
+            "summoner_level": participant.summoner_level,
+            "riot_id_game_name": participant.riot_id_name,
+            "riot_id_tagline": participant.riot_id_tagline,
+            "team_id": participant.team_id,
+            "win": participant.win,
+            "champion_id": participant.champion_id,
+            "champion_name": participant.champion_name,
+            "kills": participant.kills,
+            "deaths": participant.deaths,
+            "assists": participant.assists,
+            "champ_level": participant.champ_level,
+            "vision_score": participant.vision_score,
+            "gold_earned": participant.gold_earned,
+            "total_minions_killed": participant.cs,
+            "neutral_minions_killed": 0,
+            "total_damage_dealt_to_champions": participant.total_damage_dealt_to_champions,
+            "total_damage_taken": participant.total_damage_taken,
+            "role": participant.role,
+            "individual_position": participant.individual_position,
+            "team_position": participant.team_position,
+        }
+
     def validate_match_data(self, match_data: Dict[str, Any]) -> bool:
         """
         Validate that match data has required fields.
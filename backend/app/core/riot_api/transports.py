@@ -0,0 +1,185 @@
+"""httpx transports the Riot API client can be pointed at instead of the network."""
+
+import asyncio
+import base64
+import gzip
+import json
+import time
+from collections import deque
+from typing import Any, Deque, Dict, Optional, Set, Tuple
+
+import httpx
+import structlog
+
+logger = structlog.get_logger(__name__)
+
+# Cassettes written by this process; a session that is reopened appends to
+# its cassette instead of overwriting what it recorded before
+_recorded_paths: Set[str] = set()
+
+
+class BaseURLTransport(httpx.AsyncBaseTransport):
+    """Sends every request to another server, keeping the original Host header.
+
+    Endpoints keep building the real Riot API URLs, so route and routing
+    value resolution (and thus rate limiting) is unchanged; the server behind
+    `base_url` (e.g. the fake Riot API) reads the routing value from Host.
+    """
+
+    def __init__(self, base_url: str, **transport_options):
+        """
+        Initialize transport.
+
+        Args:
+            base_url: Scheme, host and port to send requests to
+            transport_options: Options of the wrapped httpx.AsyncHTTPTransport
+        """
+        target = httpx.URL(base_url)
+        self.scheme = target.scheme
+        self.host = target.host
+        self.port = target.port
+        self.transport = httpx.AsyncHTTPTransport(**transport_options)
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        """Send request to the base URL."""
+        request.url = request.url.copy_with(
+            scheme=self.scheme, host=self.host, port=self.port
+        )
+        return await self.transport.handle_async_request(request)
+
+    async def aclose(self) -> None:
+        """Close the wrapped transport."""
+        await self.transport.aclose()
+
+
+class CassetteError(RuntimeError):
+    """A replayed request has no recorded response left."""
+
+
+class RecordingTransport(httpx.AsyncBaseTransport):
+    """Records every response of a transport to a cassette file.
+
+    A cassette is gzip-compressed JSON lines, one response per line: method,
+    URL, status, headers (including the rate limit headers), the raw body as
+    received (still content-encoded) and timing. Request headers are not
+    recorded, so the API key never ends up in a cassette.
+    """
+
+    def __init__(self, transport: httpx.AsyncBaseTransport, path: str):
+        """
+        Initialize transport.
+
+        Args:
+            transport: Transport that sends the requests
+            path: Cassette file to write (overwritten by the first recording
+                of the process, appended to afterwards)
+        """
+        self.transport = transport
+        self.path = path
+        self.started = time.monotonic()
+        self.recorded = 0
+        mode = "at" if path in _recorded_paths else "wt"
+        _recorded_paths.add(path)
+        self._file = gzip.open(path, mode, encoding="utf-8")
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        """Send request and record its response."""
+        sent = time.monotonic()
+        response = await self.transport.handle_async_request(request)
+        try:
+            raw = b"".join([chunk async for chunk in response.aiter_raw()])
+        finally:
+            await response.aclose()
+        elapsed = time.monotonic() - sent
+
+        entry = {
+            "method": request.method,
+            "url": str(request.url),
+            "offset": sent - self.started,
+            "elapsed": elapsed,
+            "status": response.status_code,
+            "headers": response.headers.multi_items(),
+            "body": base64.b64encode(raw).decode("ascii"),
+        }
+        self._file.write(json.dumps(entry) + "\n")
+        self.recorded += 1
+
+        return httpx.Response(
+            response.status_code,
+            headers=response.headers,
+            content=raw,
+            request=request,
+            extensions=response.extensions,
+        )
+
+    async def aclose(self) -> None:
+        """Close the wrapped transport and finish the cassette."""
+        try:
+            await self.transport.aclose()
+        finally:
+            if not self._file.closed:
+                self._file.close()
+                logger.info(
+                    "Riot API cassette recorded",
+                    path=self.path,
+                    responses=self.recorded,
+                )
+
+
+class ReplayTransport(httpx.AsyncBaseTransport):
+    """Serves the responses of a cassette instead of sending requests.
+
+    Responses are matched on method and URL; repeated requests of a URL get
+    the recorded responses in recording order (e.g. a 429, then the 200 of
+    the retry), so a replayed run sees the same statuses and rate limit
+    headers as the recorded one. Each response is delayed by its recorded
+    latency times `timing_scale` (0 replays as fast as possible).
+    """
+
+    def __init__(self, path: str, timing_scale: float = 1.0):
+        """
+        Initialize transport.
+
+        Args:
+            path: Cassette file written by RecordingTransport
+            timing_scale: Factor applied to recorded latencies
+        """
+        self.path = path
+        self.timing_scale = timing_scale
+        self.responses: Dict[Tuple[str, str], Deque[Dict[str, Any]]] = {}
+        with gzip.open(path, "rt", encoding="utf-8") as file:
+            for line in file:
+                entry = json.loads(line)
+                key = (entry["method"], entry["url"])
+                self.responses.setdefault(key, deque()).append(entry)
+
+    def remaining(self) -> int:
+        """Return the number of recorded responses not replayed yet."""
+        return sum(len(entries) for entries in self.responses.values())
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        """
+        Serve the next recorded response of the request.
+
+        Raises:
+            CassetteError: If the cassette has no response left for the request
+        """
+        entries: Optional[Deque[Dict[str, Any]]] = self.responses.get(
+            (request.method, str(request.url))
+        )
+        if not entries:
+            raise CassetteError(
+                f"No recorded response for {request.method} {request.url}"
+            )
+        entry = entries.popleft()
+
+        delay = entry["elapsed"] * self.timing_scale
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+        return httpx.Response(
+            entry["status"],
+            headers=[tuple(item) for item in entry["headers"]],
+            content=base64.b64decode(entry["body"]),
+            request=request,
+        )
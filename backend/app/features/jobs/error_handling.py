@@ -6,6 +6,7 @@ across all job types, reducing code duplication and improving maintainability.
 Error Handling Strategy:
 - Rate limit errors: Convert to RateLimitSignal for graceful handling
 - Authentication errors: Always re-raise (critical)
+- Open circuit breakers: Log as skipped work, not as a failure
 - General errors: Re-raise if critical=True, log and return None otherwise
 """
 
@@ -13,7 +14,12 @@ from functools import wraps
 from typing import Callable, TypeVar, ParamSpec, Any, Optional
 import structlog
 
-from app.core.riot_api.errors import RateLimitError, AuthenticationError, ForbiddenError
+from app.core.riot_api.errors import (
+    RateLimitError,
+    AuthenticationError,
+    ForbiddenError,
+    CircuitOpenError,
+)
 
 logger = structlog.get_logger(__name__)
 
@@ -60,6 +66,7 @@ def handle_riot_api_errors(
     Error handling logic:
     - RateLimitError: Convert to RateLimitSignal for graceful job termination
     - AuthenticationError/ForbiddenError: Always re-raise (critical auth failures)
+    - CircuitOpenError: Warn that the operation was skipped, then handle as below
     - Other exceptions: Log error, re-raise if critical=True, otherwise return None
 
     Usage example::
@@ -128,12 +135,21 @@ def _handle_error(
         )
         raise
 
-    logger.error(
-        f"Failed to {operation}",
-        error=str(error),
-        error_type=type(error).__name__,
-        **context,
-    )
+    if isinstance(error, CircuitOpenError):
+        # The request was never sent, the Riot route is degraded
+        logger.warning(
+            f"Skipped {operation}, Riot API route is failing",
+            error=str(error),
+            retry_after=error.retry_after,
+            **context,
+        )
+    else:
+        logger.error(
+            f"Failed to {operation}",
+            error=str(error),
+            error_type=type(error).__name__,
+            **context,
+        )
     if critical:
         raise
 
@@ -12,7 +12,13 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from ..base import BaseJob
 from ..error_handling import handle_riot_api_errors
-from app.core.riot_api.client import RiotAPIClient
+from app.core.riot_api.client import (
+    RiotAPIClient,
+    request_priority,
+    track_api_requests,
+)
+from app.core.riot_api.constants import RequestPriority
+from app.core.riot_api.registry import riot_client_registry
 from app.features.players.service import PlayerService
 from app.core import get_global_settings, get_riot_api_key
 
@@ -70,18 +76,18 @@ class BanCheckerJob(BaseJob):
             # Get API key from database first, fallback to environment
             api_key = await get_riot_api_key(db)
 
-            self.api_client = RiotAPIClient(
-                api_key=api_key,
-                request_callback=self._record_api_request,
-            )
+            # Shared client: keeps pooled connections and limiter state between runs
+            self.api_client = await riot_client_registry.get(api_key)
             self.player_service = PlayerService(db)
 
-            yield
+            with (
+                track_api_requests(self._record_api_request),
+                request_priority(RequestPriority.BACKFILL),
+            ):
+                yield
 
         finally:
             # Clean up resources
-            if self.api_client:
-                await self.api_client.close()
             self.api_client = None
             self.player_service = None
 
@@ -12,7 +12,14 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from ..base import BaseJob
 from ..error_handling import handle_riot_api_errors
-from app.core.riot_api.client import RiotAPIClient
+from ..scheduler import resolve_interval_seconds
+from app.core.riot_api.client import (
+    RiotAPIClient,
+    request_priority,
+    track_api_requests,
+)
+from app.core.riot_api.constants import RequestPriority, RiotRoute
+from app.core.riot_api.registry import riot_client_registry
 from app.features.players.service import PlayerService
 from app.features.matches.service import MatchService
 from app.core import get_global_settings, get_riot_api_key
@@ -77,19 +84,19 @@ class MatchFetcherJob(BaseJob):
             # Get API key from database first, fallback to environment
             api_key = await get_riot_api_key(db)
 
-            self.api_client = RiotAPIClient(
-                api_key=api_key,
-                request_callback=self._record_api_request,
-            )
+            # Shared client: keeps pooled connections and limiter state between runs
+            self.api_client = await riot_client_registry.get(api_key)
             self.player_service = PlayerService(db)
             self.match_service = MatchService(db)
 
-            yield
+            with (
+                track_api_requests(self._record_api_request),
+                request_priority(RequestPriority.BACKFILL),
+            ):
+                yield
 
         finally:
             # Clean up resources
-            if self.api_client:
-                await self.api_client.close()
             self.api_client = None
             self.player_service = None
             self.match_service = None
@@ -128,7 +135,7 @@ class MatchFetcherJob(BaseJob):
             return
 
         players = await self.player_service.get_players_needing_matches(
-            limit=self.discovered_players_per_run,
+            limit=await self._players_per_run(),
             target_matches=self.target_matches_per_player,
         )
 
@@ -139,7 +146,14 @@ class MatchFetcherJob(BaseJob):
 
         logger.info("Fetching matches for players", count=len(players))
 
-        for player in players:
+        for index, player in enumerate(players):
+            if self.api_client.is_circuit_open(RiotRoute.MATCH_BY_ID):
+                logger.warning(
+                    "Match details unavailable, ending fetch phase early",
+                    players_remaining=len(players) - index,
+                )
+                break
+
             logger.debug(
                 "Starting match fetch for player",
                 puuid=player.puuid,
@@ -166,6 +180,42 @@ class MatchFetcherJob(BaseJob):
                     puuid=player.puuid,
                 )
 
+    async def _players_per_run(self) -> int:
+        """Size the batch of players to the limits of the API key.
+
+        The configured count is tuned for a development key. Keys with more
+        throughput scale it up, bounded by what the rate limit planner
+        estimates to finish within the job interval.
+
+        :returns: Number of players to fetch matches for in this run.
+        """
+        configured = self.discovered_players_per_run
+        scaled = self.api_client.scale_batch(configured)
+        if scaled <= configured:
+            return configured
+
+        try:
+            interval = resolve_interval_seconds(self.job_config)
+        except ValueError:
+            return configured
+
+        capacity = await self.api_client.plan_capacity(
+            {
+                RiotRoute.MATCH_IDS_BY_PUUID: 1,
+                RiotRoute.MATCH_BY_ID: self.matches_per_player_per_run,
+            },
+            interval,
+            maximum=scaled,
+        )
+        players_per_run = max(configured, capacity)
+        logger.info(
+            "Sized match fetcher batch",
+            key_tier=self.api_client.key_limits.tier.value,
+            configured=configured,
+            players_per_run=players_per_run,
+        )
+        return players_per_run
+
     @handle_riot_api_errors(
         operation="fetch matches for player",
         critical=False,
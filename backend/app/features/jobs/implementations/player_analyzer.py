@@ -15,6 +15,7 @@ from ..base import BaseJob
 from ..error_handling import handle_riot_api_errors
 from app.core.riot_api.data_manager import RiotDataManager
 from app.features.player_analysis.service import PlayerAnalysisService
+from app.features.players.cache import player_cache
 from app.features.players.service import PlayerService
 from app.core import get_global_settings
 
@@ -156,6 +157,7 @@ class PlayerAnalyzerJob(BaseJob):
             "player analysis",
             on_success=lambda: self.increment_metric("records_updated"),
         )
+        player_cache.invalidate(player.puuid)
 
         logger.info(
             "Player analyzed",
@@ -1,6 +1,6 @@
 """Tracked Player Updater Job - Updates match history and rank for tracked players."""
 
-from contextlib import asynccontextmanager
+from contextlib import aclosing, asynccontextmanager
 from datetime import datetime, timedelta
 from typing import Any, Dict, List, Optional
 import structlog
@@ -10,8 +10,16 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from ..base import BaseJob
 from ..error_handling import handle_riot_api_errors
+from ..scheduler import resolve_interval_seconds
+from app.features.players.cache import player_cache
 from app.features.players.models import Player
-from app.core.riot_api.client import RiotAPIClient
+from app.core.riot_api.client import (
+    RiotAPIClient,
+    request_priority,
+    track_api_requests,
+)
+from app.core.riot_api.constants import RequestPriority, RiotRoute
+from app.core.riot_api.registry import riot_client_registry
 from app.core.riot_api.data_manager import RiotDataManager
 from app.core.riot_api.errors import NotFoundError
 from app.core import get_global_settings, get_riot_api_key
@@ -86,16 +94,16 @@ class TrackedPlayerUpdaterJob(BaseJob):
         # Pass the db session so it can query settings without creating a new engine
         api_key = await get_riot_api_key(db)
 
-        self.api_client = RiotAPIClient(
-            api_key=api_key,
-            request_callback=self._record_api_request,
-        )
+        # Shared client: keeps pooled connections and limiter state between runs
+        self.api_client = await riot_client_registry.get(api_key)
         self.data_manager = RiotDataManager(db, self.api_client)
         try:
-            yield
+            with (
+                track_api_requests(self._record_api_request),
+                request_priority(RequestPriority.NORMAL),
+            ):
+                yield
         finally:
-            if self.api_client:
-                await self.api_client.close()
             self.api_client = None
             self.data_manager = None
 
@@ -124,6 +132,11 @@ class TrackedPlayerUpdaterJob(BaseJob):
         }
 
         async with self._riot_resources(db):
+            # Players per run are tuned for a development key; history depth
+            # per player stays as configured
+            self.max_tracked_players = self.api_client.scale_batch(
+                self.max_tracked_players
+            )
             tracked_players = await self._get_tracked_players(db)
             summary["total"] = len(tracked_players)
             summary["tracked_ids"] = [p.puuid for p in tracked_players]
@@ -140,6 +153,8 @@ class TrackedPlayerUpdaterJob(BaseJob):
                 player_ids=summary["tracked_ids"],
             )
 
+            tracked_players = await self._fit_to_interval(tracked_players)
+
             for player in tracked_players:
                 player_result = await self._sync_tracked_player(db, player)
                 # None if non-critical error occurred
@@ -168,16 +183,56 @@ class TrackedPlayerUpdaterJob(BaseJob):
         :returns: List of tracked players.
         :rtype: List[Player]
         """
+        # Least recently updated first, so players deferred by a run that
+        # cannot fit everyone into its interval go first in the next one
         stmt = (
             select(Player)
             .where(Player.is_tracked)
             .where(Player.is_active)
+            .order_by(Player.updated_at.asc())
             .limit(self.max_tracked_players)
         )
         result = await db.execute(stmt)
         players = result.scalars().all()
         return list(players)
 
+    async def _fit_to_interval(self, players: List[Player]) -> List[Player]:
+        """Keep as many players as the rate limits let finish before the next run.
+
+        Plans the worst case per player (a page of match IDs, every new match
+        and the rank) against the current rate limit budget, so a run is not
+        scheduled more work than it can do within the job interval.
+
+        :param players: Players to update, most overdue first.
+        :returns: Players to update in this run.
+        """
+        try:
+            interval = resolve_interval_seconds(self.job_config)
+        except ValueError:
+            return players
+
+        per_player = {
+            RiotRoute.MATCH_IDS_BY_PUUID: 1,
+            RiotRoute.MATCH_BY_ID: self.max_new_matches_per_player,
+            RiotRoute.LEAGUE_ENTRIES_BY_PUUID: 1,
+        }
+        capacity = await self.api_client.plan_capacity(
+            per_player, interval, maximum=len(players)
+        )
+        plan = await self.api_client.plan_calls(
+            {route: count * capacity for route, count in per_player.items()}
+        )
+        logger.info(
+            "Planned tracked player updates",
+            players=capacity,
+            deferred=len(players) - capacity,
+            interval_seconds=interval,
+            eta_seconds=round(plan.eta, 1),
+            bottleneck=plan.bottleneck,
+        )
+        # Always make progress, even if one player does not fit
+        return players[: max(1, capacity)]
+
     @handle_riot_api_errors(
         operation="update tracked player",
         critical=False,
@@ -215,11 +270,27 @@ class TrackedPlayerUpdaterJob(BaseJob):
         matches_processed = 0
         players_discovered = 0
 
-        for match_id in new_matches:
-            discovered = await self._process_match(db, match_id, player)
-            if discovered is not None:  # None if non-critical error occurred
-                players_discovered += discovered
-                matches_processed += 1
+        # Matches are fetched concurrently but stored one at a time (the
+        # session is not shared between tasks), in order so the oldest-first
+        # guarantee of _fetch_new_matches holds
+        async with aclosing(
+            self.api_client.get_matches(new_matches, ordered=True)
+        ) as results:
+            index = 0
+            async for match_id, match_dto in results:
+                if self.api_client.is_circuit_open(RiotRoute.MATCH_BY_ID):
+                    # Rank update and other players can still make progress
+                    logger.warning(
+                        "Match details unavailable, skipping remaining matches",
+                        puuid=player.puuid,
+                        skipped=len(new_matches) - index,
+                    )
+                    break
+                index += 1
+                discovered = await self._process_match(db, match_id, match_dto, player)
+                if discovered is not None:  # None if non-critical error occurred
+                    players_discovered += discovered
+                    matches_processed += 1
 
         await self._update_player_rank(db, player)
 
@@ -229,6 +300,7 @@ class TrackedPlayerUpdaterJob(BaseJob):
             "tracked player update",
             on_success=lambda: self.increment_metric("records_updated"),
         )
+        player_cache.invalidate(player.puuid)
 
         logger.info(
             "Successfully updated tracked player",
@@ -257,16 +329,11 @@ class TrackedPlayerUpdaterJob(BaseJob):
                 last_match_time, existing_match_count, player.puuid
             )
 
-            match_ids = await self._fetch_match_ids_in_batches(player, start_time)
-            new_match_ids = await self._filter_new_matches(db, match_ids)
-
-            logger.info(
-                "Filtered new matches",
-                puuid=player.puuid,
-                total_matches=len(match_ids),
-                new_matches=len(new_match_ids),
-            )
+            new_match_ids = await self._fetch_new_match_ids(db, player, start_time)
 
+            # Oldest first: if the run stops early, the matches left over are
+            # newer than every stored one and the next run still finds them
+            new_match_ids.reverse()
             return new_match_ids
 
         except NotFoundError:
@@ -276,20 +343,23 @@ class TrackedPlayerUpdaterJob(BaseJob):
     @handle_riot_api_errors(
         operation="process match",
         critical=False,
-        log_context=lambda self, db, match_id, player: {
+        log_context=lambda self, db, match_id, match_dto, player: {
             "match_id": match_id,
             "puuid": player.puuid,
         },
     )
     async def _process_match(
-        self, db: AsyncSession, match_id: str, player: Player
+        self, db: AsyncSession, match_id: str, match_dto: Any, player: Player
     ) -> int:
-        """Process a single match - fetch details and store participants.
+        """Process a single fetched match - store it and its participants.
 
         :param db: Database session.
         :type db: AsyncSession
         :param match_id: Match ID to process.
         :type match_id: str
+        :param match_dto: Match from RiotAPIClient.get_matches, or the error
+            raised fetching it.
+        :type match_dto: Any
         :param player: The tracked player (for context).
         :type player: Player
         :returns: Number of discovered players.
@@ -297,8 +367,9 @@ class TrackedPlayerUpdaterJob(BaseJob):
         """
         logger.debug("Processing match", match_id=match_id, puuid=player.puuid)
 
-        # Fetch match details from Riot API using data manager
-        match_dto = await self.api_client.get_match(match_id)
+        # Fetch errors go through the same handling as storage errors
+        if isinstance(match_dto, Exception):
+            raise match_dto
 
         if not match_dto:
             logger.warning("Match not found", match_id=match_id)
@@ -459,16 +530,22 @@ class TrackedPlayerUpdaterJob(BaseJob):
         )
         return start_time
 
-    async def _fetch_match_ids_in_batches(
-        self, player: Player, start_time: int
+    async def _fetch_new_match_ids(
+        self, db: AsyncSession, player: Player, start_time: int
     ) -> List[str]:
-        """Fetch match IDs from Riot API in batches.
+        """Fetch match IDs page by page until reaching an already stored match.
+
+        Riot lists matches newest first, so once a page contains a stored match
+        all older ones are stored as well and no further pages are requested.
+        A player without new games costs a single list call.
 
+        :param db: Database session.
+        :type db: AsyncSession
         :param player: Player to fetch matches for.
         :type player: Player
         :param start_time: Start time timestamp in seconds.
         :type start_time: int
-        :returns: List of match IDs.
+        :returns: New match IDs, newest first.
         :rtype: List[str]
         """
         logger.debug(
@@ -477,68 +554,45 @@ class TrackedPlayerUpdaterJob(BaseJob):
             start_time=start_time,
         )
 
-        match_ids = []
-        start_index = 0
-        batch_size = 100  # Riot API maximum
         max_total_matches = (
             self.max_new_matches_per_player
             if self.max_new_matches_per_player > 0
             else 1000
         )
 
-        while len(match_ids) < max_total_matches:
-            # Queue 420 = Ranked Solo/Duo
-            match_list_dto = await self.api_client.get_match_list_by_puuid(
-                puuid=player.puuid,
-                queue=420,
-                start_time=start_time,
-                start=start_index,
-                count=batch_size,
-            )
-
-            batch_match_ids = self._extract_match_ids_from_dto(match_list_dto)
-
-            # Exit early if no more matches
-            if not batch_match_ids:
-                logger.debug(
-                    "No more matches available",
-                    puuid=player.puuid,
-                    total_fetched=len(match_ids),
-                )
-                break
-
-            match_ids.extend(batch_match_ids)
+        new_match_ids: List[str] = []
+        total_matches = 0
+        pages = 0
 
-            # Exit early if we got fewer than batch_size (reached the end)
-            if len(batch_match_ids) < batch_size:
+        # Queue 420 = Ranked Solo/Duo
+        async for page in self.api_client.iter_match_ids(
+            player.puuid,
+            queue=420,
+            start_time=start_time,
+            limit=max_total_matches,
+        ):
+            pages += 1
+            total_matches += len(page)
+            new_page_ids = await self._filter_new_matches(db, page)
+            new_match_ids.extend(new_page_ids)
+
+            if len(new_page_ids) < len(page):
                 logger.debug(
-                    "Fetched all available matches",
+                    "Reached stored matches",
                     puuid=player.puuid,
-                    total_fetched=len(match_ids),
+                    total_fetched=total_matches,
                 )
                 break
 
-            start_index += batch_size
-
         logger.info(
-            "Fetched match list",
+            "Filtered new matches",
             puuid=player.puuid,
-            total_matches=len(match_ids),
+            total_matches=total_matches,
+            new_matches=len(new_match_ids),
+            list_calls=pages,
         )
 
-        return match_ids
-
-    def _extract_match_ids_from_dto(self, match_list_dto: Any) -> List[str]:
-        """Extract match IDs from match list DTO.
-
-        :param match_list_dto: Match list DTO from Riot API.
-        :type match_list_dto: Any
-        :returns: List of match ID strings.
-        :rtype: List[str]
-        """
-        from app.features.matches.transformers import MatchDTOTransformer
-
-        return MatchDTOTransformer.extract_match_ids(match_list_dto)
+        return new_match_ids
 
     async def _filter_new_matches(
         self, db: AsyncSession, match_ids: List[str]
@@ -48,7 +48,7 @@ def get_scheduler() -> Optional[AsyncIOScheduler]:
     return _scheduler
 
 
-def _resolve_interval_seconds(job_config: JobConfiguration) -> int:
+def resolve_interval_seconds(job_config: JobConfiguration) -> int:
     """Determine interval seconds for a job configuration.
 
     :param job_config: Job configuration with schedule settings.
@@ -367,7 +367,7 @@ async def _load_and_schedule_jobs() -> None:
             if not job_class:
                 continue
 
-            interval_seconds = _resolve_interval_seconds(job_config)
+            interval_seconds = resolve_interval_seconds(job_config)
             _schedule_job(job_config, job_class, interval_seconds)
 
         logger.info("Successfully loaded and scheduled jobs", count=len(job_configs))
@@ -1,5 +1,6 @@
 """Match service for handling match data operations."""
 
+from contextlib import aclosing
 from typing import Optional, List, Dict, Any, TYPE_CHECKING
 import structlog
 
@@ -21,6 +22,7 @@ from app.core.riot_api.errors import (
     AuthenticationError,
     ForbiddenError,
     NotFoundError,
+    CircuitOpenError,
 )
 
 if TYPE_CHECKING:
@@ -28,6 +30,10 @@ if TYPE_CHECKING:
 
 logger = structlog.get_logger(__name__)
 
+# Match IDs per list call; small because updates usually stop at the first
+# stored ID within the first few
+MATCH_ID_PAGE_SIZE = 20
+
 
 class MatchService:
     """Service for handling match data operations."""
@@ -222,41 +228,53 @@ class MatchService:
             raise
 
     async def _fetch_match_ids_from_api(
-        self, riot_api_client, puuid: str, queue: int
-    ) -> list[str]:
+        self, riot_api_client, puuid: str, queue: int, count: int
+    ) -> tuple[list[str], list[str]]:
         """
-        Fetch match IDs from Riot API with error handling.
+        Page through a player's match IDs until `count` new ones are found.
+
+        Stored IDs are skipped rather than treated as the end of the new
+        ones: backfill stores only `count` matches per run, in completion
+        order, so matches older than a stored one may still be missing.
+        Pages are small and only requested while fewer than `count` new
+        matches were found, up to the 100 most recent IDs.
+
+        Returns:
+            Tuple of (all match IDs seen, new match IDs), newest first
 
         Raises:
             RateLimitError, NotFoundError: API errors that should propagate
         """
+        all_match_ids: list[str] = []
+        new_match_ids: list[str] = []
         try:
-            match_list = await riot_api_client.get_match_list_by_puuid(
-                puuid=puuid, queue=queue, start=0, count=100
-            )
-            match_ids = (
-                list(match_list.match_ids)
-                if match_list and match_list.match_ids
-                else []
-            )
+            async with aclosing(
+                riot_api_client.iter_match_ids(
+                    puuid, queue=queue, page_size=MATCH_ID_PAGE_SIZE, limit=100
+                )
+            ) as pages:
+                async for page in pages:
+                    all_match_ids.extend(page)
+                    new_match_ids.extend(await self._get_new_match_ids(page))
+                    if len(new_match_ids) >= count:
+                        break
 
             logger.debug(
                 "Fetched match IDs from Riot API",
                 puuid=puuid,
                 queue=queue,
-                api_returned_count=len(match_ids),
-                start=0,
-                requested_count=100,
+                api_returned_count=len(all_match_ids),
+                requested_count=count,
             )
 
-            return match_ids
+            return all_match_ids, new_match_ids
         except NotFoundError as e:
             logger.warning(
                 "Player not found in Riot API",
                 puuid=puuid,
                 error=str(e),
             )
-            return []  # Return empty list for not found players
+            return [], []  # Return empty lists for not found players
         except RateLimitError as e:
             logger.warning(
                 "Rate limit hit while fetching match list",
@@ -284,11 +302,13 @@ class MatchService:
 
         return [mid for mid in all_match_ids if mid not in existing_match_ids]
 
-    async def _fetch_and_store_single_match(
-        self, riot_api_client, match_id: str
-    ) -> bool:
+    async def _store_fetched_match(self, match_id: str, match_dto: Any) -> bool:
         """
-        Fetch and store a single match.
+        Store a match yielded by RiotAPIClient.get_matches.
+
+        Args:
+            match_id: Match ID
+            match_dto: Fetched MatchDTO, None, or the error of the fetch
 
         Returns:
             True if successfully stored, False otherwise
@@ -297,15 +317,20 @@ class MatchService:
             RateLimitError: If rate limit is hit (should stop processing)
         """
         try:
-            match_dto = await riot_api_client.get_match(match_id)
+            if isinstance(match_dto, Exception):
+                raise match_dto
             if match_dto:
-                match_data = match_dto.model_dump(by_alias=True, mode="json")
-                await self._store_match_detail(match_data)
+                await self._store_match_detail(
+                    match_dto.model_dump(by_alias=True, mode="json")
+                )
                 return True
             return False
         except RateLimitError:
             logger.warning("Rate limit hit fetching match", match_id=match_id)
             raise
+        except CircuitOpenError:
+            # Not a problem with this match, stop instead of failing the rest
+            raise
         except Exception as e:
             logger.warning("Failed to fetch match", match_id=match_id, error=str(e))
             return False
@@ -322,17 +347,16 @@ class MatchService:
             return False
 
     async def _fetch_new_match_ids_for_player(
-        self, riot_api_client: "RiotAPIClient", puuid: str, queue: int
+        self, riot_api_client: "RiotAPIClient", puuid: str, queue: int, count: int
     ) -> list[str]:
-        """Fetch and filter to only new match IDs."""
-        all_match_ids = await self._fetch_match_ids_from_api(
-            riot_api_client, puuid, queue
+        """Fetch match IDs until `count` new ones are found, keeping only new."""
+        all_match_ids, new_match_ids = await self._fetch_match_ids_from_api(
+            riot_api_client, puuid, queue, count
         )
         if not all_match_ids:
             logger.debug("No matches found for player", puuid=puuid)
             return []
 
-        new_match_ids = await self._get_new_match_ids(all_match_ids)
         already_in_db = len(all_match_ids) - len(new_match_ids)
 
         logger.debug(
@@ -386,16 +410,19 @@ class MatchService:
 
             # Fetch new match IDs
             new_match_ids = await self._fetch_new_match_ids_for_player(
-                riot_api_client, puuid, queue
+                riot_api_client, puuid, queue, count
             )
             if not new_match_ids:
                 return 0
 
-            # Fetch requested count of new matches
+            # Fetch requested count of new matches concurrently, store as they arrive
             fetched_count = 0
-            for match_id in new_match_ids[:count]:
-                if await self._fetch_and_store_single_match(riot_api_client, match_id):
-                    fetched_count += 1
+            async with aclosing(
+                riot_api_client.get_matches(new_match_ids[:count])
+            ) as results:
+                async for match_id, match_dto in results:
+                    if await self._store_fetched_match(match_id, match_dto):
+                        fetched_count += 1
 
             logger.info(
                 "Fetched matches for player",
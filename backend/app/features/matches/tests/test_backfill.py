@@ -0,0 +1,70 @@
+"""Match backfill of MatchService.fetch_and_store_matches_for_player."""
+
+import pytest
+
+from app.core.riot_api.client import RiotAPIClient
+from app.core.riot_api.fake_server import FakeRiotDataset
+from app.features.matches.service import MATCH_ID_PAGE_SIZE, MatchService
+
+
+@pytest.fixture
+def stored() -> set:
+    """Match IDs stored by the service (stands in for the matches table)."""
+    return set()
+
+
+@pytest.fixture
+def match_service(monkeypatch: pytest.MonkeyPatch, stored: set) -> MatchService:
+    """MatchService storing matches in `stored` instead of the database."""
+
+    async def get_new_match_ids(self, match_ids):
+        return [match_id for match_id in match_ids if match_id not in stored]
+
+    async def store_fetched_match(self, match_id, match_dto):
+        if isinstance(match_dto, Exception):
+            raise match_dto
+        stored.add(match_id)
+        return True
+
+    monkeypatch.setattr(MatchService, "_get_new_match_ids", get_new_match_ids)
+    monkeypatch.setattr(MatchService, "_store_fetched_match", store_fetched_match)
+    return MatchService(db=None)
+
+
+async def test_second_run_backfills_older_matches(
+    client: RiotAPIClient,
+    dataset: FakeRiotDataset,
+    match_service: MatchService,
+    stored: set,
+):
+    puuid = next(iter(dataset.summoners))
+    history = dataset.match_ids[puuid]
+    # A run of a full page leaves the whole first page stored
+    count = MATCH_ID_PAGE_SIZE
+
+    first = await match_service.fetch_and_store_matches_for_player(
+        client, puuid, count=count, platform="EUN1"
+    )
+    second = await match_service.fetch_and_store_matches_for_player(
+        client, puuid, count=count, platform="EUN1"
+    )
+
+    assert first == count
+    assert second == min(count, len(history) - count)
+    assert stored == set(history[: 2 * count])
+
+
+async def test_run_reports_nothing_new_once_history_is_stored(
+    client: RiotAPIClient,
+    dataset: FakeRiotDataset,
+    match_service: MatchService,
+    stored: set,
+):
+    puuid = next(iter(dataset.summoners))
+    stored.update(dataset.match_ids[puuid])
+
+    fetched = await match_service.fetch_and_store_matches_for_player(
+        client, puuid, count=5, platform="EUN1"
+    )
+
+    assert fetched == 0
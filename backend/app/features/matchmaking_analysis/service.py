@@ -1,13 +1,13 @@
 """Matchmaking analysis service for analyzing League of Legends matchmaking fairness."""
 
 import asyncio
+from contextlib import aclosing
 from typing import Optional, List, Dict, Tuple
 from datetime import datetime, timezone
 import structlog
 
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, update
-from sqlalchemy.dialects.postgresql import insert
 
 from .models import MatchmakingAnalysis, AnalysisStatus
 from app.features.matches.models import Match
@@ -17,8 +17,9 @@ from .schemas import (
     MatchmakingAnalysisStatusResponse,
 )
 from app.core.riot_api.client import RiotAPIClient
+from app.core.riot_api.constants import RiotRoute
+from app.core.riot_api.data_manager import RiotDataManager
 from app.core.riot_api.errors import RiotAPIError
-from app.core.riot_api.transformers import MatchTransformer
 
 logger = structlog.get_logger(__name__)
 
@@ -30,7 +31,7 @@ class MatchmakingAnalysisService:
         """Initialize matchmaking analysis service."""
         self.db = db
         self.riot_client = riot_client
-        self.transformer = MatchTransformer()
+        self.data_manager = RiotDataManager(db, riot_client)
         self._cancel_flags: Dict[int, bool] = {}  # Track cancellation requests
 
     async def start_analysis(self, puuid: str) -> MatchmakingAnalysisResponse:
@@ -207,8 +208,9 @@ class MatchmakingAnalysisService:
                     updated_at=datetime.now(timezone.utc),
                     progress=1,  # We've completed the initial fetch
                     total_requests=total_estimated,
-                    estimated_minutes_remaining=total_estimated
-                    // 50,  # ~50 requests per minute
+                    estimated_minutes_remaining=await self._estimate_minutes_remaining(
+                        1, total_estimated
+                    ),
                 )
             )
             await self.db.commit()
@@ -345,175 +347,96 @@ class MatchmakingAnalysisService:
         """
         Get list of (puuid, team_id) tuples for a match.
 
-        Checks DB first, fetches from API if not found.
+        Served from DB if stored, otherwise fetched from API and stored
+        (RiotDataManager.get_match).
 
         Returns:
-            List of (puuid, team_id) tuples
+            List of (puuid, team_id) tuples, empty if the match was not found
+            or could not be fetched because of rate limits
         """
-        # Check database first
-        result = await self.db.execute(
-            select(MatchParticipant.puuid, MatchParticipant.team_id).where(
-                MatchParticipant.match_id == match_id
-            )
-        )
-        participants = result.all()
-
-        if participants:
-            logger.debug(
-                "Found match participants in DB",
-                match_id=match_id,
-                count=len(participants),
-            )
-            return [(p.puuid, p.team_id) for p in participants]
-
-        # Not in DB, fetch from API
-        logger.info("Fetching match from API", match_id=match_id)
-
-        try:
-            match_dto = await self.riot_client.get_match(match_id)
-
-            # Store match in database
-            await self._store_match(match_dto)
-
-            # Extract participants
-            participants = []
-            for participant_data in match_dto.info.participants:
-                participants.append((participant_data.puuid, participant_data.team_id))
-
-            return participants
-
-        except RiotAPIError as e:
-            logger.error(
-                "Failed to fetch match",
-                match_id=match_id,
-                error=str(e),
-            )
-            raise
-
-    async def _store_match(self, match_dto) -> None:
-        """Store match and participants in database."""
-        try:
-            # Convert MatchDTO to dict for transformer
-            match_data_dict = {
-                "metadata": {
-                    "matchId": match_dto.metadata.match_id,
-                },
-                "info": {
-                    "platformId": match_dto.info.platform_id,
-                    "gameCreation": match_dto.info.game_creation,
-                    "gameDuration": match_dto.info.game_duration,
-                    "queueId": match_dto.info.queue_id,
-                    "gameVersion": match_dto.info.game_version,
-                    "mapId": match_dto.info.map_id,
-                    "gameMode": match_dto.info.game_mode,
-                    "gameType": match_dto.info.game_type,
-                    "gameEndTimestamp": match_dto.info.game_end_timestamp,
-                    "tournamentId": getattr(match_dto.info, "tournament_code", None),
-                    "participants": [
-                        {
-                            "puuid": p.puuid,
-                            "summonerName": p.summoner_name,
-                            "teamId": p.team_id,
-                            "championId": p.champion_id,
-                            "championName": p.champion_name,
-                            "kills": p.kills,
-                            "deaths": p.deaths,
-                            "assists": p.assists,
-                            "win": p.win,
-                            "goldEarned": p.gold_earned,
-                            "visionScore": p.vision_score,
-                            "totalMinionsKilled": getattr(p, "total_minions_killed", 0),
-                            "neutralMinionsKilled": getattr(
-                                p, "neutral_minions_killed", 0
-                            ),
-                            "champLevel": p.champ_level,
-                            "totalDamageDealt": p.total_damage_dealt,
-                            "totalDamageDealtToChampions": p.total_damage_dealt_to_champions,
-                            "damageTaken": p.total_damage_taken,
-                            "totalHeal": p.total_heal,
-                            "individualPosition": p.individual_position,
-                            "teamPosition": p.team_position,
-                            "role": p.role,
-                        }
-                        for p in match_dto.info.participants
-                    ],
-                },
-            }
-
-            # Transform data
-            transformed = self.transformer.transform_match_data(match_data_dict)
-
-            # Upsert match
-            match_stmt = (
-                insert(Match)
-                .values(**transformed["match"])
-                .on_conflict_do_nothing(index_elements=["match_id"])
-            )
-            await self.db.execute(match_stmt)
-
-            # Upsert participants
-            for participant_dict in transformed["participants"]:
-                participant_stmt = (
-                    insert(MatchParticipant)
-                    .values(**participant_dict)
-                    .on_conflict_do_nothing(index_elements=["match_id", "puuid"])
-                )
-                await self.db.execute(participant_stmt)
-
-            await self.db.commit()
-
-        except Exception as e:
-            logger.error(
-                "Failed to store match",
-                match_id=match_dto.metadata.match_id,
-                error=str(e),
-            )
-            await self.db.rollback()
-            # Don't raise - this is a background task and we can continue
-
-    async def _get_participant_winrate(
-        self, puuid: str, match_id: str
-    ) -> Optional[bool]:
+        match_dto = await self.data_manager.get_match(match_id)
+        if match_dto is None:
+            logger.warning("Match not available", match_id=match_id)
+            return []
+
+        return [
+            (participant.puuid, participant.team_id)
+            for participant in match_dto.info.participants
+        ]
+
+    async def _get_participant_results(
+        self, puuid: str, match_ids: List[str]
+    ) -> List[bool]:
         """
-        Get win status for a participant in a match.
+        Get win status of a participant in each of the given matches.
 
-        Checks DB first, fetches from API if not found.
+        Reads stored matches from DB and fetches the missing ones concurrently.
+        Matches that cannot be fetched or do not include the player are skipped.
 
         Returns:
-            True if won, False if lost, None if not found
+            Win status per match found
         """
-        # Check database first
+        stored = await self._stored_participant_results(puuid, match_ids)
+        results = [win for win in stored.values() if win is not None]
+
+        missing = [match_id for match_id in match_ids if match_id not in stored]
+        if missing:
+            results.extend(await self._fetch_participant_results(puuid, missing))
+        return results
+
+    async def _fetch_participant_results(
+        self, puuid: str, match_ids: List[str]
+    ) -> List[bool]:
+        """Fetch and store matches concurrently, returning the participant's wins."""
+        results: List[bool] = []
+        async with aclosing(self.riot_client.get_matches(match_ids)) as fetched:
+            async for match_id, match_dto in fetched:
+                win = await self._fetched_participant_result(puuid, match_id, match_dto)
+                if win is not None:
+                    results.append(win)
+        return results
+
+    async def _stored_participant_results(
+        self, puuid: str, match_ids: List[str]
+    ) -> Dict[str, Optional[bool]]:
+        """Get win status of a participant in the given matches stored in DB."""
         result = await self.db.execute(
-            select(MatchParticipant.win).where(
-                MatchParticipant.match_id == match_id,
+            select(MatchParticipant.match_id, MatchParticipant.win).where(
                 MatchParticipant.puuid == puuid,
+                MatchParticipant.match_id.in_(match_ids),
             )
         )
-        win_status = result.scalar_one_or_none()
-
-        if win_status is not None:
-            return win_status
-
-        # Not in DB, need to fetch match
-        try:
-            match_dto = await self.riot_client.get_match(match_id)
-            await self._store_match(match_dto)
-
-            # Find participant in match
-            for participant_data in match_dto.info.participants:
-                if participant_data.puuid == puuid:
-                    return participant_data.win
+        return {match_id: win for match_id, win in result.all()}
 
-            return None
+    async def _fetched_participant_result(
+        self, puuid: str, match_id: str, match_dto
+    ) -> Optional[bool]:
+        """
+        Store a fetched match and return the participant's win status in it.
 
-        except RiotAPIError as e:
+        Returns:
+            Win status, or None if the fetch failed or the player is not in it
+        """
+        if isinstance(match_dto, RiotAPIError):
             logger.warning(
                 "Failed to get participant winrate",
                 puuid=puuid,
                 match_id=match_id,
-                error=str(e),
+                error=str(match_dto),
             )
             return None
+        if isinstance(match_dto, Exception):
+            raise match_dto
+        if match_dto is None:
+            return None
+
+        await self.data_manager.store_match(match_dto)
+
+        # Find participant in match
+        for participant_data in match_dto.info.participants:
+            if participant_data.puuid == puuid:
+                return participant_data.win
+        return None
 
     async def _mark_match_processed(self, match_id: str) -> None:
         """Mark a match as processed after analyzing all its participants."""
@@ -804,17 +727,8 @@ class MatchmakingAnalysisService:
             return None
 
         # Get win status for each match
-        wins = 0
-        total = 0
-
-        for match_id in match_list.match_ids:
-            win_status = await self._get_participant_winrate(puuid, match_id)
-            if win_status is not None:
-                total += 1
-                if win_status:
-                    wins += 1
-
-        return wins / total if total > 0 else None
+        results = await self._get_participant_results(puuid, match_list.match_ids)
+        return sum(results) / len(results) if results else None
 
     async def _calculate_participant_winrate(
         self, puuid: str, match_count: int = 10
@@ -848,14 +762,37 @@ class MatchmakingAnalysisService:
             )
             return self._calculate_winrate_from_results(db_wins)
 
+    async def _estimate_minutes_remaining(self, completed: int, total: int) -> int:
+        """
+        Estimate minutes left from the rate limit budget of the Riot API key.
+
+        Every remaining match is one step (its details) followed by ten
+        participant steps (a match list and up to ten match details each).
+        Assumes nothing is stored yet, so this is an upper bound.
+
+        Args:
+            completed: Steps completed
+            total: Total steps of the analysis
+
+        Returns:
+            Estimated minutes until the analysis completes
+        """
+        remaining = max(0, total - completed)
+        matches = -(-remaining // 11)
+        participants = remaining - matches
+        plan = await self.riot_client.plan_calls(
+            {
+                RiotRoute.MATCH_BY_ID: matches + participants * 10,
+                RiotRoute.MATCH_IDS_BY_PUUID: participants,
+            }
+        )
+        return plan.eta_minutes
+
     async def _update_progress(
         self, analysis_id: int, completed: int, total: int
     ) -> None:
         """Update analysis progress and time estimate."""
-        # Calculate estimated time remaining
-        # ~100 requests per 2 minutes = 50 requests per minute
-        requests_remaining = max(0, total - completed)
-        minutes_remaining = max(0, requests_remaining // 50)
+        minutes_remaining = await self._estimate_minutes_remaining(completed, total)
 
         await self.db.execute(
             update(MatchmakingAnalysis)
@@ -0,0 +1,116 @@
+"""In-process cache of active player lookups.
+
+Search, suggestions, tracking status and analysis endpoints read the same
+hot players over and over; serving those reads from memory skips a SELECT
+each. Entries are PlayerResponse objects keyed by PUUID, with Riot ID
+lookups resolved through an alias to the PUUID entry, so invalidating a
+PUUID also invalidates its Riot ID. Code that changes a player row must
+call ``player_cache.invalidate`` (or ``put`` the new state); other workers
+see the change once their entry expires.
+
+Cached responses are shared between callers and must not be mutated.
+"""
+
+from typing import Any, Dict, List, Optional, Tuple
+
+from app.core.cache import TTLCache
+from app.core.config import get_global_settings
+from .schemas import PlayerResponse
+
+RiotIdKey = Tuple[str, Optional[str], str]
+
+
+class PlayerCache:
+    """Bounded LRU/TTL cache of active players by PUUID and Riot ID."""
+
+    def __init__(self, maxsize: int, ttl: float):
+        """
+        Initialize player cache.
+
+        Args:
+            maxsize: Maximum number of players (0 disables the cache)
+            ttl: Seconds a cached player stays valid
+        """
+        self.players: TTLCache[PlayerResponse] = TTLCache(maxsize, ttl)
+        self.riot_ids: TTLCache[str] = TTLCache(maxsize, ttl)
+
+    @staticmethod
+    def _riot_id_key(
+        game_name: Optional[str], tag_line: Optional[str], platform: str
+    ) -> RiotIdKey:
+        """Key of a Riot ID lookup (same equality as the database query)."""
+        return (game_name or "", tag_line, platform)
+
+    def get_by_puuid(self, puuid: str) -> Optional[PlayerResponse]:
+        """Return the cached player with puuid, or None."""
+        return self.players.get(puuid)
+
+    def get_by_riot_id(
+        self, game_name: str, tag_line: Optional[str], platform: str
+    ) -> Optional[PlayerResponse]:
+        """Return the cached player with this Riot ID on platform, or None."""
+        key = self._riot_id_key(game_name, tag_line, platform)
+        puuid = self.riot_ids.get(key)
+        if puuid is None:
+            return None
+        player = self.players.get(puuid)
+        if (
+            player is None
+            or self._riot_id_key(player.riot_id, player.tag_line, player.platform)
+            != key
+        ):
+            # The player was invalidated or renamed since the alias was set
+            self.riot_ids.pop(key)
+            return None
+        return player
+
+    def put(self, player: PlayerResponse) -> PlayerResponse:
+        """Cache an active player under its PUUID and Riot ID and return it."""
+        self.players.set(player.puuid, player)
+        if player.riot_id:
+            self.riot_ids.set(
+                self._riot_id_key(player.riot_id, player.tag_line, player.platform),
+                player.puuid,
+            )
+        return player
+
+    def invalidate(self, *puuids: str) -> None:
+        """Drop the cached players (their Riot ID aliases stop resolving)."""
+        for puuid in puuids:
+            self.players.pop(puuid)
+
+    def clear(self) -> None:
+        """Drop every cached player."""
+        self.players.clear()
+        self.riot_ids.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        """Return size and hit/miss counters of both lookups."""
+        return {"puuid": self.players.stats(), "riot_id": self.riot_ids.stats()}
+
+    def render_prometheus(self) -> List[str]:
+        """Return exposition lines of the cache counters, per lookup."""
+        lines: List[str] = []
+        stats = self.stats()
+        for name, kind, field, documentation in (
+            ("player_cache_hits_total", "counter", "hits", "Player cache hits."),
+            ("player_cache_misses_total", "counter", "misses", "Player cache misses."),
+            (
+                "player_cache_evictions_total",
+                "counter",
+                "evictions",
+                "Players evicted from the cache because it was full.",
+            ),
+            ("player_cache_size", "gauge", "size", "Players in the cache."),
+        ):
+            lines.append(f"# HELP {name} {documentation}")
+            lines.append(f"# TYPE {name} {kind}")
+            for lookup, values in stats.items():
+                lines.append(f'{name}{{lookup="{lookup}"}} {values[field]}')
+        return lines
+
+
+_settings = get_global_settings()
+
+# Process-wide cache shared by PlayerService and RiotDataManager
+player_cache = PlayerCache(_settings.player_cache_size, _settings.player_cache_ttl)
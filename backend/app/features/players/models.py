@@ -139,6 +139,22 @@ class Player(Base):
         comment="Encrypted summoner ID (used for some Riot API endpoints)",
     )
 
+    # Freshness of the fields copied from Riot API
+    riot_id_refreshed_at: Mapped[Optional[datetime]] = mapped_column(
+        SQLDateTime(timezone=True),
+        nullable=True,
+        comment="When riot_id and tag_line were last fetched from account-v1",
+    )
+
+    profile_refreshed_at: Mapped[Optional[datetime]] = mapped_column(
+        SQLDateTime(timezone=True),
+        nullable=True,
+        comment=(
+            "When account_level, profile_icon_id and summoner_id were last "
+            "fetched from summoner-v4"
+        ),
+    )
+
     def __repr__(self) -> str:
         """Return string representation of the player."""
         return f"<Player(puuid='{self.puuid}', summoner_name='{self.summoner_name}', platform='{self.platform}')>"
@@ -51,6 +51,12 @@ class PlayerResponse(PlayerBase):
     last_ban_check: Optional[datetime] = Field(
         None, description="When this player was last checked for ban status"
     )
+    riot_id_refreshed_at: Optional[datetime] = Field(
+        None, description="When the Riot ID was last fetched from Riot API"
+    )
+    profile_refreshed_at: Optional[datetime] = Field(
+        None, description="When level and profile icon were last fetched from Riot API"
+    )
 
     model_config = ConfigDict(from_attributes=True)
 
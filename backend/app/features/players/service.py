@@ -7,6 +7,7 @@ from sqlalchemy import select, update, func, and_, or_
 from Levenshtein import distance as levenshtein_distance
 import structlog
 
+from .cache import player_cache
 from .models import Player
 from .schemas import PlayerResponse
 from app.core.exceptions import (
@@ -58,6 +59,12 @@ class PlayerService:
         safe_tag_line = tag_line.strip() if tag_line else None
         normalized_platform = platform.strip().upper()
 
+        cached = player_cache.get_by_riot_id(
+            safe_game_name, safe_tag_line, normalized_platform
+        )
+        if cached:
+            return cached
+
         # Query database only
         result = await self.db.execute(
             select(Player).where(
@@ -89,7 +96,7 @@ class PlayerService:
             puuid=player.puuid,
         )
 
-        return PlayerResponse.model_validate(player)
+        return player_cache.put(PlayerResponse.model_validate(player))
 
     def _find_exact_summoner_match(
         self, players: list[Player], safe_summoner_name: str
@@ -204,6 +211,10 @@ class PlayerService:
         self, puuid: str, platform: str = "eun1"
     ) -> PlayerResponse:
         """Get player by PUUID from database only. Never calls Riot API."""
+        cached = player_cache.get_by_puuid(puuid)
+        if cached:
+            return cached
+
         # Query database only
         result = await self.db.execute(
             select(Player).where(Player.puuid == puuid, Player.is_active)
@@ -224,7 +235,7 @@ class PlayerService:
             platform=platform,
         )
 
-        return PlayerResponse.model_validate(player)
+        return player_cache.put(PlayerResponse.model_validate(player))
 
     @staticmethod
     def _parse_search_query(query: str) -> tuple[str, str | None, str | None]:
@@ -530,9 +541,10 @@ class PlayerService:
         Returns:
             List of PlayerResponse objects for opponents found in database
         """
+        from app.core.riot_api.data_manager import RiotDataManager
         from app.features.matches.participants import MatchParticipant
 
-        # Use a single JOIN query to get opponent player data efficiently (fixes N+1 query problem)
+        # A single JOIN query picks the opponents (fixes N+1 query problem)
         # This joins MatchParticipant twice: once to find recent matches, once to find opponents
         recent_matches_subq = (
             select(MatchParticipant.match_id)
@@ -542,8 +554,8 @@ class PlayerService:
             .subquery()
         )
 
-        players_stmt = (
-            select(Player)
+        opponents_stmt = (
+            select(Player.puuid)
             .join(MatchParticipant, Player.puuid == MatchParticipant.puuid)
             .where(
                 and_(
@@ -558,8 +570,14 @@ class PlayerService:
             .limit(limit)
         )
 
-        result = await self.db.execute(players_stmt)
-        players = result.scalars().all()
+        result = await self.db.execute(opponents_stmt)
+        opponent_puuids = list(result.scalars())
+
+        # Details come from the player cache, the rest from one IN query;
+        # without an API client the data manager makes no Riot API calls
+        players = await RiotDataManager(self.db, None).get_players_by_puuids(
+            opponent_puuids
+        )
 
         logger.debug(
             "Found recent opponents with details",
@@ -568,7 +586,7 @@ class PlayerService:
             limit=limit,
         )
 
-        return [PlayerResponse.model_validate(player) for player in players]
+        return [players[p] for p in opponent_puuids if p in players]
 
     # === Player Tracking Methods for Automated Jobs ===
 
@@ -672,7 +690,7 @@ class PlayerService:
             summoner_name=player.summoner_name,
         )
 
-        return PlayerResponse.model_validate(player)
+        return player_cache.put(PlayerResponse.model_validate(player))
 
     async def untrack_player(self, puuid: str) -> PlayerResponse:
         """Remove a player from tracked status.
@@ -708,7 +726,7 @@ class PlayerService:
             summoner_name=player.summoner_name,
         )
 
-        return PlayerResponse.model_validate(player)
+        return player_cache.put(PlayerResponse.model_validate(player))
 
     async def get_tracked_players(self) -> List[PlayerResponse]:
         """Get all players currently marked for tracking.
@@ -927,6 +945,7 @@ class PlayerService:
         # Player found = not banned
         player.last_ban_check = datetime.now()
         await self.db.commit()
+        player_cache.invalidate(player.puuid)
 
         logger.debug("Player is active (not banned)", puuid=player.puuid)
         return False
@@ -966,15 +985,19 @@ class PlayerService:
 
         normalized_platform = platform.strip().upper()
         discovered_count = 0
+        discovered_puuids: List[str] = []
 
-        for participant in match_dto.info.participants:
-            # Check if player exists in database
-            result = await self.db.execute(
-                select(Player).where(Player.puuid == participant.puuid)
+        # Check which players exist in database, one query for the match
+        result = await self.db.execute(
+            select(Player.puuid).where(
+                Player.puuid.in_([p.puuid for p in match_dto.info.participants])
             )
-            existing_player = result.scalar_one_or_none()
+        )
+        existing_puuids = set(result.scalars())
 
-            if not existing_player:
+        for participant in match_dto.info.participants:
+            if participant.puuid not in existing_puuids:
+                existing_puuids.add(participant.puuid)
                 # Sanitize player data
                 player_data = {
                     "riot_id": participant.riot_id_game_name,
@@ -996,6 +1019,7 @@ class PlayerService:
                     is_active=True,
                 )
                 self.db.add(new_player)
+                discovered_puuids.append(participant.puuid)
                 discovered_count += 1
 
                 logger.debug(
@@ -1011,6 +1035,7 @@ class PlayerService:
         # Commit transaction for all discovered players
         if discovered_count > 0:
             await self.db.commit()
+            player_cache.invalidate(*discovered_puuids)
             logger.info(
                 "Discovered players from match",
                 match_id=match_dto.metadata.match_id,
@@ -0,0 +1,47 @@
+"""In-process player lookup cache."""
+
+from datetime import datetime, timezone
+
+from app.features.players.cache import PlayerCache
+from app.features.players.schemas import PlayerResponse
+
+
+def _player(puuid: str, riot_id: str = "Name", tag_line: str = "EUW") -> PlayerResponse:
+    now = datetime.now(timezone.utc)
+    return PlayerResponse(
+        puuid=puuid.ljust(78, "0"),
+        riot_id=riot_id,
+        tag_line=tag_line,
+        summoner_name=riot_id,
+        platform="euw1",
+        created_at=now,
+        updated_at=now,
+        last_seen=now,
+    )
+
+
+def test_player_cache_resolves_riot_id_through_puuid():
+    cache = PlayerCache(maxsize=10, ttl=60)
+    player = cache.put(_player("p1"))
+
+    assert cache.get_by_puuid(player.puuid) is player
+    assert cache.get_by_riot_id("Name", "EUW", "euw1") is player
+    assert cache.get_by_riot_id("Name", "EUW", "eun1") is None
+
+
+def test_player_cache_invalidating_puuid_drops_riot_id():
+    cache = PlayerCache(maxsize=10, ttl=60)
+    player = cache.put(_player("p1"))
+
+    cache.invalidate(player.puuid)
+
+    assert cache.get_by_riot_id("Name", "EUW", "euw1") is None
+
+
+def test_player_cache_ignores_alias_of_renamed_player():
+    cache = PlayerCache(maxsize=10, ttl=60)
+    player = cache.put(_player("p1"))
+    cache.put(_player("p1", riot_id="NewName"))
+
+    assert cache.get_by_riot_id("Name", "EUW", "euw1") is None
+    assert cache.get_by_riot_id("NewName", "EUW", "euw1").puuid == player.puuid
@@ -1,10 +1,12 @@
 """Main FastAPI application for the Riot API Backend."""
 
 import logging
+import secrets
 from contextlib import asynccontextmanager
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 
-from fastapi import FastAPI
+from fastapi import FastAPI, Header, HTTPException
+from fastapi.responses import PlainTextResponse
 from fastapi.middleware.cors import CORSMiddleware
 from slowapi import _rate_limit_exceeded_handler
 from slowapi.errors import RateLimitExceeded
@@ -12,7 +14,10 @@ from slowapi.errors import RateLimitExceeded
 from app.core import get_global_settings, get_riot_api_key
 from app.core.database import db_manager
 from app.core.rate_limiter import limiter
+from app.core.riot_api import render_prometheus, riot_client_registry
+from app.core.riot_api.rate_limit_backends import save_rate_limit_snapshots
 from app.features.auth import auth_router
+from app.features.players.cache import player_cache
 from app.features.players.router import router as players_router
 from app.features.matches.router import router as matches_router
 from app.features.player_analysis.router import router as player_analysis_router
@@ -123,6 +128,8 @@ async def lifespan(app: FastAPI):
     yield
     logger.info("Shutting down Riot API Backend application")
     await _shutdown_scheduler_safely()
+    await riot_client_registry.close()
+    await save_rate_limit_snapshots()
 
 
 # OpenAPI tags metadata
@@ -261,6 +268,41 @@ async def health_check() -> Dict[str, Any]:
     }
 
 
+@app.get("/metrics", tags=["health"], response_class=PlainTextResponse)
+async def metrics(
+    authorization: Optional[str] = Header(default=None),
+) -> PlainTextResponse:
+    """
+    Riot API client and cache metrics in the Prometheus text format.
+
+    Exposes per-route histograms of rate limiter wait, network latency,
+    decode time, response size and attempts, counters of responses, 429s and
+    retries, and gauges of the remaining rate limit budget, cooldowns and
+    circuit breakers of every Riot API client in this process, followed by
+    the hit/miss counters of the player cache.
+
+    Served only with METRICS_ENABLED, and only to scrapers sending the
+    METRICS_TOKEN bearer token when one is set.
+    """
+    if not settings.metrics_enabled:
+        raise HTTPException(status_code=404, detail="Not Found")
+    if settings.metrics_token and not secrets.compare_digest(
+        authorization or "", f"Bearer {settings.metrics_token}"
+    ):
+        raise HTTPException(
+            status_code=401,
+            detail="Invalid metrics token",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+
+    body = await render_prometheus(riot_client_registry.clients())
+    body += "\n".join(player_cache.render_prometheus()) + "\n"
+    return PlainTextResponse(
+        body,
+        media_type="text/plain; version=0.0.4; charset=utf-8",
+    )
+
+
 if __name__ == "__main__":
     import uvicorn
 
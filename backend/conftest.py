@@ -0,0 +1,76 @@
+"""Shared test fixtures: Riot API clients served in-process by the fake Riot API.
+
+Lives at the project root so the core tests in tests/ and the feature test
+packages in app/features/*/tests/ can both use them.
+"""
+
+import asyncio
+from typing import AsyncIterator
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
+
+from app.core.config import get_global_settings
+from app.core.riot_api.client import RiotAPIClient
+from app.core.riot_api.fake_server import FakeRiotAPI, FakeRiotDataset
+from app.core.riot_api.metrics import RiotAPIMetrics
+from app.core.riot_api.not_found_cache import NotFoundCache
+from app.core.riot_api.rate_limiter import RateLimiter
+
+
+@pytest.fixture
+def dataset() -> FakeRiotDataset:
+    """Small deterministic dataset."""
+    return FakeRiotDataset(players=3, matches_per_player=30)
+
+
+@pytest.fixture
+def fake_api(dataset: FakeRiotDataset) -> FakeRiotAPI:
+    """Fake Riot API with production-like app limits."""
+    return FakeRiotAPI(dataset, app_limits="500:10,30000:600")
+
+
+@pytest.fixture
+def no_backoff(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Retry 5xx and service 429s without waiting."""
+    monkeypatch.setattr(
+        RiotAPIClient, "_backoff_delay", staticmethod(lambda attempt, **_: 0.0)
+    )
+
+
+@pytest.fixture
+async def client(fake_api: FakeRiotAPI) -> AsyncIterator[RiotAPIClient]:
+    """Client of the fake API with process-local limiter, 404 cache and metrics."""
+    riot_client = RiotAPIClient(
+        api_key="RGAPI-fake",
+        transport=fake_api.transport(),
+        enable_logging=False,
+        metrics=RiotAPIMetrics(),
+    )
+    # Keep the database out: in-memory limiter state and a 404 cache that
+    # never restores from (or writes to) core.riot_not_found
+    riot_client.rate_limiter = RateLimiter()
+    riot_client.not_found_cache = NotFoundCache(None, ttl=60, maxsize=100)
+    riot_client.not_found_cache._restored = True
+    async with riot_client:
+        yield riot_client
+
+
+@pytest.fixture
+async def postgres_engine() -> AsyncIterator[AsyncEngine]:
+    """Engine of the configured database, skipping the test if it is unreachable.
+
+    Tests using it must only touch rows they created themselves, because the
+    database may be the one of a development setup.
+    """
+    engine = create_async_engine(get_global_settings().database_url)
+    try:
+        async with asyncio.timeout(5):
+            async with engine.connect() as conn:
+                await conn.execute(text("SELECT 1"))
+    except Exception as e:
+        await engine.dispose()
+        pytest.skip(f"Postgres not available: {e}")
+    yield engine
+    await engine.dispose()
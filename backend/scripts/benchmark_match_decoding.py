@@ -0,0 +1,207 @@
+#!/usr/bin/env python3
+"""
+Benchmark decoding of match-v5 responses.
+
+Compares the old path (json.loads into dicts, then MatchDTO(**data)) with the
+path used by RiotAPIClient.get_match (MatchDTO.model_validate_json on raw
+bytes), and plain json.loads as used for untyped responses. Reports
+throughput and memory measured with tracemalloc: the peak while decoding one
+response and what each decoded match keeps alive.
+
+Usage:
+    # Synthetic match shaped like a real match-v5 payload
+    docker compose exec backend uv run python scripts/benchmark_match_decoding.py
+
+    # A real response saved from the API
+    docker compose exec backend uv run python scripts/benchmark_match_decoding.py \\
+        --file match.json --iterations 2000
+
+    # Outside the container, from the backend directory
+    uv run python scripts/benchmark_match_decoding.py
+"""
+
+import argparse
+import json
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Any, Callable, Dict, Tuple
+
+# Make the app package importable when run as a script from any directory
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from app.core.riot_api.models import MatchDTO  # noqa: E402
+
+
+def build_synthetic_match(extra_fields: int = 120) -> Dict[str, Any]:
+    """
+    Build a match payload with the size and shape of a match-v5 response.
+
+    Riot sends ~150 fields, a challenges object and perks per participant,
+    most of which MatchDTO ignores.
+
+    :param extra_fields: Number of unused scalar fields per participant
+    :returns: Match payload as sent by the API
+    """
+    participants = []
+    for index in range(10):
+        participant: Dict[str, Any] = {
+            "puuid": f"puuid-{index:02d}" + "x" * 66,
+            "summonerName": f"Player{index}",
+            "summonerId": f"summoner-{index}",
+            "summonerLevel": 100 + index,
+            "riotIdGameName": f"Player{index}",
+            "riotIdTagline": "EUNE",
+            "teamId": 100 if index < 5 else 200,
+            "win": index < 5,
+            "championId": 100 + index,
+            "championName": f"Champion{index}",
+            "kills": index,
+            "deaths": 10 - index,
+            "assists": index * 2,
+            "champLevel": 18,
+            "visionScore": 25.0,
+            "goldEarned": 12000,
+            "totalMinionsKilled": 180,
+            "neutralMinionsKilled": 20,
+            "totalDamageDealtToChampions": 25000,
+            "totalDamageTaken": 20000,
+            "role": "SOLO",
+            "individualPosition": "TOP",
+            "teamPosition": "TOP",
+            "challenges": {f"challenge{n}": n * 1.5 for n in range(120)},
+            "perks": {
+                "statPerks": {"defense": 5001, "flex": 5008, "offense": 5005},
+                "styles": [
+                    {
+                        "description": "primaryStyle",
+                        "selections": [
+                            {"perk": 8000 + n, "var1": n, "var2": 0, "var3": 0}
+                            for n in range(4)
+                        ],
+                        "style": 8000,
+                    },
+                    {
+                        "description": "subStyle",
+                        "selections": [
+                            {"perk": 8100 + n, "var1": n, "var2": 0, "var3": 0}
+                            for n in range(2)
+                        ],
+                        "style": 8100,
+                    },
+                ],
+            },
+        }
+        participant.update({f"unusedStat{n}": n for n in range(extra_fields)})
+        participants.append(participant)
+
+    return {
+        "metadata": {
+            "dataVersion": "2",
+            "matchId": "EUN1_1234567890",
+            "participants": [p["puuid"] for p in participants],
+        },
+        "info": {
+            "gameCreation": 1700000000000,
+            "gameDuration": 1800,
+            "gameId": 1234567890,
+            "gameMode": "CLASSIC",
+            "gameType": "MATCHED_GAME",
+            "gameVersion": "14.1.555.5555",
+            "mapId": 11,
+            "participants": participants,
+            "platformId": "EUN1",
+            "queueId": 420,
+            "teams": [
+                {"teamId": team_id, "win": team_id == 100, "bans": []}
+                for team_id in (100, 200)
+            ],
+        },
+    }
+
+
+def measure(decode: Callable[[bytes], Any], raw: bytes, iterations: int) -> float:
+    """
+    Decode the payload repeatedly.
+
+    :param decode: Function turning raw bytes into a match model
+    :param raw: Response body
+    :param iterations: Number of decodes
+    :returns: Matches decoded per second
+    """
+    decode(raw)  # warm up
+    start = time.perf_counter()
+    for _ in range(iterations):
+        decode(raw)
+    return iterations / (time.perf_counter() - start)
+
+
+def measure_memory(
+    decode: Callable[[bytes], Any], raw: bytes, count: int
+) -> Tuple[float, float]:
+    """
+    Measure memory used by decoding, as seen by tracemalloc.
+
+    Every decode gets its own copy of the body, like a real response.
+
+    :param decode: Function turning raw bytes into a match model
+    :param raw: Response body
+    :param count: Number of decoded matches kept alive at once
+    :returns: Peak bytes while decoding one response, bytes kept per match
+    """
+    decode(raw)  # warm up caches so they are not counted
+    tracemalloc.start()
+    try:
+        decode(bytes(memoryview(raw)))
+        _, peak = tracemalloc.get_traced_memory()
+
+        baseline, _ = tracemalloc.get_traced_memory()
+        kept = [decode(bytes(memoryview(raw))) for _ in range(count)]
+        current, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    del kept
+    return peak, (current - baseline) / count
+
+
+def main() -> None:
+    """Run the benchmark and print throughput and memory for each path."""
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--file", help="JSON file with a match-v5 response")
+    parser.add_argument("--iterations", type=int, default=1000)
+    parser.add_argument(
+        "--keep", type=int, default=100, help="Matches kept alive for memory"
+    )
+    args = parser.parse_args()
+
+    if args.file:
+        with open(args.file, "rb") as file:
+            raw = file.read()
+    else:
+        raw = json.dumps(build_synthetic_match()).encode()
+
+    paths = {
+        "json.loads + MatchDTO(**data)": lambda content: MatchDTO(
+            **json.loads(content)
+        ),
+        "MatchDTO.model_validate_json": MatchDTO.model_validate_json,
+        "json.loads": json.loads,
+    }
+
+    print(f"Payload: {len(raw) / 1024:.1f} KiB, {args.iterations} iterations")
+    results = {
+        name: measure(decode, raw, args.iterations) for name, decode in paths.items()
+    }
+    baseline = next(iter(results.values()))
+    for name, rate in results.items():
+        print(f"{name:32} {rate:10.1f} matches/s  ({rate / baseline:.2f}x)")
+
+    print(f"\nMemory (peak for one decode, kept per match over {args.keep})")
+    for name, decode in paths.items():
+        peak, kept = measure_memory(decode, raw, args.keep)
+        print(f"{name:32} {peak / 1024:8.1f} KiB peak {kept / 1024:8.1f} KiB kept")
+
+
+if __name__ == "__main__":
+    main()
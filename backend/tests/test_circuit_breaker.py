@@ -0,0 +1,78 @@
+"""Circuit breaker state transitions."""
+
+import pytest
+
+from app.core.riot_api.circuit_breaker import CircuitBreaker, CircuitState
+from app.core.riot_api.errors import CircuitOpenError
+
+
+def _breaker(open_seconds: float = 30.0) -> CircuitBreaker:
+    return CircuitBreaker(
+        "match-v5",
+        failure_ratio=0.5,
+        min_requests=4,
+        window=4,
+        open_seconds=open_seconds,
+    )
+
+
+def test_opens_once_enough_outcomes_fail():
+    breaker = _breaker()
+    breaker.record_success()
+    breaker.record_failure()
+    breaker.record_failure()
+    assert breaker.state == CircuitState.CLOSED
+
+    breaker.record_failure()
+    assert breaker.state == CircuitState.OPEN
+    assert breaker.times_opened == 1
+
+
+def test_stays_closed_below_failure_ratio():
+    breaker = _breaker()
+    for _ in range(3):
+        breaker.record_success()
+    breaker.record_failure()
+
+    assert breaker.state == CircuitState.CLOSED
+    breaker.before_request()
+
+
+def test_open_circuit_fails_fast_with_retry_after():
+    breaker = _breaker()
+    for _ in range(4):
+        breaker.record_failure()
+
+    with pytest.raises(CircuitOpenError) as excinfo:
+        breaker.before_request()
+
+    assert breaker.is_open()
+    assert 0 < excinfo.value.retry_after <= 30.0
+
+
+def test_successful_probe_closes_circuit():
+    breaker = _breaker(open_seconds=0.0)
+    for _ in range(4):
+        breaker.record_failure()
+
+    breaker.before_request()
+    assert breaker.state == CircuitState.HALF_OPEN
+    # Only one probe at a time
+    with pytest.raises(CircuitOpenError):
+        breaker.before_request()
+
+    breaker.record_success()
+    assert breaker.state == CircuitState.CLOSED
+    assert breaker.stats()["recent_requests"] == 0
+
+
+def test_failed_probe_opens_circuit_again():
+    breaker = _breaker(open_seconds=0.0)
+    for _ in range(4):
+        breaker.record_failure()
+
+    breaker.before_request()
+    breaker.record_failure()
+
+    assert breaker.state == CircuitState.OPEN
+    assert breaker.times_opened == 2
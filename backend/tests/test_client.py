@@ -0,0 +1,113 @@
+"""Riot API client features: single-flight, 404 cache and bulk match fetches."""
+
+import asyncio
+from contextlib import aclosing
+
+import pytest
+
+from app.core.riot_api.client import RiotAPIClient
+from app.core.riot_api.constants import RiotRoute
+from app.core.riot_api.errors import NotFoundError
+from app.core.riot_api.fake_server import FakeRiotAPI, FakeRiotDataset
+
+UNKNOWN_PUUID = "unknown-puuid".ljust(78, "0")
+
+
+def _match_ids(dataset: FakeRiotDataset, count: int) -> list:
+    return list(dataset.matches)[:count]
+
+
+async def test_concurrent_identical_requests_share_one_call(
+    client: RiotAPIClient, fake_api: FakeRiotAPI, dataset: FakeRiotDataset
+):
+    puuid = next(iter(dataset.summoners))
+
+    summoners = await asyncio.gather(
+        *(client.get_summoner_by_puuid(puuid) for _ in range(5))
+    )
+
+    assert {summoner.puuid for summoner in summoners} == {puuid}
+    assert fake_api.request_counts[RiotRoute.SUMMONER_BY_PUUID.value] == 1
+
+
+async def test_cancelled_caller_does_not_cancel_shared_call(
+    client: RiotAPIClient, fake_api: FakeRiotAPI, dataset: FakeRiotDataset
+):
+    puuid = next(iter(dataset.summoners))
+    first = asyncio.create_task(client.get_summoner_by_puuid(puuid))
+    second = asyncio.create_task(client.get_summoner_by_puuid(puuid))
+    await asyncio.sleep(0)
+
+    first.cancel()
+    summoner = await second
+
+    assert summoner.puuid == puuid
+    assert fake_api.request_counts[RiotRoute.SUMMONER_BY_PUUID.value] == 1
+
+
+async def test_callers_decoding_differently_share_one_call(
+    client: RiotAPIClient, fake_api: FakeRiotAPI, dataset: FakeRiotDataset
+):
+    match_id = next(iter(dataset.matches))
+
+    url = client.endpoints.match_by_id(match_id)
+
+    match, payload = await asyncio.gather(
+        client.get_match(match_id), client._make_request(url)
+    )
+
+    assert match.metadata.match_id == match_id
+    assert payload["metadata"]["matchId"] == match_id
+    assert fake_api.request_counts[RiotRoute.MATCH_BY_ID.value] == 1
+
+
+async def test_get_matches_yields_every_match(
+    client: RiotAPIClient, fake_api: FakeRiotAPI, dataset: FakeRiotDataset
+):
+    match_ids = _match_ids(dataset, 12)
+
+    results = [item async for item in client.get_matches(match_ids, concurrency=4)]
+
+    assert sorted(match_id for match_id, _ in results) == sorted(match_ids)
+    assert all(match.metadata.match_id == match_id for match_id, match in results)
+    assert fake_api.request_counts[RiotRoute.MATCH_BY_ID.value] == 12
+
+
+async def test_get_matches_ordered_yields_failures_in_place(
+    client: RiotAPIClient, dataset: FakeRiotDataset
+):
+    match_ids = _match_ids(dataset, 3)
+    missing = f"{match_ids[0].split('_')[0]}_1"
+    requested = [match_ids[0], missing, *match_ids[1:]]
+
+    results = [
+        item
+        async for item in client.get_matches(requested, concurrency=2, ordered=True)
+    ]
+
+    assert [match_id for match_id, _ in results] == requested
+    assert isinstance(results[1][1], NotFoundError)
+    assert results[2][1].metadata.match_id == match_ids[1]
+
+
+async def test_get_matches_stops_fetching_when_caller_stops(
+    client: RiotAPIClient, fake_api: FakeRiotAPI, dataset: FakeRiotDataset
+):
+    match_ids = _match_ids(dataset, 10)
+
+    async with aclosing(client.get_matches(match_ids, concurrency=2)) as results:
+        async for _ in results:
+            break
+
+    # The first result, its refill and at most one more still in flight
+    assert fake_api.request_counts[RiotRoute.MATCH_BY_ID.value] <= 4
+
+
+async def test_known_404_is_answered_without_a_request(
+    client: RiotAPIClient, fake_api: FakeRiotAPI
+):
+    for _ in range(3):
+        with pytest.raises(NotFoundError):
+            await client.get_summoner_by_puuid(UNKNOWN_PUUID)
+
+    assert fake_api.request_counts[RiotRoute.SUMMONER_BY_PUUID.value] == 1
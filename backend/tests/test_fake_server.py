@@ -0,0 +1,78 @@
+"""Riot API client against the fake Riot API: retries, 429s and paging."""
+
+import time
+
+import pytest
+
+from app.core.riot_api.client import RiotAPIClient
+from app.core.riot_api.constants import RiotRoute
+from app.core.riot_api.errors import ServiceUnavailableError
+from app.core.riot_api.fake_server import FakeRiotAPI, FakeRiotDataset
+
+
+def _first_puuid(dataset: FakeRiotDataset) -> str:
+    return next(iter(dataset.summoners))
+
+
+async def test_429_waits_for_retry_after(
+    client: RiotAPIClient, fake_api: FakeRiotAPI, dataset: FakeRiotDataset, no_backoff
+):
+    puuid = _first_puuid(dataset)
+    fake_api.fail_next(status=429, retry_after=1)
+
+    started = time.monotonic()
+    summoner = await client.get_summoner_by_puuid(puuid)
+
+    assert summoner.puuid == puuid
+    assert time.monotonic() - started >= 0.9
+    assert fake_api.request_counts[RiotRoute.SUMMONER_BY_PUUID.value] == 2
+    assert client.get_cooldown_stats()["service"]["count"] == 1
+
+
+async def test_5xx_is_retried(
+    client: RiotAPIClient, fake_api: FakeRiotAPI, dataset: FakeRiotDataset, no_backoff
+):
+    puuid = _first_puuid(dataset)
+    fake_api.fail_next(count=2, status=503)
+
+    summoner = await client.get_summoner_by_puuid(puuid)
+
+    assert summoner.puuid == puuid
+    assert fake_api.request_counts[RiotRoute.SUMMONER_BY_PUUID.value] == 3
+
+
+async def test_5xx_gives_up_after_retries(
+    client: RiotAPIClient, fake_api: FakeRiotAPI, dataset: FakeRiotDataset, no_backoff
+):
+    fake_api.fail_next(count=10, status=503)
+
+    with pytest.raises(ServiceUnavailableError):
+        await client.get_summoner_by_puuid(_first_puuid(dataset))
+
+    # First attempt and three retries
+    assert fake_api.request_counts[RiotRoute.SUMMONER_BY_PUUID.value] == 4
+
+
+async def test_iter_match_ids_pages_through_history(
+    client: RiotAPIClient, fake_api: FakeRiotAPI, dataset: FakeRiotDataset
+):
+    puuid = _first_puuid(dataset)
+
+    pages = [page async for page in client.iter_match_ids(puuid, page_size=20)]
+
+    assert [len(page) for page in pages] == [20, 10]
+    assert [m for page in pages for m in page] == dataset.match_ids[puuid]
+    assert fake_api.request_counts[RiotRoute.MATCH_IDS_BY_PUUID.value] == 2
+
+
+async def test_iter_match_ids_stops_at_limit(
+    client: RiotAPIClient, fake_api: FakeRiotAPI, dataset: FakeRiotDataset
+):
+    puuid = _first_puuid(dataset)
+
+    pages = [
+        page async for page in client.iter_match_ids(puuid, page_size=20, limit=25)
+    ]
+
+    assert [m for page in pages for m in page] == dataset.match_ids[puuid][:25]
+    assert fake_api.request_counts[RiotRoute.MATCH_IDS_BY_PUUID.value] == 2
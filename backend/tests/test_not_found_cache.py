@@ -0,0 +1,84 @@
+"""Negative cache of Riot API 404s."""
+
+from contextlib import asynccontextmanager
+
+from app.core.riot_api.not_found_cache import NotFoundCache
+
+ACCOUNT_URL = (
+    "https://europe.api.riotgames.com/riot/account/v1/accounts/by-riot-id/Name/EUW"
+)
+SUMMONER_URL = (
+    "https://euw1.api.riotgames.com/lol/summoner/v4/summoners/by-puuid/unknown"
+)
+MATCH_IDS_URL = "https://europe.api.riotgames.com/lol/match/v5/matches/by-puuid/x/ids"
+
+
+class FakeEngine:
+    """Records the statements run in transactions instead of a database."""
+
+    def __init__(self):
+        self.executed = []
+
+    @asynccontextmanager
+    async def begin(self):
+        yield self
+
+    async def execute(self, statement, params):
+        self.executed.append(params)
+
+
+async def test_remembers_resource_routes_only():
+    # No engine: persisting fails and is only logged
+    cache = NotFoundCache(None, ttl=60, maxsize=10)
+
+    cache.record(ACCOUNT_URL)
+    cache.record(MATCH_IDS_URL)
+    await cache.flush()
+
+    assert cache.is_known_missing(ACCOUNT_URL)
+    assert not cache.is_known_missing(MATCH_IDS_URL)
+
+
+async def test_disabled_by_zero_ttl():
+    cache = NotFoundCache(None, ttl=0, maxsize=10)
+
+    cache.record(ACCOUNT_URL)
+
+    assert not cache.enabled
+    assert not cache.is_known_missing(ACCOUNT_URL)
+
+
+def test_riot_ids_have_a_ttl_of_their_own():
+    cache = NotFoundCache(None, ttl=3600, maxsize=10, riot_id_ttl=300)
+
+    assert cache.ttl_of(ACCOUNT_URL) == 300
+    assert cache.ttl_of(SUMMONER_URL) == 3600
+    assert cache.ttl_of(MATCH_IDS_URL) == 0
+    # Never longer than the TTL of every other route
+    assert NotFoundCache(None, ttl=60, maxsize=10, riot_id_ttl=300).riot_id_ttl == 60
+
+
+async def test_riot_id_ttl_of_zero_never_remembers_riot_ids():
+    cache = NotFoundCache(FakeEngine(), ttl=3600, maxsize=10, riot_id_ttl=0)
+
+    cache.record(ACCOUNT_URL)
+    cache.record(SUMMONER_URL)
+    await cache.flush()
+
+    assert not cache.is_known_missing(ACCOUNT_URL)
+    assert cache.is_known_missing(SUMMONER_URL)
+
+
+async def test_404s_are_saved_in_one_batch_in_the_background():
+    engine = FakeEngine()
+    cache = NotFoundCache(engine, ttl=3600, maxsize=10, riot_id_ttl=300)
+
+    cache.record(ACCOUNT_URL)
+    cache.record(SUMMONER_URL)
+    assert engine.executed == []
+
+    await cache.flush()
+
+    assert engine.executed == [
+        [{"url": ACCOUNT_URL, "ttl": 300}, {"url": SUMMONER_URL, "ttl": 3600}]
+    ]
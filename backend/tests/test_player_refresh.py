@@ -0,0 +1,61 @@
+"""Stale-while-revalidate refresh of players in RiotDataManager."""
+
+import asyncio
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from app.core.riot_api import data_manager as data_manager_module
+from app.core.riot_api.client import RiotAPIClient
+from app.core.riot_api.data_manager import RiotDataManager
+from app.features.players.schemas import PlayerResponse
+
+
+def _player(refreshed_at: datetime) -> PlayerResponse:
+    return PlayerResponse(
+        puuid="p1".ljust(78, "0"),
+        riot_id="Name",
+        tag_line="EUW",
+        summoner_name="Name",
+        platform="euw1",
+        created_at=refreshed_at,
+        updated_at=refreshed_at,
+        last_seen=refreshed_at,
+        riot_id_refreshed_at=refreshed_at,
+        profile_refreshed_at=refreshed_at,
+    )
+
+
+@pytest.fixture
+def refreshed(monkeypatch: pytest.MonkeyPatch) -> list:
+    """Players refreshed, with fresh refresh bookkeeping for the test."""
+    calls = []
+
+    async def refresh_player(self, player, refresh_riot_id, refresh_profile):
+        calls.append((player.puuid, refresh_riot_id, refresh_profile))
+
+    monkeypatch.setattr(data_manager_module, "_player_refreshes", None)
+    monkeypatch.setattr(RiotDataManager, "_refresh_player", refresh_player)
+    return calls
+
+
+async def test_stale_player_is_refreshed_once_per_max_age(
+    client: RiotAPIClient, refreshed: list
+):
+    manager = RiotDataManager(None, client)
+    player = _player(datetime.now(timezone.utc) - timedelta(days=30))
+
+    assert manager._revalidate(player) is player
+    assert manager._revalidate(player) is player
+    await asyncio.sleep(0)
+
+    assert refreshed == [(player.puuid, True, True)]
+
+
+async def test_fresh_player_is_not_refreshed(client: RiotAPIClient, refreshed: list):
+    manager = RiotDataManager(None, client)
+
+    manager._revalidate(_player(datetime.now(timezone.utc)))
+    await asyncio.sleep(0)
+
+    assert refreshed == []
@@ -0,0 +1,186 @@
+"""Shared rate limit backends: shared memory files and Postgres."""
+
+import asyncio
+import uuid
+from pathlib import Path
+from typing import AsyncIterator, List
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
+
+from app.core.riot_api.rate_limit_backends import (
+    PostgresRateLimitBackend,
+    SharedMemoryRateLimitBackend,
+)
+from app.core.riot_api.rate_limiter import InMemoryRateLimitBackend, RateLimitBackend
+
+ENDPOINT_KEY = "GET:europe:/lol/match/v5/matches/{matchId}"
+
+
+def _limits(*pairs, used: int = 0):
+    """Build (limits, counts) as parsed from headers."""
+    return (
+        [{"requests": requests, "window": window} for requests, window in pairs],
+        [{"requests": used, "window": window} for _, window in pairs],
+    )
+
+
+@pytest.fixture(params=["memory", "shared_memory"])
+def backend_pair(request, tmp_path: Path):
+    """Two handles of one backend store, as two processes would hold them."""
+    if request.param == "memory":
+        backend = InMemoryRateLimitBackend()
+        return backend, backend
+    prefix = str(tmp_path / "riot-rate-limits")
+    return SharedMemoryRateLimitBackend(prefix), SharedMemoryRateLimitBackend(prefix)
+
+
+async def test_backend_handles_share_one_budget(backend_pair):
+    first, second = backend_pair
+    await first.update("europe", ENDPOINT_KEY, _limits((3, 10)), None)
+
+    results = [
+        await backend.acquire("europe", ENDPOINT_KEY, 0.0)
+        for backend in (first, second, first, second)
+    ]
+
+    assert results[:3] == [0.0, 0.0, 0.0]
+    assert results[3] > 0
+    stats = await second.stats()
+    assert stats["europe"]["app"][0]["used"] == 3
+
+
+async def test_shared_memory_appends_permits_and_compacts(tmp_path: Path, monkeypatch):
+    monkeypatch.setattr("app.core.riot_api.rate_limit_backends.COMPACT_AFTER", 5)
+    backend = SharedMemoryRateLimitBackend(str(tmp_path / "riot-rate-limits"))
+    state_file = tmp_path / "riot-rate-limits.europe.json"
+    await backend.update("europe", ENDPOINT_KEY, _limits((10, 10)), None)
+
+    for _ in range(4):
+        assert await backend.acquire("europe", ENDPOINT_KEY, 0.0) == 0.0
+    # Partition line followed by one line per permit
+    assert len(state_file.read_text().splitlines()) == 5
+
+    for _ in range(3):
+        await backend.acquire("europe", ENDPOINT_KEY, 0.0)
+    # Rewritten by the sixth permit, the seventh appended again
+    assert len(state_file.read_text().splitlines()) == 2
+
+    stats = await backend.stats()
+    assert stats["europe"]["app"][0]["used"] == 7
+
+
+async def test_shared_memory_skips_torn_permit_line(tmp_path: Path):
+    backend = SharedMemoryRateLimitBackend(str(tmp_path / "riot-rate-limits"))
+    await backend.update("europe", ENDPOINT_KEY, _limits((10, 10)), None)
+    await backend.acquire("europe", ENDPOINT_KEY, 0.0)
+    with open(tmp_path / "riot-rate-limits.europe.json", "ab") as file:
+        file.write(b'["GET:eur')
+
+    await backend.acquire("europe", ENDPOINT_KEY, 0.0)
+
+    stats = await backend.stats()
+    assert stats["europe"]["app"][0]["used"] == 2
+
+
+@pytest.fixture
+async def postgres_backends(
+    postgres_engine: AsyncEngine,
+) -> AsyncIterator[List[PostgresRateLimitBackend]]:
+    """Two backends of a fresh namespace on separate engines, like two hosts."""
+    namespace = f"test-{uuid.uuid4().hex[:12]}"
+    async with postgres_engine.connect() as conn:
+        migrated = await conn.scalar(
+            text("SELECT to_regclass('core.rate_limit_permits') IS NOT NULL")
+        )
+    if not migrated:
+        pytest.skip("Rate limit tables missing, run the migrations first")
+
+    second_engine = create_async_engine(postgres_engine.url)
+    yield [
+        PostgresRateLimitBackend(postgres_engine, namespace),
+        PostgresRateLimitBackend(second_engine, namespace),
+    ]
+
+    await second_engine.dispose()
+    async with postgres_engine.begin() as conn:
+        for table in ("rate_limit_permits", "rate_limit_windows"):
+            await conn.execute(
+                text(f"DELETE FROM core.{table} WHERE bucket_key LIKE :prefix"),
+                {"prefix": f"{namespace}|%"},
+            )
+
+
+async def test_postgres_concurrent_acquire_shares_one_budget(postgres_backends):
+    first, second = postgres_backends
+    await first.update("europe", ENDPOINT_KEY, _limits((5, 10)), None)
+
+    results = await asyncio.gather(
+        *(
+            backend.acquire("europe", ENDPOINT_KEY, 0.0)
+            for _ in range(5)
+            for backend in (first, second)
+        )
+    )
+
+    assert sorted(results)[:5] == [0.0] * 5
+    assert all(wait > 0 for wait in sorted(results)[5:])
+    stats = await second.stats()
+    assert stats["europe"]["app"][0]["used"] == 5
+
+
+async def test_postgres_calibrates_from_reported_counts(postgres_backends):
+    backend, _ = postgres_backends
+
+    await backend.update(
+        "europe", ENDPOINT_KEY, _limits((20, 60), (100, 120), used=3), None
+    )
+    stats = (await backend.stats())["europe"]
+    assert [window["used"] for window in stats["app"]] == [3, 3]
+
+    # Never removes recorded permits Riot has not counted yet
+    await backend.update(
+        "europe", ENDPOINT_KEY, _limits((20, 60), (100, 120), used=1), None
+    )
+    await backend.update("europe", ENDPOINT_KEY, None, _limits((2, 10), used=2))
+
+    stats = (await backend.stats())["europe"]
+    assert [window["used"] for window in stats["app"]] == [3, 3]
+    assert stats["methods"][ENDPOINT_KEY][0]["used"] == 2
+    assert await backend.acquire("europe", ENDPOINT_KEY, 0.0) > 0
+
+
+async def test_postgres_stats_report_usage_and_waits(postgres_backends):
+    backend, _ = postgres_backends
+    await backend.update(
+        "europe", ENDPOINT_KEY, _limits((20, 1), (100, 120)), _limits((2, 10))
+    )
+
+    for _ in range(2):
+        assert await backend.acquire("europe", ENDPOINT_KEY, 0.0) == 0.0
+
+    stats = (await backend.stats())["europe"]
+    app = {window["window"]: window for window in stats["app"]}
+    method = stats["methods"][ENDPOINT_KEY][0]
+    assert app[120]["used"] == 2
+    assert app[120]["remaining"] == 98
+    assert app[120]["next_permit_in"] == 0.0
+    assert method["used"] == 2
+    assert method["remaining"] == 0
+    assert 9.0 < method["next_permit_in"] <= 10.0
+    assert 9.0 < method["reset_in"] <= 10.0
+
+
+async def test_backend_snapshot_restores_into_empty_store(backend_pair, tmp_path: Path):
+    source, _ = backend_pair
+    await source.update("europe", ENDPOINT_KEY, _limits((5, 10)), None)
+    await source.acquire("europe", ENDPOINT_KEY, 0.0)
+    await source.acquire("euw1", "GET:euw1:summoner", 0.0)
+
+    target: RateLimitBackend = SharedMemoryRateLimitBackend(str(tmp_path / "other"))
+    await target.restore(await source.snapshot())
+
+    stats = await target.stats()
+    assert set(stats) == {"europe", "euw1"}
+    assert stats["europe"]["app"][0]["used"] == 1
@@ -0,0 +1,166 @@
+"""Rate limit windows, partitions, backends and priority lanes."""
+
+import asyncio
+
+import pytest
+
+from app.core.riot_api.constants import RequestPriority
+from app.core.riot_api.rate_limiter import (
+    APP_COOLDOWN,
+    LaneTicket,
+    RateLimiter,
+    RateLimitWindow,
+    RoutingPartition,
+    _LaneQueue,
+)
+
+ENDPOINT_KEY = "GET:europe:/lol/match/v5/matches/{matchId}"
+
+
+def _limits(*pairs):
+    """Build (limits, counts) as parsed from headers, with nothing used yet."""
+    return (
+        [{"requests": requests, "window": window} for requests, window in pairs],
+        [{"requests": 0, "window": window} for _, window in pairs],
+    )
+
+
+def test_window_frees_up_when_oldest_permit_expires():
+    window = RateLimitWindow(limit=2, window=10)
+    window.record(100.0)
+    window.record(103.0)
+
+    assert window.next_permit(104.0) == 110.0
+    assert window.next_permit(111.0) == 111.0
+    assert window.used(111.0) == 1
+
+
+def test_window_reserve_lowers_usable_limit():
+    window = RateLimitWindow(limit=10, window=10)
+    for second in range(8):
+        window.record(100.0 + second)
+
+    assert window.usable(0.2) == 8
+    assert window.next_permit(108.0) == 108.0
+    assert window.next_permit(108.0, reserve=0.2) == 110.0
+
+
+def test_window_calibrate_adds_unknown_permits():
+    window = RateLimitWindow(limit=20, window=1)
+    window.record(100.0)
+
+    window.calibrate(reported=5, now=100.5)
+
+    assert window.used(100.5) == 5
+    # Never removes local entries Riot has not counted yet
+    window.calibrate(reported=0, now=100.5)
+    assert window.used(100.5) == 5
+
+
+def test_partition_waits_for_the_tightest_window():
+    partition = RoutingPartition("europe")
+    partition.update(ENDPOINT_KEY, _limits((20, 1), (100, 120)), _limits((2, 10)), 0)
+
+    assert partition.acquire(ENDPOINT_KEY, 100.0, spacing=0.0) == 0.0
+    assert partition.acquire(ENDPOINT_KEY, 100.5, spacing=0.0) == 0.0
+    # Method limit 2:10 is used up, the app limits are not
+    assert partition.acquire(ENDPOINT_KEY, 101.0, spacing=0.0) == pytest.approx(9.0)
+    assert partition.acquire("GET:europe:other", 101.0, spacing=0.0) == 0.0
+
+
+def test_partition_applies_spacing_and_cooldowns():
+    partition = RoutingPartition("europe")
+
+    assert partition.acquire(ENDPOINT_KEY, 100.0, spacing=0.5) == 0.0
+    assert partition.acquire(ENDPOINT_KEY, 100.2, spacing=0.5) == pytest.approx(0.3)
+
+    partition.cooldown(APP_COOLDOWN, 110.0)
+    assert partition.acquire(ENDPOINT_KEY, 101.0, spacing=0.5) == pytest.approx(9.0)
+
+
+async def test_routing_values_do_not_wait_for_each_other():
+    limiter = RateLimiter()
+    europe = "https://europe.api.riotgames.com/lol/match/v5/matches/EUW1_1"
+    euw1 = "https://euw1.api.riotgames.com/lol/summoner/v4/summoners/by-puuid/x"
+    await limiter.update_limits(
+        {"X-App-Rate-Limit": "1:10", "X-App-Rate-Limit-Count": "1:10"}, europe
+    )
+    limiter.request_spacing = 0.0
+
+    blocked = asyncio.create_task(limiter.wait_if_needed(europe))
+    await asyncio.sleep(0.05)
+    await asyncio.wait_for(limiter.wait_if_needed(euw1), timeout=1)
+
+    assert not blocked.done()
+    blocked.cancel()
+
+
+def test_partition_round_trips_through_dict():
+    partition = RoutingPartition("europe")
+    partition.update(ENDPOINT_KEY, _limits((20, 1)), _limits((2, 10)), 100.0)
+    partition.acquire(ENDPOINT_KEY, 100.0, spacing=0.0)
+    partition.cooldown(ENDPOINT_KEY, 200.0)
+
+    restored = RoutingPartition.from_dict("europe", partition.to_dict(100.0))
+
+    assert restored.stats(100.0) == partition.stats(100.0)
+
+
+async def test_lane_queue_serves_higher_lanes_first():
+    queue = _LaneQueue()
+    served = []
+
+    async def caller(name: str, rank: int, sequence: int) -> None:
+        await queue.acquire(lambda: rank, sequence)
+        served.append(name)
+        queue.release()
+
+    await queue.acquire(lambda: 1, sequence=0)
+    callers = [
+        asyncio.create_task(caller("backfill-1", 2, 1)),
+        asyncio.create_task(caller("normal", 1, 2)),
+        asyncio.create_task(caller("backfill-2", 2, 3)),
+        asyncio.create_task(caller("interactive", 0, 4)),
+    ]
+    await asyncio.sleep(0)
+    queue.release()
+    await asyncio.wait_for(asyncio.gather(*callers), timeout=1)
+
+    assert served == ["interactive", "normal", "backfill-1", "backfill-2"]
+
+
+async def test_interactive_reserve_is_left_to_interactive_calls():
+    limiter = RateLimiter(interactive_reserve=0.5)
+    limiter.request_spacing = 0.0
+    url = "https://europe.api.riotgames.com/lol/match/v5/matches/EUW1_1"
+    await limiter.update_limits(
+        {"X-App-Rate-Limit": "2:10", "X-App-Rate-Limit-Count": "1:10"}, url
+    )
+
+    backfill = asyncio.create_task(
+        limiter.wait_if_needed(url, priority=RequestPriority.BACKFILL)
+    )
+    await asyncio.wait_for(
+        limiter.wait_if_needed(url, priority=RequestPriority.INTERACTIVE), timeout=1
+    )
+
+    assert not backfill.done()
+    backfill.cancel()
+
+
+async def test_raised_lane_tries_again_at_once():
+    limiter = RateLimiter(interactive_reserve=0.5)
+    url = "https://euw1.api.riotgames.com/lol/summoner/v4/summoners/by-puuid/x"
+    await limiter.update_limits(
+        {"X-App-Rate-Limit": "2:10", "X-App-Rate-Limit-Count": "1:10"}, url
+    )
+    limiter.request_spacing = 0.0
+    ticket = LaneTicket(RequestPriority.BACKFILL)
+
+    waiting = asyncio.create_task(limiter.wait_if_needed(url, priority=ticket))
+    await asyncio.sleep(0.05)
+    assert not waiting.done()
+
+    # An interactive caller joined: the request may use the reserve now
+    ticket.raise_to(RequestPriority.INTERACTIVE)
+    await asyncio.wait_for(waiting, timeout=1)
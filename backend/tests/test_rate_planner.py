@@ -0,0 +1,110 @@
+"""ETA and capacity estimates of planned Riot API calls."""
+
+import pytest
+
+from app.core.riot_api import rate_planner
+from app.core.riot_api.constants import RequestPriority, RiotRoute
+from app.core.riot_api.rate_limiter import RateLimiter
+
+MATCH_KEY = f"GET:europe:{RiotRoute.MATCH_BY_ID.value}"
+
+
+def _window(limit: int, window: int, used: int = 0, reset_in: float = 0.0) -> dict:
+    return {"limit": limit, "window": window, "used": used, "reset_in": reset_in}
+
+
+def _stats(app=None, methods=None, cooldowns=None) -> dict:
+    return {
+        "europe": {
+            "app": app or [],
+            "methods": methods or {},
+            "cooldowns": cooldowns or {},
+        }
+    }
+
+
+def test_calls_within_free_capacity_do_not_wait():
+    stats = _stats(app=[_window(20, 1), _window(100, 120)])
+
+    plan = rate_planner.estimate(
+        stats, {("europe", RiotRoute.MATCH_BY_ID): 10}, reserve=0.0, spacing=0.0
+    )
+
+    assert plan.eta == 0.0
+    assert plan.calls == 10
+    assert plan.bottleneck is None
+
+
+def test_long_app_window_bounds_the_plan():
+    stats = _stats(app=[_window(20, 1), _window(100, 120, used=50, reset_in=60)])
+
+    plan = rate_planner.estimate(
+        stats, {("europe", RiotRoute.MATCH_BY_ID): 150}, reserve=0.0, spacing=0.0
+    )
+
+    # 50 calls fit, the other 100 need a full window at 100 per 120 s
+    assert plan.eta == pytest.approx(120.0)
+    assert plan.bottleneck == "europe app limit 100:120"
+    assert plan.eta_minutes == 2
+
+
+def test_method_limit_and_cooldown_bound_the_plan():
+    stats = _stats(
+        app=[_window(500, 10)],
+        methods={MATCH_KEY: [_window(2000, 10)]},
+        cooldowns={MATCH_KEY: 30.0},
+    )
+
+    plan = rate_planner.estimate(
+        stats, {("europe", RiotRoute.MATCH_BY_ID): 10}, reserve=0.0, spacing=0.0
+    )
+
+    assert plan.eta == pytest.approx(30.0)
+    assert plan.bottleneck.startswith(MATCH_KEY)
+
+
+def test_request_spacing_bounds_bursts():
+    plan = rate_planner.estimate(
+        _stats(app=[_window(500, 10)]),
+        {("europe", RiotRoute.MATCH_BY_ID): 11},
+        reserve=0.0,
+        spacing=0.5,
+    )
+
+    assert plan.eta == pytest.approx(5.0)
+    assert plan.bottleneck == "europe request spacing"
+
+
+def test_reserve_lowers_free_capacity():
+    stats = _stats(app=[_window(100, 120)])
+    calls = {("europe", RiotRoute.MATCH_BY_ID): 90}
+
+    assert rate_planner.estimate(stats, calls, reserve=0.0, spacing=0.0).eta == 0.0
+    assert rate_planner.estimate(stats, calls, reserve=0.2, spacing=0.0).eta > 0.0
+
+
+async def test_plan_assumes_development_limits_until_learned():
+    limiter = RateLimiter()
+
+    plan = await rate_planner.plan(
+        limiter, {("europe", RiotRoute.MATCH_BY_ID): 200}, RequestPriority.BACKFILL
+    )
+
+    # 100 of the 200 calls fit into the 100:120 window of a development key
+    assert plan.bottleneck == "europe app limit 100:120"
+    assert plan.eta == pytest.approx(120.0)
+
+
+async def test_capacity_fits_units_into_time_budget():
+    limiter = RateLimiter()
+    url = "https://europe.api.riotgames.com/lol/match/v5/matches/EUW1_1"
+    await limiter.update_limits(
+        {"X-App-Rate-Limit": "100:120", "X-App-Rate-Limit-Count": "0:120"}, url
+    )
+    limiter.request_spacing = 0.0
+
+    units = await rate_planner.capacity(
+        limiter, {("europe", RiotRoute.MATCH_BY_ID): 5}, seconds=0.0
+    )
+
+    assert units == 20
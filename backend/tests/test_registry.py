@@ -0,0 +1,62 @@
+"""Shared Riot API clients and the metrics endpoint."""
+
+import httpx
+import pytest
+
+from app.core.riot_api import registry as registry_module
+from app.core.riot_api.registry import RiotClientRegistry
+from app.main import app, settings
+
+
+async def test_new_api_key_retires_clients_of_old_keys(
+    monkeypatch: pytest.MonkeyPatch,
+):
+    monkeypatch.setattr(registry_module, "RETIRE_GRACE", 0.0)
+    registry = RiotClientRegistry()
+    old = await registry.get("RGAPI-old")
+
+    assert await registry.get("RGAPI-old") is old
+    new = await registry.get("RGAPI-new")
+
+    assert registry.clients() == [new]
+    for task in list(registry._retiring):
+        await task
+    assert old.session.is_closed
+    await registry.close()
+    assert new.session.is_closed
+
+
+async def test_closing_registry_closes_retiring_clients():
+    registry = RiotClientRegistry()
+    old = await registry.get("RGAPI-old")
+    await registry.get("RGAPI-new")
+
+    await registry.close()
+
+    assert old.session.is_closed
+    assert not registry._retiring
+
+
+async def _get_metrics(**headers: str) -> httpx.Response:
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as http:
+        return await http.get("/metrics", headers=headers)
+
+
+async def test_metrics_are_off_unless_enabled(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setattr(settings, "metrics_enabled", False)
+
+    assert (await _get_metrics()).status_code == 404
+
+
+async def test_metrics_require_the_configured_token(
+    monkeypatch: pytest.MonkeyPatch,
+):
+    monkeypatch.setattr(settings, "metrics_enabled", True)
+    monkeypatch.setattr(settings, "metrics_token", "scrape-me")
+
+    assert (await _get_metrics()).status_code == 401
+    assert (await _get_metrics(authorization="Bearer wrong")).status_code == 401
+    response = await _get_metrics(authorization="Bearer scrape-me")
+    assert response.status_code == 200
+    assert "player_cache" in response.text
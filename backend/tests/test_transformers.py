@@ -0,0 +1,79 @@
+"""Match transformer: API payloads to rows and stored rows back to DTOs."""
+
+from types import SimpleNamespace
+
+import pytest
+
+from app.core.riot_api.fake_server import FakeRiotDataset
+from app.core.riot_api.models import MatchDTO
+from app.core.riot_api.transformers import MatchTransformer
+
+
+@pytest.fixture
+def match_data(dataset: FakeRiotDataset) -> dict:
+    return next(iter(dataset.matches.values()))
+
+
+def test_transform_match_data_maps_match_and_participants(match_data: dict):
+    transformed = MatchTransformer().transform_match_data(match_data)
+
+    match, participants = transformed["match"], transformed["participants"]
+    raw = match_data["info"]["participants"][0]
+    assert match["match_id"] == match_data["metadata"]["matchId"]
+    assert match["queue_id"] == match_data["info"]["queueId"]
+    assert len(participants) == 10
+    assert participants[0]["puuid"] == raw["puuid"]
+    assert participants[0]["cs"] == (
+        raw["totalMinionsKilled"] + raw["neutralMinionsKilled"]
+    )
+
+
+def test_participant_kda_without_deaths_is_kills_plus_assists():
+    transformer = MatchTransformer()
+
+    assert transformer._calculate_participant_kda(
+        {"kills": 4, "deaths": 0, "assists": 6}
+    ) == pytest.approx(10.0)
+    assert transformer._calculate_participant_kda(
+        {"kills": 4, "deaths": 2, "assists": 6}
+    ) == pytest.approx(5.0)
+
+
+def test_validate_match_data_requires_participant_fields(match_data: dict):
+    transformer = MatchTransformer()
+    assert transformer.validate_match_data(match_data)
+
+    del match_data["info"]["participants"][3]["championId"]
+    assert not transformer.validate_match_data(match_data)
+
+
+def test_to_match_dto_rebuilds_stored_match(match_data: dict):
+    transformer = MatchTransformer()
+    transformed = transformer.transform_match_data(match_data)
+    match = SimpleNamespace(**transformed["match"])
+    participants = [
+        SimpleNamespace(
+            **row,
+            summoner_level=30,
+            riot_id_name=None,
+            riot_id_tagline=None,
+        )
+        for row in transformed["participants"]
+    ]
+
+    dto = transformer.to_match_dto(match, participants)
+
+    assert dto.metadata.match_id == match.match_id
+    assert dto.metadata.participants == [p.puuid for p in participants]
+    assert dto.info.queue_id == match.queue_id
+    assert dto.info.participants[0].total_minions_killed == participants[0].cs
+    assert dto.info.participants[0].neutral_minions_killed == 0
+
+
+def test_match_dto_keeps_every_field_the_transformer_stores(match_data: dict):
+    transformer = MatchTransformer()
+    dumped = MatchDTO.model_validate(match_data).model_dump(by_alias=True, mode="json")
+
+    assert transformer.transform_match_data(dumped) == (
+        transformer.transform_match_data(match_data)
+    )